@@ -16,6 +16,8 @@ from app.config import get_settings
 from app.models import (
     Week, TechPost, Video, PrimaryMarketPost, SecondaryMarketPost,
     MAPost, TipPost, Trend, TeamMember, ApiKey, JobListing, Subscription,
+    SeenArticle, CollectionRun, CollectionArtifact, CollectionRunMetric, PipelineJob,
+    VideoTranscript, LLMSectionCache, CompressionDictionary, FeedState,
 )
 
 # Alembic Config object
@@ -0,0 +1,30 @@
+"""Add content hashes and candidate fingerprints for incremental collection
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("raw_articles", sa.Column("content_hash", sa.String(64), nullable=True))
+    op.create_index("ix_raw_articles_content_hash", "raw_articles", ["content_hash"])
+    op.add_column("weeks", sa.Column("candidates_hash", sa.String(64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("weeks", "candidates_hash")
+    op.drop_index("ix_raw_articles_content_hash", table_name="raw_articles")
+    op.drop_column("raw_articles", "content_hash")
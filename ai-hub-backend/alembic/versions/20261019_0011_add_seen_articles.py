@@ -0,0 +1,46 @@
+"""Add seen_articles cross-period index
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "seen_articles",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("url_hash", sa.String(64), nullable=False),
+        sa.Column("title_hash", sa.String(64), nullable=True),
+        sa.Column("canonical_url", sa.Text(), server_default="", nullable=False),
+        sa.Column("title", sa.Text(), server_default="", nullable=False),
+        sa.Column("first_period_id", sa.String(10), nullable=False),
+        sa.Column("last_period_id", sa.String(10), nullable=False),
+        sa.Column("published_period_id", sa.String(10), nullable=True),
+        sa.Column("section", sa.String(20), nullable=True),
+        sa.Column("relevance", sa.Float(), nullable=True),
+        sa.Column("times_seen", sa.Integer(), server_default="1", nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_seen_articles_url_hash", "seen_articles", ["url_hash"], unique=True)
+    op.create_index("ix_seen_articles_title_hash", "seen_articles", ["title_hash"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_seen_articles_title_hash", table_name="seen_articles")
+    op.drop_index("ix_seen_articles_url_hash", table_name="seen_articles")
+    op.drop_table("seen_articles")
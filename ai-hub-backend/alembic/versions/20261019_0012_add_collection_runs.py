@@ -0,0 +1,56 @@
+"""Add collection_runs and collection_artifacts for resumable collection
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "collection_runs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("period_id", sa.String(10), nullable=False),
+        sa.Column("status", sa.String(20), server_default="running", nullable=False),
+        sa.Column("last_stage", sa.String(50), nullable=True),
+        sa.Column("incremental", sa.Boolean(), server_default="false", nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_collection_runs_period_id", "collection_runs", ["period_id"])
+
+    op.create_table(
+        "collection_artifacts",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("run_id", sa.Integer(), nullable=False),
+        sa.Column("stage", sa.String(50), nullable=False),
+        sa.Column("payload", JSONB(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["run_id"], ["collection_runs.id"], ondelete="CASCADE"),
+        sa.UniqueConstraint("run_id", "stage", name="uq_collection_artifacts_run_stage"),
+    )
+    op.create_index("ix_collection_artifacts_run_id", "collection_artifacts", ["run_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_collection_artifacts_run_id", table_name="collection_artifacts")
+    op.drop_table("collection_artifacts")
+    op.drop_index("ix_collection_runs_period_id", table_name="collection_runs")
+    op.drop_table("collection_runs")
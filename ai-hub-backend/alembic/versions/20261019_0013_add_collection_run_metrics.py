@@ -0,0 +1,46 @@
+"""Add collection_run_metrics for per-stage pipeline spans
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision: str = "0013"
+down_revision: Union[str, None] = "0012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "collection_run_metrics",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("run_id", sa.Integer(), nullable=False),
+        sa.Column("stage", sa.String(100), nullable=True),
+        sa.Column("kind", sa.String(20), nullable=False),
+        sa.Column("name", sa.String(200), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=False),
+        sa.Column("duration_ms", sa.Float(), nullable=False),
+        sa.Column("items", sa.Integer(), nullable=True),
+        sa.Column("status", sa.String(10), server_default="ok", nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("attrs", JSONB(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["run_id"], ["collection_runs.id"], ondelete="CASCADE"),
+    )
+    op.create_index("ix_collection_run_metrics_run_id", "collection_run_metrics", ["run_id"])
+    op.create_index("ix_collection_run_metrics_kind_name", "collection_run_metrics", ["kind", "name"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_collection_run_metrics_kind_name", table_name="collection_run_metrics")
+    op.drop_index("ix_collection_run_metrics_run_id", table_name="collection_run_metrics")
+    op.drop_table("collection_run_metrics")
@@ -0,0 +1,50 @@
+"""Add pipeline_jobs queue for distributed collection workers
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision: str = "0014"
+down_revision: Union[str, None] = "0013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pipeline_jobs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("job_type", sa.String(20), nullable=False),
+        sa.Column("payload", JSONB(), nullable=True),
+        sa.Column("status", sa.String(20), server_default="queued", nullable=False),
+        sa.Column("priority", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("max_attempts", sa.Integer(), server_default="3", nullable=False),
+        sa.Column("run_after", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("worker_id", sa.String(100), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(), nullable=True),
+        sa.Column("result", JSONB(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("parent_id", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_pipeline_jobs_job_type", "pipeline_jobs", ["job_type"])
+    op.create_index("ix_pipeline_jobs_claim", "pipeline_jobs", ["status", "priority", "run_after"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pipeline_jobs_claim", table_name="pipeline_jobs")
+    op.drop_index("ix_pipeline_jobs_job_type", table_name="pipeline_jobs")
+    op.drop_table("pipeline_jobs")
@@ -0,0 +1,32 @@
+"""Add video_transcripts cache
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0015"
+down_revision: Union[str, None] = "0014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "video_transcripts",
+        sa.Column("video_id", sa.String(20), nullable=False),
+        sa.Column("transcript", sa.Text(), nullable=True),
+        sa.Column("fetched_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("video_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("video_transcripts")
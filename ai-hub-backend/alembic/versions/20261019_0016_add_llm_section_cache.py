@@ -0,0 +1,40 @@
+"""Add llm_section_cache for content-addressed section results
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision: str = "0016"
+down_revision: Union[str, None] = "0015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_section_cache",
+        sa.Column("key", sa.String(64), nullable=False),
+        sa.Column("section", sa.String(20), nullable=False),
+        sa.Column("model", sa.String(100), nullable=False),
+        sa.Column("prompt_version", sa.Integer(), nullable=False),
+        sa.Column("result", JSONB(), nullable=False),
+        sa.Column("hits", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("last_used_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index("ix_llm_section_cache_last_used_at", "llm_section_cache", ["last_used_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_llm_section_cache_last_used_at", table_name="llm_section_cache")
+    op.drop_table("llm_section_cache")
@@ -0,0 +1,140 @@
+"""Store raw summaries, descriptions and transcripts as zstd bytea
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-19
+
+Existing rows are rewritten in batches. If there are enough samples, a
+shared dictionary is trained first and stored in compression_dictionaries;
+if training fails, rows are compressed without a dictionary.
+Video descriptions and transcripts are removed from raw_videos.raw_data,
+which duplicated them.
+"""
+
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import zstandard as zstd
+
+# revision identifiers, used by Alembic.
+revision: str = "0017"
+down_revision: Union[str, None] = "0016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+BATCH_SIZE = 1000
+LEVEL = 9
+DICT_SIZE = 65536
+SAMPLE_LIMIT = 5000
+
+# table -> [(column, nullable)]
+COLUMNS = {
+    "raw_articles": [("summary", False)],
+    "raw_videos": [("description", True), ("transcript", True)],
+}
+
+
+def _rewrite(conn, table: str, column: str, target: str, convert) -> None:
+    """Fill `target` from `column` through `convert`, batching by id."""
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.text(f"SELECT id, {column} FROM {table} WHERE id > :last ORDER BY id LIMIT :n"),
+            {"last": last_id, "n": BATCH_SIZE},
+        ).all()
+        if not rows:
+            return
+        updates = [{"id": row_id, "v": convert(value)} for row_id, value in rows if value is not None]
+        if updates:
+            conn.execute(sa.text(f"UPDATE {table} SET {target} = :v WHERE id = :id"), updates)
+        last_id = rows[-1][0]
+
+
+def _swap(table: str, column: str, nullable: bool) -> None:
+    """Replace `column` with the rewritten `<column>_new`."""
+    op.drop_column(table, column)
+    op.alter_column(table, f"{column}_new", new_column_name=column, nullable=nullable)
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    op.create_table(
+        "compression_dictionaries",
+        sa.Column("id", sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("samples", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    samples = [
+        value.encode("utf-8")
+        for (value,) in conn.execute(sa.text(
+            "SELECT summary FROM raw_articles WHERE summary <> '' ORDER BY random() LIMIT :n"
+        ), {"n": SAMPLE_LIMIT})
+    ] + [
+        value.encode("utf-8")
+        for (value,) in conn.execute(sa.text(
+            "SELECT description FROM raw_videos WHERE coalesce(description, '') <> '' ORDER BY random() LIMIT :n"
+        ), {"n": SAMPLE_LIMIT // 5})
+    ]
+    compressor = zstd.ZstdCompressor(level=LEVEL)
+    dictionary = None
+    if len(samples) >= 100:
+        try:
+            dictionary = zstd.train_dictionary(DICT_SIZE, samples)
+        except zstd.ZstdError as e:
+            # Small or near-identical sample sets can fail to train
+            logger.warning(f"Could not train a compression dictionary on {len(samples)} samples, "
+                           f"compressing without one: {e}")
+    if dictionary is not None:
+        conn.execute(
+            sa.text("INSERT INTO compression_dictionaries (id, data, samples) VALUES (:id, :data, :samples)"),
+            {"id": dictionary.dict_id(), "data": dictionary.as_bytes(), "samples": len(samples)},
+        )
+        compressor = zstd.ZstdCompressor(level=LEVEL, dict_data=dictionary)
+
+    for table, columns in COLUMNS.items():
+        for column, nullable in columns:
+            op.add_column(table, sa.Column(f"{column}_new", sa.LargeBinary(), nullable=True))
+            _rewrite(conn, table, column, f"{column}_new", lambda v: compressor.compress(v.encode("utf-8")))
+            _swap(table, column, nullable)
+
+    op.execute(
+        "UPDATE raw_videos SET raw_data = raw_data - 'description' - 'transcript' WHERE raw_data IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    dictionaries = {
+        dict_id: zstd.ZstdCompressionDict(bytes(data))
+        for dict_id, data in conn.execute(sa.text("SELECT id, data FROM compression_dictionaries"))
+    }
+
+    def decompress(data) -> str:
+        data = bytes(data)
+        dict_id = zstd.get_frame_parameters(data).dict_id
+        if dict_id:
+            decompressor = zstd.ZstdDecompressor(dict_data=dictionaries[dict_id])
+        else:
+            decompressor = zstd.ZstdDecompressor()
+        return decompressor.decompress(data).decode("utf-8")
+
+    for table, columns in COLUMNS.items():
+        for column, nullable in columns:
+            op.add_column(table, sa.Column(f"{column}_new", sa.Text(), nullable=True))
+            _rewrite(conn, table, column, f"{column}_new", decompress)
+            _swap(table, column, nullable)
+
+    op.execute(
+        "UPDATE raw_videos SET raw_data = raw_data "
+        "|| jsonb_build_object('description', description, 'transcript', transcript) "
+        "WHERE raw_data IS NOT NULL"
+    )
+    op.drop_table("compression_dictionaries")
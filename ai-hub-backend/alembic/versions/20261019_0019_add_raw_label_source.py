@@ -0,0 +1,27 @@
+"""Add raw_articles.label_source
+
+Revision ID: 0019
+Revises: 0018
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0019"
+down_revision: Union[str, None] = "0018"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows stay NULL: their label source is unknown, so they are not used for training
+    op.add_column("raw_articles", sa.Column("label_source", sa.String(20), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("raw_articles", "label_source")
@@ -42,11 +42,20 @@ class Settings(BaseSettings):
         "https://ai-information-hub.vercel.app",
     ]
 
+    # Upstream endpoints (overridable for local stubs, e.g. benchmarks/)
+    openrouter_base_url: str = "https://openrouter.ai/api/v1"
+    hn_api_base_url: str = "https://hn.algolia.com/api/v1"
+    sources_file: str = ""  # RSS sources YAML; default: sources.yaml in the backend root
+
     # Collection settings
     hn_min_points: int = 100
     hn_days: int = 1
     hn_limit: int = 50
     youtube_max_results: int = 10
+    transcript_limit: int = 15  # Videos per run that get a transcript
+    transcript_max_workers: int = 4
+    transcript_cache_enabled: bool = True
+    transcript_negative_ttl_hours: int = 72  # Retry videos without a transcript after this long
 
     # Output counts
     tech_output_count: int = 10
@@ -54,11 +63,118 @@ class Settings(BaseSettings):
     investment_output_count: int = 5
     video_output_count: int = 2
 
+    # Local pre-ranking: stage 3 prompts get the best candidates that fit these budgets
+    prerank_enabled: bool = True
+    prerank_tech_token_budget: int = 4500
+    prerank_investment_token_budget: int = 4500
+    prerank_tips_token_budget: int = 900
+    prerank_videos_token_budget: int = 1500
+
+    # Map-reduce selection: pools too large for the final prompt are pre-selected in parallel batches
+    map_reduce_enabled: bool = True
+    map_reduce_batch_token_budget: int = 6000
+    map_reduce_max_workers: int = 4
+
+    # Stage 2 classification: prompt chunks of this many tokens, classified concurrently
+    classify_chunk_token_budget: int = 3000
+    classify_max_workers: int = 4
+
+    # Local classifier (scripts/train_classifier.py); uncertain articles still go to the LLM
+    local_classifier_enabled: bool = False  # Needs a trained artifact, see README
+    local_classifier_path: str = ""  # default: models/article_classifier.npz in the backend root
+    local_classifier_threshold: float = 0.85
+    local_classifier_audit_rate: float = 0.05  # Confident articles also sent to the LLM to measure agreement
+
+    # Near-duplicate clustering before classification (MinHash + LSH banding)
+    near_dup_enabled: bool = True
+    near_dup_threshold: float = 0.5  # Estimated Jaccard similarity of title/summary shingles
+    near_dup_num_perm: int = 64
+    near_dup_bands: int = 16
+
+    # Trends: extracted locally from the period's posts against earlier periods
+    local_trends_enabled: bool = True  # false: one LLM trends call after stage 3 instead
+    trends_count: int = 10
+    trends_background_periods: int = 8
+    trends_llm_polish: bool = False  # One free-model call to rewrite the extracted phrases as titles
+
+    # Weekly rollup from daily periods (posts kept per section)
+    weekly_rollup_after_daily: bool = False  # daily_collect refreshes the parent week afterwards (or --rollup)
+    rollup_llm_trends: bool = False  # One LLM call for trends instead of merging daily trends
+    rollup_tech_count: int = 20
+    rollup_video_count: int = 4
+    rollup_investment_count: int = 10
+    rollup_tips_count: int = 10
+
+    # Seen-article index (cross-period label reuse)
+    seen_index_enabled: bool = True
+    seen_skip_published: bool = False  # Drop stories already published in an earlier period
+    seen_published_relevance_factor: float = 0.5  # Otherwise scale their relevance by this factor
+
+    # Streaming stage 1 -> 2 pipeline
+    stream_pipeline_enabled: bool = True
+    stream_queue_maxsize: int = 32  # Max fetched batches waiting for the consumer
+    stream_classify_batch_size: int = 40  # New articles per classification batch
+    stream_classify_workers: int = 2
+
+    # Raw article batches at least this large are written with COPY (0 disables)
+    raw_copy_threshold: int = 2000
+
+    # zstd storage of raw summaries/descriptions/transcripts (dictionary: scripts/compress_raw.py)
+    raw_compression_level: int = 9
+    raw_compression_dict_size: int = 65536
+
+    # Prometheus /metrics: "Authorization: Bearer <token>" or the admin X-API-Key
+    metrics_token: str = ""
+    metrics_public: bool = False  # Serve /metrics without authentication
+
+    # Record/replay of outbound HTTP and LLM calls ("off", "record" or "replay")
+    cassette_mode: str = "off"
+    cassette_path: str = ""  # e.g. cassettes/2026-10-19.json.gz
+    cassette_latency_ms: float = 0.0  # Fixed delay added to every replayed call
+    cassette_latency_scale: float = 0.0  # Plus this fraction of the recorded latency (1.0 = as recorded)
+
     # Thread pool and timeout settings
-    rss_max_workers: int = 8
+    rss_max_workers: int = 16  # Concurrent feed requests (async fetcher, all hosts)
     hn_max_workers: int = 8
     hn_enhance_max_workers: int = 6
     llm_max_workers: int = 4
+    translation_max_workers: int = 3  # Free translation models are rate limited
+
+    # Budget shared by all LLM calls of the process, across periods (0 = unlimited)
+    llm_global_max_concurrent: int = 0
+    llm_global_requests_per_minute: float = 0.0
+
+    # Content-addressed cache of section results (tech, investment, tips, videos)
+    llm_cache_enabled: bool = True
+    llm_cache_max_entries: int = 2000  # Least recently used entries are evicted beyond this
+    llm_cache_max_age_days: int = 30  # Entries unused this long are evicted
+
+    # Multi-period backfill (scripts/backfill_periods.py)
+    backfill_parallel_periods: int = 3
+    backfill_llm_max_concurrent: int = 8
+    backfill_llm_requests_per_minute: float = 0.0
+    backfill_progress_interval_seconds: int = 60
+
+    # Pipeline job queue (scripts/worker.py)
+    job_max_attempts: int = 3
+    job_retry_base_seconds: int = 60  # Backoff doubles per attempt
+    job_retry_max_seconds: int = 3600
+    job_heartbeat_seconds: int = 30
+    job_stale_after_seconds: int = 300  # Running jobs without a heartbeat this long are requeued
+    job_poll_interval_seconds: float = 5.0
+
+    # Collection runs: heartbeat of a running run; "running" runs silent this long can be resumed
+    collection_heartbeat_seconds: int = 30
+    collection_stale_after_seconds: int = 300
+
+    # RSS conditional GET: ETag/Last-Modified stored in feed_state, a 304 reuses the stored entries
+    rss_conditional_get_enabled: bool = True
+
+    # Async RSS fetcher: per-host request limit, delay between request starts to one host, parse threads
+    rss_per_host_limit: int = 2
+    rss_host_delay_seconds: float = 0.5
+    rss_parse_workers: int = 4
+    rss_http2_enabled: bool = True
 
     # HTTP timeouts (seconds)
     rss_request_timeout_seconds: int = 20
@@ -2,6 +2,7 @@
 SQLAlchemy models for the AI Hub database.
 """
 
+from app.models.compression import CompressionDictionary
 from app.models.week import Week
 from app.models.tech import TechPost
 from app.models.video import Video
@@ -12,6 +13,12 @@ from app.models.raw import RawArticle, RawVideo
 from app.models.developer import ApiKey
 from app.models.job import JobListing
 from app.models.subscription import Subscription
+from app.models.seen import SeenArticle
+from app.models.collection import CollectionRun, CollectionArtifact, CollectionRunMetric
+from app.models.pipeline_job import PipelineJob
+from app.models.transcript import VideoTranscript
+from app.models.llm_cache import LLMSectionCache
+from app.models.feed_state import FeedState
 
 __all__ = [
     "Week",
@@ -28,4 +35,13 @@ __all__ = [
     "ApiKey",
     "JobListing",
     "Subscription",
+    "SeenArticle",
+    "CollectionRun",
+    "CollectionArtifact",
+    "CollectionRunMetric",
+    "PipelineJob",
+    "VideoTranscript",
+    "LLMSectionCache",
+    "CompressionDictionary",
+    "FeedState",
 ]
@@ -0,0 +1,75 @@
+"""
+Collection run tracking, per-stage checkpoint artifacts and run metrics.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, Text, Integer, Float, Boolean, DateTime, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class CollectionRun(Base):
+    """A single execution of the collection pipeline for one period."""
+
+    __tablename__ = "collection_runs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    period_id: Mapped[str] = mapped_column(String(10), nullable=False, index=True)
+    status: Mapped[str] = mapped_column(String(20), default="running", nullable=False)  # running, completed, failed, interrupted
+    last_stage: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # Last checkpointed stage
+    incremental: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    started_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(  # Heartbeat while running (see checkpoints.RunHeartbeat)
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<CollectionRun {self.id} period={self.period_id} status={self.status}>"
+
+
+class CollectionArtifact(Base):
+    """Output of one completed pipeline stage, used to resume a failed run."""
+
+    __tablename__ = "collection_artifacts"
+    __table_args__ = (UniqueConstraint("run_id", "stage", name="uq_collection_artifacts_run_stage"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    run_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("collection_runs.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    stage: Mapped[str] = mapped_column(String(50), nullable=False)  # fetch, classify, process:<section>, translate:<task>:<lang>, ...
+    payload: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<CollectionArtifact run={self.run_id} stage={self.stage}>"
+
+
+class CollectionRunMetric(Base):
+    """A timed span (stage or sub-task) recorded during a collection run."""
+
+    __tablename__ = "collection_run_metrics"
+    __table_args__ = (Index("ix_collection_run_metrics_kind_name", "kind", "name"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    run_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("collection_runs.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    stage: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)  # Enclosing pipeline stage/node
+    kind: Mapped[str] = mapped_column(String(20), nullable=False)  # stage, feed, hn_query, llm_call, translation, ...
+    name: Mapped[str] = mapped_column(String(200), nullable=False)  # Feed name, model, query, node name
+    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    duration_ms: Mapped[float] = mapped_column(Float, nullable=False)
+    items: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    status: Mapped[str] = mapped_column(String(10), default="ok", nullable=False)  # ok, error
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    attrs: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)  # Model attempt, token usage, ...
+
+    def __repr__(self) -> str:
+        return f"<CollectionRunMetric run={self.run_id} {self.kind}:{self.name} {self.duration_ms:.0f}ms>"
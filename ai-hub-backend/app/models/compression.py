@@ -0,0 +1,47 @@
+"""
+Compressed text columns and their shared zstd dictionaries.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Integer, BigInteger, LargeBinary, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
+
+from app.database import Base
+
+
+class CompressedText(TypeDecorator):
+    """
+    Text stored as a zstd frame in a bytea column.
+
+    Reads and writes plain strings; compression happens on bind and result
+    processing (see app/services/compression.py), so callers never see bytes.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        from app.services.compression import compress_text
+
+        return compress_text(value)
+
+    def process_result_value(self, value, dialect):
+        from app.services.compression import decompress_text
+
+        return decompress_text(value)
+
+
+class CompressionDictionary(Base):
+    """A trained zstd dictionary; frames reference it by its dictionary ID."""
+
+    __tablename__ = "compression_dictionaries"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=False)  # zstd dict_id
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    samples: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<CompressionDictionary {self.id} ({len(self.data)} bytes)>"
@@ -0,0 +1,30 @@
+"""
+HTTP validators and last parsed entries of RSS/Atom feeds, for conditional GETs.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Integer, Text, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class FeedState(Base):
+    """ETag/Last-Modified of a feed URL and the entries parsed from its last full response."""
+
+    __tablename__ = "feed_state"
+
+    url: Mapped[str] = mapped_column(Text, primary_key=True)
+    etag: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    last_modified: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    last_status: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # 200, 304 or the error status
+    # All entries of the last 200 response (no age cutoff), reused as-is on a 304
+    last_items: Mapped[list] = mapped_column(JSONB, nullable=False, default=list)
+    modified_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    checked_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<FeedState {self.url} status={self.last_status} items={len(self.last_items or [])}>"
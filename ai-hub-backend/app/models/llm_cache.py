@@ -0,0 +1,29 @@
+"""
+Cached LLM section outputs, keyed by a hash of everything that determines them.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import String, Integer, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class LLMSectionCache(Base):
+    """Parsed result of one section prompt (tech, investment, tips, videos)."""
+
+    __tablename__ = "llm_section_cache"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)  # sha256, see llm_cache.cache_key()
+    section: Mapped[str] = mapped_column(String(20), nullable=False)
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+    prompt_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    result: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    hits: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    last_used_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f"<LLMSectionCache {self.section} {self.key[:12]} hits={self.hits}>"
@@ -0,0 +1,42 @@
+"""
+Durable queue of pipeline jobs consumed by worker processes.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, Text, Integer, DateTime, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class PipelineJob(Base):
+    """A unit of pipeline work (fetch, process, translate, backfill, newsletter)."""
+
+    __tablename__ = "pipeline_jobs"
+    __table_args__ = (
+        # Claim query: queued jobs that are due, best priority first
+        Index("ix_pipeline_jobs_claim", "status", "priority", "run_after"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    job_type: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
+    payload: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)  # {"period_id": ..., ...}
+    status: Mapped[str] = mapped_column(String(20), default="queued", nullable=False)  # queued, running, completed, failed, cancelled
+    priority: Mapped[int] = mapped_column(Integer, default=0, nullable=False)  # Higher runs first
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    max_attempts: Mapped[int] = mapped_column(Integer, default=3, nullable=False)
+    run_after: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)  # Retry backoff
+    worker_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    result: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    parent_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # Job that enqueued this one
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<PipelineJob {self.id} {self.job_type} status={self.status}>"
@@ -10,6 +10,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
+from app.models.compression import CompressedText
 
 
 class RawArticle(Base):
@@ -22,12 +23,15 @@ class RawArticle(Base):
     source: Mapped[str] = mapped_column(String(200), nullable=False)  # "Hacker News", "MIT Technology Review", etc.
     title: Mapped[str] = mapped_column(Text, nullable=False)
     link: Mapped[str] = mapped_column(Text, nullable=False)
-    summary: Mapped[str] = mapped_column(Text, nullable=False)
+    summary: Mapped[str] = mapped_column(CompressedText, nullable=False)  # zstd, often full HTML
     published: Mapped[str] = mapped_column(String(30), nullable=False)
     original_section: Mapped[str] = mapped_column(String(20), nullable=False)  # "tech", "investment", "tips"
     section: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)  # LLM classified section
     relevance: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # LLM relevance score
+    # Who set section/relevance: "llm", "local", "seen", "rule" (tips), "duplicate" or "hint"
+    label_source: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     raw_data: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)  # Original data (HN points, comments, etc.)
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, index=True)  # Canonical URL/title hash
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
 
     def __repr__(self) -> str:
@@ -45,16 +49,22 @@ class RawVideo(Base):
     title: Mapped[str] = mapped_column(Text, nullable=False)
     channel_name: Mapped[str] = mapped_column(String(200), nullable=False)
     channel_id: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
-    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    transcript: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    description: Mapped[Optional[str]] = mapped_column(CompressedText, nullable=True)
+    # Deferred: only stage 4 needs transcripts, stage 3 loads stay small
+    transcript: Mapped[Optional[str]] = mapped_column(CompressedText, nullable=True, deferred=True)
     thumbnail_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     published_at: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)
     duration_seconds: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     duration_formatted: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     view_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     like_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
-    raw_data: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)  # Full original data
+    raw_data: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)  # Original data minus description/transcript
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
 
+    @property
+    def video_data(self) -> dict:
+        """Fetcher dict for LLM processing (description re-attached, transcript left out)."""
+        return {**(self.raw_data or {}), "description": self.description}
+
     def __repr__(self) -> str:
         return f"<RawVideo {self.video_id}: {self.title[:50]}>"
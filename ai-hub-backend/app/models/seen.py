@@ -0,0 +1,41 @@
+"""
+Cross-period index of articles already fetched, classified or published.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, Text, Integer, Float, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class SeenArticle(Base):
+    """An article seen by the collector in some period, keyed by content hash."""
+
+    __tablename__ = "seen_articles"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    url_hash: Mapped[str] = mapped_column(String(64), unique=True, index=True, nullable=False)  # content_hash()
+    title_hash: Mapped[Optional[str]] = mapped_column(String(64), index=True, nullable=True)
+    canonical_url: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    title: Mapped[str] = mapped_column(Text, nullable=False, default="")
+
+    # Periods are plain IDs (no FK) so the index survives period deletion
+    first_period_id: Mapped[str] = mapped_column(String(10), nullable=False)
+    last_period_id: Mapped[str] = mapped_column(String(10), nullable=False)
+    published_period_id: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+
+    # Stored classification labels
+    section: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    relevance: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+    times_seen: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<SeenArticle {self.url_hash[:12]} first={self.first_period_id}>"
@@ -0,0 +1,24 @@
+"""
+Cache of YouTube transcripts, shared across periods.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, Text, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class VideoTranscript(Base):
+    """Transcript of a video, or the fact that none was available (transcript is NULL)."""
+
+    __tablename__ = "video_transcripts"
+
+    video_id: Mapped[str] = mapped_column(String(20), primary_key=True)
+    transcript: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # NULL = no transcript (negative entry)
+    fetched_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<VideoTranscript {self.video_id} {'ok' if self.transcript else 'none'}>"
@@ -27,6 +27,8 @@ class Week(Base):
     parent_week_id: Mapped[Optional[str]] = mapped_column(
         String(10), ForeignKey("weeks.id"), nullable=True
     )
+    # Fingerprint of the classified candidate set last processed by stage 3
+    candidates_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
 
     def __repr__(self) -> str:
         return f"<Week {self.id}>"
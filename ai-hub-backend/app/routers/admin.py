@@ -40,14 +40,18 @@ def _resolve_period_id(week_id: Optional[str], period_id: Optional[str]) -> Opti
     return week_id or period_id
 
 
-def _run_collection_with_new_session(week_id: Optional[str] = None):
+def _run_collection_with_new_session(
+    week_id: Optional[str] = None, incremental: bool = False, bypass_cache: bool = False,
+):
     """Background task wrapper that creates its own database session."""
     from app.services.collector import run_collection
+    from app.services.llm_cache import bypass
 
     db = get_session_local()()
     try:
         logger.info(f"Starting background collection for {week_id or 'current week'}")
-        run_collection(db, week_id)
+        with bypass(bypass_cache):
+            run_collection(db, week_id, incremental=incremental)
         logger.info(f"Background collection completed for {week_id or 'current week'}")
     except Exception as e:
         logger.error(f"Background collection failed: {e}")
@@ -120,6 +124,8 @@ async def trigger_collection(
     week_id: Optional[str] = None,
     period_id: Optional[str] = None,
     wait: bool = False,
+    incremental: bool = False,
+    bypass_cache: bool = False,
     db: Session = Depends(get_db),
     _: bool = Depends(verify_api_key),
 ):
@@ -132,15 +138,21 @@ async def trigger_collection(
     - Stage 3: Parallel LLM processing
     - Stage 4: Save to database
 
+    Set incremental=true to keep existing raw data, add only new items and
+    skip stages 3-4 when the candidate set is unchanged. Set
+    bypass_cache=true to ignore cached section results.
+
     Requires X-API-Key header.
     """
     resolved_period = _resolve_period_id(week_id, period_id)
 
     if wait:
         from app.services.collector import run_collection
+        from app.services.llm_cache import bypass
 
         try:
-            run_collection(db, resolved_period)
+            with bypass(bypass_cache):
+                run_collection(db, resolved_period, incremental=incremental)
         except Exception as e:
             logger.error(f"Synchronous collection failed: {e}")
             raise HTTPException(status_code=500, detail=f"Collection failed: {str(e)}")
@@ -152,11 +164,12 @@ async def trigger_collection(
         }
 
     # Run collection in background with its own session
-    background_tasks.add_task(_run_collection_with_new_session, resolved_period)
+    background_tasks.add_task(_run_collection_with_new_session, resolved_period, incremental, bypass_cache)
 
     return {
         "status": "started",
         "week_id": resolved_period or "current",
+        "incremental": incremental,
         "message": "Full collection started in background (fetch + process)",
     }
 
@@ -184,14 +197,14 @@ async def trigger_ma_collection(
     }
 
 
-def _run_fetch_only_with_new_session(week_id: Optional[str] = None):
+def _run_fetch_only_with_new_session(week_id: Optional[str] = None, incremental: bool = False):
     """Background task wrapper that creates its own database session."""
     from app.services.collector import run_fetch_only
 
     db = get_session_local()()
     try:
         logger.info(f"Starting background fetch for {week_id or 'current week'}")
-        run_fetch_only(db, week_id)
+        run_fetch_only(db, week_id, incremental=incremental)
         logger.info(f"Background fetch completed for {week_id or 'current week'}")
     except Exception as e:
         logger.error(f"Background fetch failed: {e}")
@@ -205,6 +218,7 @@ async def trigger_fetch_only(
     background_tasks: BackgroundTasks,
     week_id: Optional[str] = None,
     period_id: Optional[str] = None,
+    incremental: bool = False,
     _: bool = Depends(verify_api_key),
 ):
     """
@@ -212,13 +226,14 @@ async def trigger_fetch_only(
 
     Use this to collect raw data without LLM processing.
     Useful for debugging or when you want to process later.
+    Set incremental=true to keep existing raw rows and add only new items.
 
     Requires X-API-Key header.
     """
     resolved_period = _resolve_period_id(week_id, period_id)
 
     # Run fetch in background with its own session
-    background_tasks.add_task(_run_fetch_only_with_new_session, resolved_period)
+    background_tasks.add_task(_run_fetch_only_with_new_session, resolved_period, incremental)
 
     return {
         "status": "started",
@@ -227,14 +242,16 @@ async def trigger_fetch_only(
     }
 
 
-def _run_process_only_with_new_session(week_id: Optional[str] = None):
+def _run_process_only_with_new_session(week_id: Optional[str] = None, bypass_cache: bool = False):
     """Background task wrapper that creates its own database session."""
     from app.services.collector import run_process_only
+    from app.services.llm_cache import bypass
 
     db = get_session_local()()
     try:
         logger.info(f"Starting background processing for {week_id or 'current week'}")
-        run_process_only(db, week_id)
+        with bypass(bypass_cache):
+            run_process_only(db, week_id)
         logger.info(f"Background processing completed for {week_id or 'current week'}")
     except Exception as e:
         logger.error(f"Background processing failed: {e}")
@@ -248,20 +265,22 @@ async def trigger_process_only(
     background_tasks: BackgroundTasks,
     week_id: Optional[str] = None,
     period_id: Optional[str] = None,
+    bypass_cache: bool = False,
     _: bool = Depends(verify_api_key),
 ):
     """
     Trigger Stages 2-4: Process existing raw data.
 
     Requires raw data to exist (run /collect/fetch first).
-    Use this to reprocess data after LLM improvements.
+    Use this to reprocess data after LLM improvements. Section results for
+    unchanged inputs come from the LLM cache unless bypass_cache=true.
 
     Requires X-API-Key header.
     """
     resolved_period = _resolve_period_id(week_id, period_id)
 
     # Run processing in background with its own session
-    background_tasks.add_task(_run_process_only_with_new_session, resolved_period)
+    background_tasks.add_task(_run_process_only_with_new_session, resolved_period, bypass_cache)
 
     return {
         "status": "started",
@@ -270,6 +289,330 @@ async def trigger_process_only(
     }
 
 
+def _run_resume_with_new_session(week_id: Optional[str] = None, run_id: Optional[int] = None):
+    """Background task wrapper that creates its own database session."""
+    from app.services.collector import run_collection
+
+    db = get_session_local()()
+    try:
+        logger.info(f"Resuming background collection for {week_id or run_id or 'latest run'}")
+        run_collection(db, week_id, resume=True, run_id=run_id)
+        logger.info(f"Resumed collection completed for {week_id or run_id or 'latest run'}")
+    except Exception as e:
+        logger.error(f"Resumed collection failed: {e}")
+        raise
+    finally:
+        db.close()
+
+
+@router.post("/collect/resume")
+async def trigger_resume(
+    background_tasks: BackgroundTasks,
+    week_id: Optional[str] = None,
+    period_id: Optional[str] = None,
+    run_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    _: bool = Depends(verify_api_key),
+):
+    """
+    Resume a failed or interrupted collection run from its last checkpoint.
+
+    Picks the latest failed or interrupted run for the period (or the given
+    run_id); a run still marked running is only resumed once its heartbeat
+    is stale (409 otherwise). Stages with a stored checkpoint are skipped,
+    so no LLM work is repeated.
+
+    Requires X-API-Key header.
+    """
+    from app.services.checkpoints import find_active_run, find_resumable_run, completed_stages
+
+    resolved_period = _resolve_period_id(week_id, period_id)
+    run = find_resumable_run(db, period_id=resolved_period, run_id=run_id)
+    if not run:
+        active = find_active_run(db, period_id=resolved_period, run_id=run_id)
+        if active:
+            raise HTTPException(status_code=409, detail=f"Collection run {active.id} is still running")
+        raise HTTPException(status_code=404, detail="No unfinished collection run to resume")
+
+    background_tasks.add_task(_run_resume_with_new_session, run.period_id, run.id)
+
+    return {
+        "status": "started",
+        "run_id": run.id,
+        "week_id": run.period_id,
+        "completed_stages": sorted(completed_stages(db, run)),
+        "message": "Resuming collection in background",
+    }
+
+
+@router.get("/runs")
+async def list_collection_runs(
+    week_id: Optional[str] = None,
+    period_id: Optional[str] = None,
+    limit: int = 20,
+    db: Session = Depends(get_db),
+    _: bool = Depends(verify_api_key),
+):
+    """
+    List recent collection runs with their checkpoint status.
+
+    Requires X-API-Key header.
+    """
+    from app.models import CollectionRun
+
+    resolved_period = _resolve_period_id(week_id, period_id)
+    query = db.query(CollectionRun)
+    if resolved_period:
+        query = query.filter(CollectionRun.period_id == resolved_period)
+    runs = query.order_by(CollectionRun.started_at.desc()).limit(min(limit, 100)).all()
+
+    return [
+        {
+            "id": r.id,
+            "periodId": r.period_id,
+            "status": r.status,
+            "lastStage": r.last_stage,
+            "incremental": r.incremental,
+            "error": r.error,
+            "startedAt": r.started_at.isoformat() if r.started_at else None,
+            "finishedAt": r.finished_at.isoformat() if r.finished_at else None,
+            "durationSeconds": (
+                round((r.finished_at - r.started_at).total_seconds(), 1)
+                if r.finished_at and r.started_at else None
+            ),
+        }
+        for r in runs
+    ]
+
+
+@router.get("/runs/{run_id}/metrics")
+async def get_collection_run_metrics(
+    run_id: int,
+    raw: bool = False,
+    db: Session = Depends(get_db),
+    _: bool = Depends(verify_api_key),
+):
+    """
+    Timing metrics of a collection run.
+
+    By default spans are aggregated per stage, kind (stage, feed, hn_query,
+    llm_call, translation, ...) and name, slowest first. Set raw=true to get
+    every recorded span.
+
+    Requires X-API-Key header.
+    """
+    from app.models import CollectionRun, CollectionRunMetric
+    from app.services.metrics import summarize_run_metrics
+
+    run = db.query(CollectionRun).filter(CollectionRun.id == run_id).first()
+    if not run:
+        raise HTTPException(status_code=404, detail=f"Collection run {run_id} not found")
+
+    if raw:
+        spans = db.query(CollectionRunMetric).filter(
+            CollectionRunMetric.run_id == run_id,
+        ).order_by(CollectionRunMetric.started_at).all()
+        metrics = [
+            {
+                "stage": m.stage,
+                "kind": m.kind,
+                "name": m.name,
+                "startedAt": m.started_at.isoformat(),
+                "durationMs": m.duration_ms,
+                "items": m.items,
+                "status": m.status,
+                "error": m.error,
+                "attrs": m.attrs,
+            }
+            for m in spans
+        ]
+    else:
+        metrics = summarize_run_metrics(db, run_id)
+
+    return {
+        "runId": run.id,
+        "periodId": run.period_id,
+        "status": run.status,
+        "metrics": metrics,
+    }
+
+
+@router.get("/classifier")
+async def get_local_classifier_status(
+    runs: int = 20,
+    db: Session = Depends(get_db),
+    _: bool = Depends(verify_api_key),
+):
+    """
+    Local article classifier status.
+
+    Returns the loaded artifact's training metadata (holdout accuracy,
+    share and accuracy above the threshold), the active threshold and audit
+    rate, and local/LLM agreement on audited articles over the last `runs`
+    collection runs. Retrain with `python -m scripts.train_classifier`.
+
+    Requires X-API-Key header.
+    """
+    from app.services.local_classifier import agreement_summary, default_path, get_classifier
+
+    settings = get_settings()
+    classifier = get_classifier()
+    return {
+        "enabled": settings.local_classifier_enabled,
+        "loaded": classifier is not None,
+        "path": default_path(),
+        "threshold": settings.local_classifier_threshold,
+        "auditRate": settings.local_classifier_audit_rate,
+        "model": classifier.metadata if classifier else None,
+        "agreement": agreement_summary(db, runs),
+    }
+
+
+@router.post("/rollup")
+async def trigger_weekly_rollup(
+    week_id: str,
+    llm_trends: Optional[bool] = None,
+    db: Session = Depends(get_db),
+    _: bool = Depends(verify_api_key),
+):
+    """
+    Rebuild a week's content from its daily periods (no fetches).
+
+    Posts are deduplicated and ranked from the child days, translations are
+    reused. Trends are merged from the days unless llm_trends=true (one LLM call).
+
+    Requires X-API-Key header.
+    """
+    from app.services.rollup import build_week_rollup
+
+    try:
+        counts = build_week_rollup(db, week_id, llm_trends=llm_trends)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    return {
+        "status": "completed",
+        "week_id": week_id,
+        "counts": counts,
+    }
+
+
+@router.post("/queue")
+async def enqueue_pipeline_job(
+    job_type: str,
+    period_id: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    incremental: bool = False,
+    then_process: bool = False,
+    parallel: Optional[int] = None,
+    priority: int = 0,
+    max_attempts: Optional[int] = None,
+    db: Session = Depends(get_db),
+    _: bool = Depends(verify_api_key),
+):
+    """
+    Queue pipeline work for the worker processes (scripts/worker.py).
+
+    Job types: fetch (then_process=true also queues the process job),
+    process, translate, backfill (start/end dates, optional parallel) and
+    newsletter. Nothing runs inside the API process.
+
+    Requires X-API-Key header.
+    """
+    from app.services.job_queue import enqueue, job_to_dict
+
+    if job_type == "backfill":
+        if not start or not end:
+            raise HTTPException(status_code=400, detail="backfill jobs need start and end dates")
+        payload = {"start": start, "end": end, "parallel": parallel, "incremental": incremental}
+    else:
+        payload = {"period_id": period_id}
+        if job_type == "fetch":
+            payload.update(incremental=incremental, then_process=then_process)
+
+    try:
+        job = enqueue(db, job_type, payload, priority=priority, max_attempts=max_attempts)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return job_to_dict(job)
+
+
+@router.get("/queue")
+async def list_pipeline_jobs(
+    status: Optional[str] = None,
+    job_type: Optional[str] = None,
+    limit: int = 50,
+    db: Session = Depends(get_db),
+    _: bool = Depends(verify_api_key),
+):
+    """
+    Queue status: job counts per status and the most recent jobs.
+
+    Requires X-API-Key header.
+    """
+    from sqlalchemy import func
+    from app.models import PipelineJob
+    from app.services.job_queue import job_to_dict
+
+    counts = dict(db.query(PipelineJob.status, func.count(PipelineJob.id)).group_by(PipelineJob.status).all())
+    query = db.query(PipelineJob)
+    if status:
+        query = query.filter(PipelineJob.status == status)
+    if job_type:
+        query = query.filter(PipelineJob.job_type == job_type)
+    jobs = query.order_by(PipelineJob.created_at.desc()).limit(min(limit, 200)).all()
+
+    return {
+        "counts": counts,
+        "jobs": [job_to_dict(j) for j in jobs],
+    }
+
+
+@router.get("/queue/{job_id}")
+async def get_pipeline_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    _: bool = Depends(verify_api_key),
+):
+    """
+    Status, attempts, heartbeat and result of one queued job.
+
+    Requires X-API-Key header.
+    """
+    from app.models import PipelineJob
+    from app.services.job_queue import job_to_dict
+
+    job = db.query(PipelineJob).filter(PipelineJob.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job_to_dict(job)
+
+
+@router.post("/queue/{job_id}/cancel")
+async def cancel_pipeline_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    _: bool = Depends(verify_api_key),
+):
+    """
+    Cancel a job that is still queued (running jobs finish their attempt).
+
+    Requires X-API-Key header.
+    """
+    from app.models import PipelineJob
+    from app.services.job_queue import QUEUED, CANCELLED, job_to_dict
+
+    job = db.query(PipelineJob).filter(PipelineJob.id == job_id).with_for_update().first()
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    if job.status != QUEUED:
+        raise HTTPException(status_code=409, detail=f"Job {job_id} is {job.status}, only queued jobs can be cancelled")
+    job.status = CANCELLED
+    db.commit()
+    return job_to_dict(job)
+
+
 @router.post("/migrate")
 async def migrate_json_data(
     week_id: str,
@@ -389,131 +732,11 @@ def _run_backfill_translations_with_new_session(
     period_id: str | None = None,
 ):
     """Background task wrapper for translation backfill."""
-    from app.models import (
-        Week, TechPost, PrimaryMarketPost, SecondaryMarketPost,
-        MAPost, TipPost, Video, Trend,
-    )
-    from app.services.i18n_utils import TRANSLATION_LANGUAGES
-    from app.services.llm_processor import LLMProcessor
-
-    CONFIGS = {
-        "tech": (TechPost, ["content", "category", "tags"], {}),
-        "video": (Video, ["title", "summary"], {}),
-        "tip": (TipPost, ["content", "tip", "category", "difficulty"], {}),
-        "primary_market": (PrimaryMarketPost, ["content", "amount", "valuation"], {}),
-        "secondary_market": (SecondaryMarketPost, ["content"], {}),
-        "ma": (MAPost, ["content", "deal_value", "deal_type"], {}),
-        "trend": (Trend, ["category", "title"], {}),
-    }
-
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-    import threading
+    from app.services.translation_backfill import backfill_missing_translations
 
     db = get_session_local()()
     try:
-        # Resolve periods
-        if period_id:
-            week_ids = [period_id]
-        else:
-            weeks = db.query(Week).order_by(Week.id).all()
-            week_ids = [w.id for w in weeks]
-
-        logger.info(f"Backfill translations: {len(week_ids)} period(s)")
-        grand_total = 0
-
-        for wid in week_ids:
-            logger.info(f"Backfilling {wid}")
-
-            # Collect all sections that need translation for this period
-            section_data = []  # (section_name, records, en_items, fields, name_map, missing_langs)
-            for section_name, (model_cls, fields, name_map) in CONFIGS.items():
-                records = db.query(model_cls).filter(model_cls.week_id == wid).all()
-
-                # Find records missing ANY language (not just records with no translations)
-                to_translate = []
-                missing_langs_per_record = []
-                for r in records:
-                    existing = r.translations or {}
-                    missing = [lang for lang in TRANSLATION_LANGUAGES if lang not in existing]
-                    if missing:
-                        to_translate.append(r)
-                        missing_langs_per_record.append(missing)
-
-                if not to_translate:
-                    continue
-
-                # Figure out which languages need work across all records in this section
-                all_missing = set()
-                for ml in missing_langs_per_record:
-                    all_missing.update(ml)
-
-                en_items = []
-                for record in to_translate:
-                    d = {"_translations": dict(record.translations or {})}
-                    for f in fields:
-                        val = getattr(record, f"{f}_en", None)
-                        if val is not None:
-                            d[f] = val
-                    en_items.append(d)
-
-                section_data.append((section_name, to_translate, en_items, fields, name_map, sorted(all_missing)))
-                logger.info(f"  {section_name}: {len(to_translate)} records, missing langs: {sorted(all_missing)}")
-
-            if not section_data:
-                logger.info(f"  {wid}: nothing to translate")
-                continue
-
-            # Build work units: only for missing languages per section
-            lock = threading.Lock()
-            work_units = [
-                (si, lang)
-                for si in range(len(section_data))
-                for lang in section_data[si][5]  # missing_langs
-            ]
-
-            def do_translate(section_idx: int, target_lang: str):
-                section_name, _, en_items, fields, name_map, _ = section_data[section_idx]
-                proc = LLMProcessor()
-                translated = proc.translate_batch(en_items, target_lang, fields)
-                with lock:
-                    for i, en_item in enumerate(en_items):
-                        if i < len(translated) and translated[i]:
-                            mapped = {}
-                            for k, v in translated[i].items():
-                                db_name = name_map.get(k, k)
-                                mapped[db_name] = v
-                            en_item["_translations"][target_lang] = mapped
-
-            # 3 parallel workers (same as stage3_5)
-            with ThreadPoolExecutor(max_workers=3) as executor:
-                futures = {}
-                for si, lang in work_units:
-                    future = executor.submit(do_translate, si, lang)
-                    futures[future] = f"{section_data[si][0]}→{lang}"
-
-                for future in as_completed(futures):
-                    task_name = futures[future]
-                    try:
-                        future.result()
-                        logger.info(f"    {task_name}: done")
-                    except Exception as e:
-                        logger.warning(f"    {task_name}: failed ({e})")
-
-            # Write back to DB
-            period_total = 0
-            for section_name, records, en_items, _, _, _ in section_data:
-                for i, record in enumerate(records):
-                    t = en_items[i].get("_translations")
-                    if t:
-                        record.translations = t
-                        period_total += 1
-
-            if period_total > 0:
-                db.commit()
-            grand_total += period_total
-            logger.info(f"  {wid}: {period_total} records updated")
-
-        logger.info(f"Backfill complete: {grand_total} total records across {len(week_ids)} periods")
+        backfill_missing_translations(db, period_id)
     except Exception as e:
         logger.error(f"Backfill failed: {e}")
         db.rollback()
@@ -0,0 +1,44 @@
+"""
+Prometheus metrics endpoint for the collection pipeline.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.database import get_db
+
+router = APIRouter(tags=["metrics"])
+
+
+def verify_metrics_token(
+    authorization: Optional[str] = Header(None),
+    x_api_key: Optional[str] = Header(None),
+):
+    """
+    Require 'Authorization: Bearer <METRICS_TOKEN>' or the admin 'X-API-Key'.
+
+    Open to anyone only with METRICS_PUBLIC=true.
+    """
+    settings = get_settings()
+    if settings.metrics_public:
+        return True
+    if settings.metrics_token and authorization == f"Bearer {settings.metrics_token}":
+        return True
+    if settings.admin_api_key and x_api_key == settings.admin_api_key:
+        return True
+    raise HTTPException(status_code=401, detail="Invalid metrics token")
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics(
+    db: Session = Depends(get_db),
+    _: bool = Depends(verify_metrics_token),
+):
+    """Collection run and per-stage span metrics in Prometheus text format."""
+    from app.services.metrics import render_prometheus
+
+    return PlainTextResponse(render_prometheus(db), media_type="text/plain; version=0.0.4")
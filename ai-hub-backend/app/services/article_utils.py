@@ -0,0 +1,79 @@
+"""
+Shared utilities for article identity (canonical URLs and content hashes).
+"""
+
+import hashlib
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Query parameters that only carry tracking information and never change the article
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "mc_cid", "mc_eid", "ref", "ref_src", "source",
+    "utm_campaign", "utm_content", "utm_medium", "utm_name", "utm_source", "utm_term",
+}
+
+
+def canonical_url(url: str | None) -> str:
+    """
+    Normalize an article URL so that trivially different links compare equal.
+
+    Lowercases scheme and host, drops a leading 'www.', the fragment, tracking
+    query parameters and trailing slashes, and sorts the remaining query.
+    """
+    if not url:
+        return ""
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS
+    ]
+    query.sort()
+
+    path = parts.path.rstrip("/")
+    scheme = parts.scheme.lower() if parts.scheme else "https"
+    if scheme == "http":
+        scheme = "https"
+
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+def normalize_title(title: str | None) -> str:
+    """Lowercase a title and collapse punctuation/whitespace."""
+    if not title:
+        return ""
+    return " ".join(re.sub(r"[^\w\s]", " ", title.lower()).split())
+
+
+def content_hash(link: str | None, title: str | None = None) -> str:
+    """
+    Stable identity hash for an article.
+
+    Uses the canonical URL when available, otherwise falls back to the
+    normalized title (e.g. for feeds that omit links).
+    """
+    key = canonical_url(link)
+    if not key:
+        key = "title:" + normalize_title(title)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def title_hash(title: str | None, min_length: int = 20) -> str | None:
+    """
+    Hash of the normalized title, or None for titles too short to identify a story.
+
+    Short generic titles ("Weekly thread", "Update") would otherwise match
+    unrelated articles across sources.
+    """
+    normalized = normalize_title(title)
+    if len(normalized) < min_length:
+        return None
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
@@ -0,0 +1,235 @@
+"""
+Concurrent multi-period backfill.
+
+Collects a range of daily periods with several run_collection() calls in
+flight at once. Each period runs in its own thread with its own database
+session; all of their LLM calls share one process-wide budget (see
+llm_budget.py), so raising the number of parallel periods does not
+oversubscribe OpenRouter. The backfill's limits apply only to its own
+calls and end with the backfill. Progress and an ETA are reported while the
+backfill runs.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from app.config import get_settings
+from app.database import get_session_local
+from app.models import CollectionRun
+from app.services.llm_budget import scoped_budget
+from app.services.metrics import submit_with_context
+from app.services.period_utils import ensure_period, day_to_week_id
+
+logger = logging.getLogger(__name__)
+
+
+def day_ids_between(start: str, end: str) -> list[str]:
+    """
+    Daily period IDs from start to end (both inclusive).
+
+    Raises:
+        ValueError: If a date is not YYYY-MM-DD or end is before start
+    """
+    first = datetime.strptime(start, "%Y-%m-%d").date()
+    last = datetime.strptime(end, "%Y-%m-%d").date()
+    if last < first:
+        raise ValueError(f"End date {end} is before start date {start}")
+    return [(first + timedelta(days=i)).isoformat() for i in range((last - first).days + 1)]
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """'1h05m', '4m12s', '37s' (or '?' when unknown)."""
+    if seconds is None:
+        return "?"
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+class BackfillProgress:
+    """Thread-safe progress of a backfill, with a throughput-based ETA."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.completed: list[str] = []
+        self.failed: dict[str, str] = {}
+        self.running: set[str] = set()
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def start(self, period_id: str) -> None:
+        with self._lock:
+            self.running.add(period_id)
+
+    def finish(self, period_id: str, error: Optional[str] = None) -> None:
+        with self._lock:
+            self.running.discard(period_id)
+            if error is None:
+                self.completed.append(period_id)
+            else:
+                self.failed[period_id] = error
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def eta_seconds(self) -> Optional[float]:
+        """Remaining time at the throughput observed so far (None before the first period ends)."""
+        finished = len(self.completed) + len(self.failed)
+        if not finished:
+            return None
+        return (self.total - finished) * self.elapsed / finished
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "total": self.total,
+                "completed": len(self.completed),
+                "failed": len(self.failed),
+                "running": sorted(self.running),
+                "elapsedSeconds": round(self.elapsed, 1),
+                "etaSeconds": None if (eta := self.eta_seconds()) is None else round(eta, 1),
+            }
+
+
+def _collect_period(period_id: str, incremental: bool, progress: BackfillProgress) -> None:
+    from app.services.collector import run_collection
+
+    progress.start(period_id)
+    db = get_session_local()()
+    try:
+        run_collection(db, period_id, incremental=incremental)
+    except Exception as e:
+        logger.error(f"Backfill of {period_id} failed: {e}")
+        progress.finish(period_id, error=str(e))
+        return
+    finally:
+        db.close()
+    progress.finish(period_id)
+
+
+def _log_progress(progress: BackfillProgress, budget) -> None:
+    state = progress.snapshot()
+    llm = budget.stats()
+    logger.info(
+        f"Backfill {state['completed'] + state['failed']}/{state['total']} periods "
+        f"({state['failed']} failed), running: {', '.join(state['running']) or '-'}, "
+        f"elapsed {format_duration(state['elapsedSeconds'])}, ETA {format_duration(state['etaSeconds'])}, "
+        f"LLM calls {llm['calls']} ({llm['inFlight']} in flight, {llm['waitSeconds']}s waited)"
+    )
+
+
+def run_backfill(
+    period_ids: list[str],
+    parallel: Optional[int] = None,
+    incremental: bool = False,
+    skip_completed: bool = False,
+    rollup: Optional[bool] = None,
+    llm_max_concurrent: Optional[int] = None,
+    llm_requests_per_minute: Optional[float] = None,
+    on_progress: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    """
+    Collect several periods concurrently under one LLM budget.
+
+    Args:
+        period_ids: Daily period IDs to collect (see day_ids_between)
+        parallel: Periods collected at the same time (default: BACKFILL_PARALLEL_PERIODS)
+        incremental: Re-collect on top of existing raw data
+        skip_completed: Skip periods that already have a completed collection run
+        rollup: Rebuild the touched weeks from their days afterwards
+            (default: WEEKLY_ROLLUP_AFTER_DAILY)
+        llm_max_concurrent: Global cap on concurrent LLM requests
+            (default: BACKFILL_LLM_MAX_CONCURRENT, 0 = unlimited)
+        llm_requests_per_minute: Global LLM request rate
+            (default: BACKFILL_LLM_REQUESTS_PER_MINUTE, 0 = unlimited)
+        on_progress: Called with a progress snapshot after every finished
+            period and every BACKFILL_PROGRESS_INTERVAL_SECONDS
+
+    Returns:
+        Summary with completed, failed and skipped periods, duration and LLM stats
+    """
+    settings = get_settings()
+    parallel = max(1, parallel or settings.backfill_parallel_periods)
+    if rollup is None:
+        rollup = settings.weekly_rollup_after_daily
+    llm_max_concurrent = settings.backfill_llm_max_concurrent if llm_max_concurrent is None else llm_max_concurrent
+    if llm_requests_per_minute is None:
+        llm_requests_per_minute = settings.backfill_llm_requests_per_minute
+
+    db = get_session_local()()
+    try:
+        skipped: list[str] = []
+        if skip_completed:
+            done = {
+                period_id for (period_id,) in db.query(CollectionRun.period_id).filter(
+                    CollectionRun.period_id.in_(period_ids),
+                    CollectionRun.status == "completed",
+                ).distinct()
+            }
+            skipped = [p for p in period_ids if p in done]
+            period_ids = [p for p in period_ids if p not in done]
+
+        # Create the periods up front (not current) so concurrent runs
+        # neither race on the Week rows nor flip is_current to old days
+        for period_id in period_ids:
+            ensure_period(db, period_id, is_current=False)
+    finally:
+        db.close()
+
+    progress = BackfillProgress(len(period_ids))
+    logger.info(
+        f"Backfilling {len(period_ids)} periods, {parallel} at a time"
+        + (f" ({len(skipped)} already completed, skipped)" if skipped else "")
+    )
+
+    # Scoped to this backfill's threads: other jobs in the process keep their own budget
+    with scoped_budget(llm_max_concurrent, llm_requests_per_minute) as budget:
+
+        def report() -> None:
+            _log_progress(progress, budget)
+            if on_progress:
+                on_progress(progress.snapshot())
+
+        with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="backfill") as executor:
+            pending = {
+                submit_with_context(executor, _collect_period, p, incremental, progress) for p in period_ids
+            }
+            while pending:
+                _, pending = wait(
+                    pending, timeout=settings.backfill_progress_interval_seconds, return_when=FIRST_COMPLETED,
+                )
+                report()
+
+    if rollup and progress.completed:
+        from app.services.rollup import build_week_rollup
+
+        db = get_session_local()()
+        try:
+            for week_id in sorted({day_to_week_id(p) for p in progress.completed}):
+                try:
+                    build_week_rollup(db, week_id)
+                except Exception as e:
+                    logger.warning(f"Weekly rollup for {week_id} failed (non-fatal): {e}")
+        finally:
+            db.close()
+
+    summary = {
+        "completed": sorted(progress.completed),
+        "failed": progress.failed,
+        "skipped": skipped,
+        "seconds": round(progress.elapsed, 1),
+        "llm": budget.stats(),
+    }
+    logger.info(
+        f"Backfill finished in {format_duration(progress.elapsed)}: {len(progress.completed)} completed, "
+        f"{len(progress.failed)} failed, {len(skipped)} skipped"
+    )
+    return summary
@@ -0,0 +1,294 @@
+"""
+Record/replay of outbound requests for offline pipeline runs.
+
+In record mode every HTTP request made by the fetchers (RSS, HN/Algolia,
+YouTube, transcripts) and every LLM completion is stored, keyed by its
+request, in a gzip-compressed cassette file. In replay mode the same calls
+are answered from the cassette without touching the network, optionally
+with injected latency, so pipeline changes can be benchmarked reproducibly.
+
+Activate with ``use_cassette(path, mode)`` (see ``scripts/daily_collect.py
+--record-cassette / --replay-cassette``) or via the CASSETTE_MODE and
+CASSETTE_PATH settings. Time-window filters use ``cassette.now()``, which
+returns the recording time during replay so cutoffs match the recording.
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+OFF = "off"
+RECORD = "record"
+REPLAY = "replay"
+CASSETTE_VERSION = 1
+
+
+class CassetteMiss(LookupError):
+    """Replay found no recorded interaction for a request."""
+
+
+class RecordedError(Exception):
+    """An exception that was raised while recording, replayed as-is."""
+
+    def __init__(self, error_type: str, message: str):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+class Cassette:
+    """
+    Recorded interactions keyed by (kind, request).
+
+    Identical requests (e.g. retries) are stored in order and replayed in
+    the same order; the last one is repeated once a key is exhausted.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        mode: str,
+        latency_ms: float = 0.0,
+        latency_scale: float = 0.0,
+    ):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode '{mode}'")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency_ms = latency_ms
+        self.latency_scale = latency_scale
+        self.interactions: dict[str, list[dict]] = {}
+        self.recorded_at = datetime.utcnow()
+        self.hits = 0
+        self.misses = 0
+        self._cursors: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        if mode == REPLAY:
+            self._load()
+
+    def _load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {data.get('version')} in {self.path}")
+        self.interactions = data["interactions"]
+        self.recorded_at = datetime.fromisoformat(data["recorded_at"])
+        logger.info(
+            f"Replaying cassette {self.path} recorded {data['recorded_at']} "
+            f"({sum(len(v) for v in self.interactions.values())} interactions)"
+        )
+
+    def save(self) -> None:
+        """Write the cassette (record mode only)."""
+        if self.mode != RECORD:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {
+                "version": CASSETTE_VERSION,
+                "recorded_at": self.recorded_at.isoformat(),
+                "interactions": self.interactions,
+            }
+            with gzip.open(self.path, "wt", encoding="utf-8", compresslevel=6) as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        logger.info(
+            f"Saved cassette {self.path}: {sum(len(v) for v in self.interactions.values())} interactions, "
+            f"{self.path.stat().st_size / 1024:.0f} KiB"
+        )
+
+    def record(self, key: str, entry: dict) -> None:
+        with self._lock:
+            self.interactions.setdefault(key, []).append(entry)
+
+    def replay(self, key: str) -> dict:
+        with self._lock:
+            entries = self.interactions.get(key)
+            if not entries:
+                self.misses += 1
+                raise CassetteMiss(f"Request not in cassette ({key})")
+            index = self._cursors.get(key, 0)
+            self._cursors[key] = index + 1
+            self.hits += 1
+            entry = entries[min(index, len(entries) - 1)]
+
+        delay = self.latency_ms + self.latency_scale * entry.get("elapsed_ms", 0)
+        if delay > 0:
+            time.sleep(delay / 1000)
+        return entry
+
+
+_active: Optional[Cassette] = None
+_settings_checked = False
+_active_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[Cassette]:
+    """The active cassette, activating one from settings on first use."""
+    global _active, _settings_checked
+    if _active is not None or _settings_checked:
+        return _active
+    with _active_lock:
+        if not _settings_checked:
+            _settings_checked = True
+            settings = get_settings()
+            if settings.cassette_mode != OFF and settings.cassette_path:
+                _active = Cassette(
+                    settings.cassette_path,
+                    settings.cassette_mode,
+                    latency_ms=settings.cassette_latency_ms,
+                    latency_scale=settings.cassette_latency_scale,
+                )
+                if _active.mode == RECORD:
+                    import atexit
+
+                    atexit.register(_active.save)
+    return _active
+
+
+@contextmanager
+def use_cassette(path: str | Path, mode: str, latency_ms: float = 0.0, latency_scale: float = 0.0):
+    """Record or replay all outbound requests made inside the block."""
+    global _active, _settings_checked
+    cassette = Cassette(path, mode, latency_ms=latency_ms, latency_scale=latency_scale)
+    previous = _active
+    _active, _settings_checked = cassette, True
+    try:
+        yield cassette
+    finally:
+        _active = previous
+        cassette.save()
+        if mode == REPLAY:
+            logger.info(f"Cassette replay: {cassette.hits} hits, {cassette.misses} misses")
+
+
+def now(utc: bool = False) -> datetime:
+    """Current time, or the recording time while replaying (for cutoff filters)."""
+    cassette = get_cassette()
+    current = datetime.utcnow() if utc else datetime.now()
+    if cassette is None or cassette.mode != REPLAY:
+        return current
+    offset = datetime.utcnow() - cassette.recorded_at
+    return current - max(offset, timedelta(0))
+
+
+def request_key(kind: str, request: Any) -> str:
+    """Stable key for a request (kind plus a hash of its canonical JSON)."""
+    canonical = json.dumps(request, sort_keys=True, ensure_ascii=False, default=str)
+    return f"{kind}:{hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:32]}"
+
+
+def call(
+    kind: str,
+    request: Any,
+    fn: Callable[[], Any],
+    rebuild_error: Optional[Callable[[str, str], Exception]] = None,
+) -> Any:
+    """
+    Run ``fn()`` through the active cassette.
+
+    Args:
+        kind: Interaction family (e.g. "http", "llm", "youtube.search")
+        request: JSON-serializable description of the request (the key)
+        fn: Performs the real request; must return JSON-serializable data
+        rebuild_error: Maps a recorded (error type, message) back to an
+            exception on replay; defaults to RecordedError
+
+    Returns:
+        fn()'s result, or the recorded result when replaying
+
+    Raises:
+        CassetteMiss: Replaying a request that was never recorded
+    """
+    cassette = get_cassette()
+    if cassette is None:
+        return fn()
+
+    key = request_key(kind, request)
+    if cassette.mode == REPLAY:
+        entry = cassette.replay(key)
+        if "error" in entry:
+            error_type, message = entry["error"]
+            if rebuild_error is not None:
+                raise rebuild_error(error_type, message)
+            raise RecordedError(error_type, message)
+        return entry["response"]
+
+    start = time.perf_counter()
+    try:
+        result = fn()
+    except Exception as e:
+        cassette.record(key, {
+            "kind": kind,
+            "error": [type(e).__name__, str(e)],
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+        })
+        raise
+    cassette.record(key, {
+        "kind": kind,
+        "response": result,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+    })
+    return result
+
+
+class CassetteResponse:
+    """Minimal stand-in for requests.Response built from recorded data."""
+
+    def __init__(self, url: str, status_code: int, content: bytes, headers: dict):
+        from requests.structures import CaseInsensitiveDict
+
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        # Case-insensitive like live requests/httpx headers (ETag vs etag)
+        self.headers = CaseInsensitiveDict(headers or {})
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            import requests
+
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=None)
+
+
+def http_get(url: str, params: Optional[dict] = None, headers: Optional[dict] = None, timeout=None):
+    """
+    requests.get() that goes through the active cassette.
+
+    Without a cassette this is a plain requests.get(). Otherwise the status,
+    body and content headers are recorded/replayed (headers are not part of
+    the key, only the URL and params).
+    """
+    import requests
+
+    if get_cassette() is None:
+        return requests.get(url, params=params, headers=headers, timeout=timeout)
+
+    def fetch() -> dict:
+        resp = requests.get(url, params=params, headers=headers, timeout=timeout)
+        return {
+            "status": resp.status_code,
+            "body": base64.b64encode(resp.content).decode("ascii"),
+            "headers": {k: v for k, v in resp.headers.items() if k.lower() in ("content-type", "etag", "last-modified")},
+        }
+
+    data = call("http", {"url": url, "params": params}, fetch)
+    return CassetteResponse(url, data["status"], base64.b64decode(data["body"]), data["headers"])
@@ -0,0 +1,183 @@
+"""
+Checkpointing for collection runs.
+
+Each pipeline stage (a node of the collector's task graph) persists its
+output as a CollectionArtifact keyed by (run_id, stage). A failed or interrupted run can then be resumed from the
+last completed stage without paying for the LLM work again.
+
+A running run refreshes its updated_at from a heartbeat thread. Runs that
+are still running with a fresh heartbeat are never resumed; a "running"
+run whose heartbeat is older than COLLECTION_STALE_AFTER_SECONDS belongs
+to a dead process and can be resumed.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import and_, or_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.database import get_session_local
+from app.models import CollectionRun, CollectionArtifact
+
+logger = logging.getLogger(__name__)
+
+# Fixed pipeline stages; per-section nodes are checkpointed as
+# "process:<section>", "trends" and "translate:<task>:<lang>"
+STAGES = ["fetch", "classify", "save"]
+
+
+def start_run(db: Session, period_id: str, incremental: bool = False) -> CollectionRun:
+    """Create a new run record for a period."""
+    run = CollectionRun(period_id=period_id, status="running", incremental=incremental)
+    db.add(run)
+    db.commit()
+    logger.info(f"Started collection run {run.id} for {period_id}")
+    return run
+
+
+RESUMABLE_STATUSES = ("failed", "interrupted")
+
+
+def _resumable():
+    """Filter for runs that may be resumed: failed, interrupted, or running with a stale heartbeat."""
+    cutoff = datetime.utcnow() - timedelta(seconds=get_settings().collection_stale_after_seconds)
+    return or_(
+        CollectionRun.status.in_(RESUMABLE_STATUSES),
+        and_(CollectionRun.status == "running", CollectionRun.updated_at < cutoff),
+    )
+
+
+def find_active_run(
+    db: Session,
+    period_id: Optional[str] = None,
+    run_id: Optional[int] = None,
+) -> Optional[CollectionRun]:
+    """A run that is still running with a fresh heartbeat (by run_id, or the latest for period_id)."""
+    query = db.query(CollectionRun).filter(CollectionRun.status == "running", ~_resumable())
+    if run_id is not None:
+        return query.filter(CollectionRun.id == run_id).first()
+    if period_id:
+        query = query.filter(CollectionRun.period_id == period_id)
+    return query.order_by(CollectionRun.started_at.desc()).first()
+
+
+def claim_run(db: Session, run: CollectionRun) -> bool:
+    """
+    Atomically mark a resumable run as running again.
+
+    Returns:
+        False if another process resumed it first (or it is no longer resumable)
+    """
+    claimed = db.execute(
+        update(CollectionRun)
+        .where(CollectionRun.id == run.id, _resumable())
+        .values(status="running", error=None, updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    db.refresh(run)
+    return bool(claimed)
+
+
+class RunHeartbeat:
+    """Refresh a running run's updated_at from a daemon thread with its own session."""
+
+    def __init__(self, run_id: int, interval: Optional[float] = None):
+        self.run_id = run_id
+        self.interval = interval or get_settings().collection_heartbeat_seconds
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._beat, name=f"run-heartbeat-{run_id}", daemon=True)
+
+    def _beat(self) -> None:
+        while not self._stop.wait(self.interval):
+            db = get_session_local()()
+            try:
+                db.execute(
+                    update(CollectionRun)
+                    .where(CollectionRun.id == self.run_id, CollectionRun.status == "running")
+                    .values(updated_at=datetime.utcnow())
+                )
+                db.commit()
+            except Exception as e:
+                logger.warning(f"Heartbeat for run {self.run_id} failed: {e}")
+                db.rollback()
+            finally:
+                db.close()
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join(timeout=self.interval)
+
+
+def find_resumable_run(
+    db: Session,
+    period_id: Optional[str] = None,
+    run_id: Optional[int] = None,
+) -> Optional[CollectionRun]:
+    """
+    Find the run to resume.
+
+    Args:
+        db: Database session
+        period_id: Resume the latest unfinished run for this period
+        run_id: Resume this specific run (takes precedence)
+
+    Returns:
+        The run, or None if there is nothing to resume (runs that are still
+        running with a fresh heartbeat are not resumable)
+    """
+    query = db.query(CollectionRun).filter(_resumable())
+    if run_id is not None:
+        return query.filter(CollectionRun.id == run_id).first()
+    if period_id:
+        query = query.filter(CollectionRun.period_id == period_id)
+    return query.order_by(CollectionRun.started_at.desc()).first()
+
+
+def save_artifact(db: Session, run: CollectionRun, stage: str, payload) -> None:
+    """Persist a stage's output (replacing any earlier artifact for the stage)."""
+    stmt = pg_insert(CollectionArtifact).values(
+        run_id=run.id, stage=stage, payload=payload, created_at=datetime.utcnow(),
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_collection_artifacts_run_stage",
+        set_={"payload": stmt.excluded.payload, "created_at": stmt.excluded.created_at},
+    )
+    db.execute(stmt)
+    run.last_stage = stage
+    db.commit()
+    logger.info(f"Checkpoint saved: run {run.id} stage '{stage}'")
+
+
+def load_artifact(db: Session, run: CollectionRun, stage: str):
+    """Return the stored payload for a stage, or None if the stage never completed."""
+    artifact = db.query(CollectionArtifact).filter(
+        CollectionArtifact.run_id == run.id,
+        CollectionArtifact.stage == stage,
+    ).first()
+    return artifact.payload if artifact else None
+
+
+def completed_stages(db: Session, run: CollectionRun) -> set[str]:
+    """Names of all stages with a stored artifact for this run."""
+    return {
+        stage for (stage,) in db.query(CollectionArtifact.stage).filter(CollectionArtifact.run_id == run.id)
+    }
+
+
+def finish_run(db: Session, run: CollectionRun, status: str, error: Optional[str] = None) -> None:
+    """Mark a run as completed, failed or interrupted."""
+    run.status = status
+    run.error = error
+    run.finished_at = datetime.utcnow()
+    db.commit()
+    logger.info(f"Collection run {run.id} finished with status '{status}'")
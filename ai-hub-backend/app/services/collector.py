@@ -2,13 +2,18 @@
 Main data collection orchestrator with two-stage processing and parallel LLM calls.
 """
 
+import hashlib
 import logging
+import queue
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import NamedTuple, Optional
 
 import yaml
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, undefer
 
 from app.config import get_settings
 from app.models import (
@@ -16,12 +21,33 @@ from app.models import (
     TipPost, Trend, TeamMember, RawArticle, RawVideo,
 )
 from app.services.period_utils import (
-    is_daily_id, current_day_id, ensure_period,
+    is_daily_id, current_day_id, day_to_week_id, ensure_period,
 )
 from app.services.rss_fetcher import fetch_rss_feeds_parallel
 from app.services.hn_fetcher import fetch_hn_stories
-from app.services.youtube_fetcher import fetch_youtube_videos, fetch_video_transcript
+from app.services.youtube_fetcher import fetch_youtube_videos
+from app.services.local_classifier import split_confident
+from app.services.map_reduce import map_reduce_candidates
+from app.services.near_duplicates import NearDuplicateIndex, source_priorities
+from app.services.prerank import shortlist
+from app.services.transcript_cache import get_transcripts
+from app.services.trends import generate_trends as generate_local_trends
 from app.services.llm_processor import LLMProcessor
+from app.services.article_utils import content_hash
+from app.services.raw_store import (
+    raw_article_values, raw_video_values,
+    bulk_insert_raw_articles, bulk_insert_raw_articles_returning, bulk_insert_raw_videos,
+)
+from app.services.seen_index import lookup_seen, record_seen, mark_published
+from app.services.task_graph import TaskGraph
+from app.services.metrics import (
+    span, submit_with_context, recording, save_run_metrics, TRANSLATION, YOUTUBE, CLASSIFIER,
+)
+from app.services.date_utils import parse_article_date, filter_articles_in_period
+from app.services.checkpoints import (
+    start_run, find_resumable_run, claim_run, save_artifact, load_artifact, completed_stages, finish_run,
+    RunHeartbeat,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -54,39 +80,12 @@ def get_week_boundaries(week_id: str) -> tuple[datetime, datetime]:
     return start, end
 
 
-def parse_article_date(date_str: Optional[str]) -> Optional[datetime]:
-    """
-    Parse article published date from various formats.
-
-    Args:
-        date_str: Date string in various formats (RSS, ISO, etc.)
-
-    Returns:
-        datetime object or None if parsing fails
-    """
-    if not date_str:
-        return None
-
-    from dateutil import parser as dateutil_parser
-
-    try:
-        # dateutil.parser handles most formats automatically
-        dt = dateutil_parser.parse(date_str)
-        # Remove timezone info for comparison (treat all as local/UTC)
-        if dt.tzinfo:
-            dt = dt.replace(tzinfo=None)
-        return dt
-    except (ValueError, TypeError):
-        pass
-
-    return None
-
-
 def is_article_in_week(article: dict, week_start: datetime, week_end: datetime) -> bool:
     """
     Check if an article belongs to the target week.
 
     Uses lenient matching: articles without parseable dates are included.
+    Use filter_articles_in_period() to filter whole lists.
 
     Args:
         article: Article dict with 'published' field
@@ -175,7 +174,9 @@ def load_sources() -> dict:
 
     try:
         import os
-        sources_path = os.path.join(os.path.dirname(__file__), "..", "..", "sources.yaml")
+        sources_path = get_settings().sources_file or os.path.join(
+            os.path.dirname(__file__), "..", "..", "sources.yaml"
+        )
         if os.path.exists(sources_path):
             with open(sources_path, "r") as f:
                 return yaml.safe_load(f)
@@ -190,16 +191,20 @@ def ensure_week(db: Session, week_id: str) -> Week:
     return ensure_period(db, week_id, is_current=True)
 
 
-def clear_week_data(db: Session, week_id: str):
-    """Clear existing data for a week (for re-collection)."""
-    db.query(TechPost).filter(TechPost.week_id == week_id).delete()
-    db.query(Video).filter(Video.week_id == week_id).delete()
-    db.query(PrimaryMarketPost).filter(PrimaryMarketPost.week_id == week_id).delete()
-    db.query(SecondaryMarketPost).filter(SecondaryMarketPost.week_id == week_id).delete()
-    db.query(MAPost).filter(MAPost.week_id == week_id).delete()
-    db.query(TipPost).filter(TipPost.week_id == week_id).delete()
-    db.query(Trend).filter(Trend.week_id == week_id).delete()
-    db.commit()
+def clear_week_data(db: Session, week_id: str, commit: bool = True, keep_videos: bool = False):
+    """
+    Clear existing data for a week (for re-collection).
+
+    One DELETE per content table. Pass commit=False to run it inside a
+    larger transaction (stage 4). keep_videos leaves the week's Video rows
+    in place (rollups cannot recreate them: video_id is globally unique).
+    """
+    for model_class in (TechPost, Video, PrimaryMarketPost, SecondaryMarketPost, MAPost, TipPost, Trend):
+        if keep_videos and model_class is Video:
+            continue
+        db.execute(delete(model_class).where(model_class.week_id == week_id))
+    if commit:
+        db.commit()
     logger.info(f"Cleared existing data for {week_id}")
 
 
@@ -292,40 +297,131 @@ def intersperse_videos(posts: list, videos: list, interval: int = 5, start: int
     return result
 
 
-def stage1_fetch_and_store(db: Session, week_id: str) -> dict:
-    """
-    Stage 1: Fetch all content from sources and store raw data.
+def _existing_raw_keys(db: Session, week_id: str) -> tuple[set[str], set[str]]:
+    """Return (article content hashes, video IDs) already stored for a period."""
+    hashes = set()
+    for h, link, title in db.query(
+        RawArticle.content_hash, RawArticle.link, RawArticle.title
+    ).filter(RawArticle.week_id == week_id):
+        # Rows stored before content_hash existed are hashed on the fly
+        hashes.add(h or content_hash(link, title))
 
-    Articles are filtered to only include those published within the target week's
-    ISO boundaries. Articles without parseable dates are included (lenient matching).
+    video_ids = {
+        vid for (vid,) in db.query(RawVideo.video_id).filter(RawVideo.week_id == week_id)
+    }
+    return hashes, video_ids
 
-    Args:
-        db: Database session
-        week_id: Week ID
 
-    Returns:
-        dict with counts of fetched items
+def _same_publication_scope(a: str, b: str) -> bool:
+    """True for the same period, or a day and its parent week (a week is rebuilt from its days)."""
+    if a == b:
+        return True
+    if is_daily_id(a) and not is_daily_id(b):
+        return day_to_week_id(a) == b
+    if is_daily_id(b) and not is_daily_id(a):
+        return day_to_week_id(b) == a
+    return False
+
+
+def _published_elsewhere(entry, week_id: str) -> bool:
+    """True if a seen-index entry was published outside week_id's publication scope."""
+    return bool(
+        entry
+        and entry.published_period_id
+        and not _same_publication_scope(entry.published_period_id, week_id)
+    )
+
+
+def _fetch_transcripts(videos: list[dict], limit: Optional[int] = None) -> None:
+    """Attach transcripts to the first `limit` videos in place (cached, fetched in parallel)."""
+    limit = get_settings().transcript_limit if limit is None else limit
+    selected = []
+    for video in videos[:limit]:
+        # BUG-H1: Add video_id existence check before accessing
+        if not video.get("video_id"):
+            logger.warning(f"Video missing video_id, skipping transcript fetch: {video.get('original_title', 'Unknown')}")
+            continue
+        selected.append(video)
+
+    transcripts = get_transcripts([v["video_id"] for v in selected])
+    for video in selected:
+        video["transcript"] = transcripts.get(video["video_id"])
+
+
+def _select_new_articles(
+    db: Session,
+    week_id: str,
+    articles: list[dict],
+    week_start: datetime,
+    week_end: datetime,
+    known_hashes: set[str],
+) -> list[dict]:
+    """
+    Filter fetched articles down to those that should be stored.
+
+    Drops articles outside the week boundary, articles already stored or
+    repeated across sources (known_hashes is updated in place) and, if
+    configured, stories already published in an earlier period. Sets
+    'content_hash' on every returned article.
     """
     settings = get_settings()
 
-    logger.info("=== Stage 1: Fetching & Storing Raw Data ===")
+    in_week = filter_articles_in_period(articles, week_start, week_end)
+    filtered_count = len(articles) - len(in_week)
+    if filtered_count > 0:
+        logger.info(f"Filtered out {filtered_count} articles outside week boundary")
+
+    # Drop articles already stored (incremental) or repeated across sources
+    new_articles = []
+    for article in in_week:
+        h = content_hash(article.get("link"), article.get("title"))
+        if h in known_hashes:
+            continue
+        known_hashes.add(h)
+        article["content_hash"] = h
+        new_articles.append(article)
+    skipped_known = len(in_week) - len(new_articles)
+    if skipped_known > 0:
+        logger.info(f"Skipped {skipped_known} already-stored or duplicate articles")
+
+    # Drop stories that already ran in an earlier period (if configured)
+    if settings.seen_index_enabled and settings.seen_skip_published and new_articles:
+        seen = lookup_seen(db, new_articles)
+        before = len(new_articles)
+        new_articles = [
+            a for a in new_articles
+            if not _published_elsewhere(seen.get(a["content_hash"]), week_id)
+        ]
+        if before > len(new_articles):
+            logger.info(f"Skipped {before - len(new_articles)} articles already published in earlier periods")
+
+    return new_articles
 
-    # Get week boundaries for filtering
-    week_start, week_end = get_week_boundaries(week_id)
-    logger.info(f"Week boundaries: {week_start.strftime('%Y-%m-%d')} to {week_end.strftime('%Y-%m-%d')} (exclusive)")
 
-    # Ensure week exists and clear old raw data
+def _prepare_raw_data(db: Session, week_id: str, incremental: bool) -> tuple[set[str], set[str]]:
+    """Ensure the period exists and return the (article hashes, video IDs) to skip."""
     ensure_week(db, week_id)
+    if incremental:
+        known_hashes, known_video_ids = _existing_raw_keys(db, week_id)
+        logger.info(f"Incremental mode: {len(known_hashes)} articles and "
+                    f"{len(known_video_ids)} videos already stored")
+        return known_hashes, known_video_ids
+
+    # Full runs start from a clean slate
     clear_raw_data(db, week_id)
+    return set(), set()
 
-    # Load sources
-    sources = load_sources()
 
-    # Fetch HN with enhancement (uses default HN_DEFAULT_QUERIES for comprehensive coverage)
-    # BUG-H2: Wrap external fetchers in try/except with partial fallbacks
-    hn_articles: list[dict] = []
-    rss_articles: list[dict] = []
-    youtube_videos: list[dict] = []
+def _source_fetchers(known_video_ids: set[str], on_rss_feed=None) -> dict:
+    """
+    Build the stage 1 fetch callables, keyed by source tag ('hn', 'rss', 'yt').
+
+    Each callable returns a list and never raises (BUG-H2: partial fallbacks).
+    If on_rss_feed is given, RSS articles are also handed to it feed by feed.
+    The YouTube fetcher skips known videos and fetches transcripts itself.
+    """
+    settings = get_settings()
+    sources = load_sources()
 
     def _fetch_hn():
         try:
@@ -348,102 +444,87 @@ def stage1_fetch_and_store(db: Session, week_id: str) -> dict:
         try:
             # Exclude HN since we use enhanced version
             logger.info("Fetching RSS feeds (parallel)...")
-            return fetch_rss_feeds_parallel(sources, exclude_names={"Hacker News"})
+            return fetch_rss_feeds_parallel(sources, exclude_names={"Hacker News"}, on_feed=on_rss_feed)
         except Exception as e:
             logger.error(f"Failed to fetch RSS feeds: {e}")
             return []
 
     def _fetch_youtube():
-        try:
-            logger.info("Fetching YouTube videos...")
-            return fetch_youtube_videos(
-                max_results=settings.youtube_max_results,
-                days=settings.hn_days,
-            )
-        except Exception as e:
-            logger.error(f"Failed to fetch YouTube videos: {e}")
-            return []
+        with span("youtube", kind=YOUTUBE) as youtube_span:
+            try:
+                logger.info("Fetching YouTube videos...")
+                videos = fetch_youtube_videos(
+                    max_results=settings.youtube_max_results,
+                    days=settings.hn_days,
+                )
+            except Exception as e:
+                logger.error(f"Failed to fetch YouTube videos: {e}")
+                youtube_span.status = "error"
+                youtube_span.error = str(e)[:500]
+                return []
+            youtube_span.items = len(videos)
 
+        # Skip videos already stored for this period
+        if known_video_ids:
+            videos = [v for v in videos if v.get("video_id") not in known_video_ids]
+
+        logger.info("Fetching video transcripts...")
+        _fetch_transcripts(videos)
+        return videos
+
+    return {"hn": _fetch_hn, "rss": _fetch_rss, "yt": _fetch_youtube}
+
+
+def stage1_fetch_and_store(db: Session, week_id: str, incremental: bool = False) -> dict:
+    """
+    Stage 1: Fetch all content from sources and store raw data.
+
+    Articles are filtered to only include those published within the target week's
+    ISO boundaries. Articles without parseable dates are included (lenient matching).
+
+    In incremental mode existing raw rows are kept and only articles whose
+    content hash (canonical URL, or title for link-less items) is new are
+    inserted. Videos already stored for the period are skipped, including
+    their transcript fetch.
+
+    Args:
+        db: Database session
+        week_id: Week ID
+        incremental: Keep existing raw rows and insert only new items
+
+    Returns:
+        dict with counts of fetched items
+    """
+    logger.info("=== Stage 1: Fetching & Storing Raw Data ===")
+
+    # Get week boundaries for filtering
+    week_start, week_end = get_week_boundaries(week_id)
+    logger.info(f"Week boundaries: {week_start.strftime('%Y-%m-%d')} to {week_end.strftime('%Y-%m-%d')} (exclusive)")
+
+    known_hashes, known_video_ids = _prepare_raw_data(db, week_id, incremental)
+
+    results: dict[str, list[dict]] = {"hn": [], "rss": [], "yt": []}
     with ThreadPoolExecutor(max_workers=3) as executor:
         futures = {
-            executor.submit(_fetch_hn): "hn",
-            executor.submit(_fetch_rss): "rss",
-            executor.submit(_fetch_youtube): "yt",
+            submit_with_context(executor, fetch): tag
+            for tag, fetch in _source_fetchers(known_video_ids).items()
         }
         for future in as_completed(futures):
             tag = futures[future]
             try:
-                data = future.result()
+                results[tag] = future.result()
             except Exception as e:
                 logger.error(f"Stage 1 subtask {tag} failed: {e}")
-                data = []
-            if tag == "hn":
-                hn_articles = data
-            elif tag == "rss":
-                rss_articles = data
-            else:
-                youtube_videos = data
-
-    # Fetch transcripts for top videos
-    # BUG-H1: Add video_id existence check before accessing
-    logger.info("Fetching video transcripts...")
-    for video in youtube_videos[:15]:
-        video_id = video.get("video_id")
-        if not video_id:
-            logger.warning(f"Video missing video_id, skipping transcript fetch: {video.get('original_title', 'Unknown')}")
-            continue
-        try:
-            transcript = fetch_video_transcript(video_id)
-            video["transcript"] = transcript
-        except Exception as e:
-            logger.warning(f"Failed to fetch transcript for video {video_id}: {e}")
-            video["transcript"] = None
 
-    # Filter articles by week boundary
-    all_articles_raw = hn_articles + rss_articles
-    all_articles = [a for a in all_articles_raw if is_article_in_week(a, week_start, week_end)]
-    filtered_count = len(all_articles_raw) - len(all_articles)
-    if filtered_count > 0:
-        logger.info(f"Filtered out {filtered_count} articles outside week boundary")
+    youtube_videos = results["yt"]
+    all_articles = _select_new_articles(
+        db, week_id, results["hn"] + results["rss"], week_start, week_end, known_hashes,
+    )
     logger.info(f"Total articles after filtering: {len(all_articles)}, YouTube videos: {len(youtube_videos)}")
 
-    # Store raw articles
-    for article in all_articles:
-        raw_article = RawArticle(
-            week_id=week_id,
-            source=article.get("source", "Unknown"),
-            title=article.get("title", ""),
-            link=article.get("link", ""),
-            summary=article.get("summary", ""),
-            published=article.get("published", ""),
-            original_section=article.get("original_section", "tech"),
-            raw_data={
-                "points": article.get("points"),
-                "comments": article.get("comments"),
-                "hn_url": article.get("hn_url"),
-            },
-        )
-        db.add(raw_article)
-
-    # Store raw videos
-    for video in youtube_videos:
-        raw_video = RawVideo(
-            week_id=week_id,
-            video_id=video.get("video_id", ""),
-            title=video.get("original_title", ""),
-            channel_name=video.get("channel_name", ""),
-            channel_id=video.get("channel_id"),
-            description=video.get("description"),
-            transcript=video.get("transcript"),
-            thumbnail_url=video.get("thumbnail_url"),
-            published_at=video.get("published_at"),
-            duration_seconds=video.get("duration_seconds"),
-            duration_formatted=video.get("duration_formatted"),
-            view_count=video.get("view_count"),
-            like_count=video.get("like_count"),
-            raw_data=video,  # Store full original data
-        )
-        db.add(raw_video)
+    # Store raw articles and videos (bulk inserts)
+    bulk_insert_raw_articles(db, [raw_article_values(week_id, a) for a in all_articles])
+    bulk_insert_raw_videos(db, [raw_video_values(week_id, v) for v in youtube_videos])
 
     db.commit()
     logger.info(f"Stored {len(all_articles)} raw articles and {len(youtube_videos)} raw videos")
@@ -454,252 +535,665 @@ def stage1_fetch_and_store(db: Session, week_id: str) -> dict:
     }
 
 
-def stage2_classify_articles(db: Session, week_id: str, processor: LLMProcessor) -> None:
+class ClassificationSplit(NamedTuple):
+    """Raw articles of a stage 2 batch, by how they get their labels."""
+
+    tips: list[RawArticle]
+    reused: list[RawArticle]
+    duplicates: list[RawArticle]
+    local: list[RawArticle]
+    to_classify: list[RawArticle]
+    audit: dict[int, str]  # Row id -> local section, for rows also sent to the LLM
+
+
+def _split_for_classification(
+    db: Session,
+    week_id: str,
+    raw_articles: list[RawArticle],
+    dedup: Optional[NearDuplicateIndex] = None,
+) -> ClassificationSplit:
+    """
+    Label everything that does not need the LLM classifier.
+
+    Tips sources get their original section, articles already in the
+    seen-article index get their stored labels, and stories published in
+    another period are down-weighted. Near-duplicates of other articles
+    (in this batch or kept in `dedup` from earlier ones) are marked
+    'duplicate', and articles the local classifier is confident about get
+    its labels.
+    """
+    settings = get_settings()
+
+    # Look up labels from earlier periods in the seen-article index
+    seen = {}
+    if settings.seen_index_enabled:
+        seen = lookup_seen(db, [
+            {"content_hash": a.content_hash, "link": a.link, "title": a.title} for a in raw_articles
+        ])
+
+    tips_articles = []
+    reused_articles = []
+    articles_to_classify = []
+
+    for a in raw_articles:
+        entry = seen.get(a.content_hash or content_hash(a.link, a.title))
+        if a.original_section == "tips":
+            # Tips sources skip classification - use original_section directly
+            a.section = "tips"
+            a.relevance = 0.8  # Default high relevance for tips sources
+            a.label_source = "rule"
+            tips_articles.append(a)
+        elif entry and entry.section:
+            # Already classified in an earlier run - reuse the stored labels
+            a.section = entry.section
+            a.relevance = entry.relevance if entry.relevance is not None else 0.5
+            a.label_source = "seen"
+            reused_articles.append(a)
+        else:
+            articles_to_classify.append(a)
+
+        # Down-weight stories that were already published in another period
+        if _published_elsewhere(entry, week_id) and a.section:
+            a.relevance = (a.relevance or 0.5) * settings.seen_published_relevance_factor
+
+    duplicates = []
+    if settings.near_dup_enabled and articles_to_classify:
+        dedup = dedup if dedup is not None else NearDuplicateIndex()
+        for a in reused_articles:
+            dedup.add(a.id, a.title, a.summary)
+        articles_to_classify, duplicates = _drop_near_duplicates(dedup, articles_to_classify)
+
+    local_articles, audit = [], {}
+    if articles_to_classify:
+        local_articles, articles_to_classify, audit = _classify_locally(articles_to_classify)
+
+    return ClassificationSplit(tips_articles, reused_articles, duplicates, local_articles, articles_to_classify, audit)
+
+
+def _classify_locally(
+    raw_articles: list[RawArticle],
+) -> tuple[list[RawArticle], list[RawArticle], dict[int, str]]:
+    """
+    Label the articles the local classifier is confident about.
+
+    Returns:
+        (locally labelled rows, rows for the LLM, audit predictions by row id)
+    """
+    confident, audit, _ = split_confident(_articles_for_llm(raw_articles))
+    local, remaining = [], []
+    for a in raw_articles:
+        if a.id in confident:
+            a.section, a.relevance = confident[a.id]
+            a.label_source = "local"
+            local.append(a)
+        else:
+            remaining.append(a)
+    if local:
+        logger.info(f"Local classifier: {len(local)} labelled locally, {len(remaining)} left for the LLM")
+    return local, remaining, audit
+
+
+def _record_agreement(split: ClassificationSplit, llm_labelled: list[RawArticle]) -> None:
+    """Compare audited local predictions with the LLM labels (as a 'classifier' metric span)."""
+    if not split.local and not split.audit:
+        return
+    audited = agreed = 0
+    for a in llm_labelled:
+        if a.id in split.audit and a.section != "duplicate":
+            audited += 1
+            agreed += a.section == split.audit[a.id]
+    with span("local_classifier", kind=CLASSIFIER, items=len(split.local),
+              local=len(split.local), llm=len(split.to_classify), audited=audited, agreed=agreed):
+        pass
+    if audited:
+        logger.info(f"Local classifier agreement: {agreed}/{audited} audited articles")
+
+
+def _drop_near_duplicates(
+    dedup: NearDuplicateIndex,
+    raw_articles: list[RawArticle],
+) -> tuple[list[RawArticle], list[RawArticle]]:
+    """Keep one representative per near-duplicate cluster; mark the rest 'duplicate'."""
+    priorities = source_priorities()
+
+    def rank(a: RawArticle) -> tuple:
+        raw_data = a.raw_data or {}
+        return (
+            priorities.get(a.source, 1.0),
+            raw_data.get("points") or 0,
+            raw_data.get("comments") or 0,
+            len(a.summary or ""),
+        )
+
+    kept, duplicates = dedup.partition(
+        raw_articles, key=lambda a: a.id, text=lambda a: (a.title, a.summary), rank=rank,
+    )
+    for a in duplicates:
+        a.section = "duplicate"
+        a.relevance = 0.0
+        a.label_source = "duplicate"
+    if duplicates:
+        logger.info(f"Near-duplicates: dropped {len(duplicates)} of {len(raw_articles)} articles before classification")
+    return kept, duplicates
+
+
+def _articles_for_llm(raw_articles: list[RawArticle]) -> list[dict]:
+    """Plain dicts for the classifier (safe to hand to worker threads)."""
+    return [
+        {
+            "id": a.id,
+            "source": a.source,
+            "title": a.title,
+            "summary": a.summary,
+            "link": a.link,
+            "published": a.published,
+            "original_section": a.original_section,
+        }
+        for a in raw_articles
+    ]
+
+
+def _apply_classification(raw_articles: list[RawArticle], classified: Optional[list[dict]]) -> list[RawArticle]:
+    """
+    Copy classifier output onto raw rows.
+
+    With classified=None (classification failed) the original_section hints
+    are used instead. Rows missing from the response, or that fell back to
+    their hints inside the classifier, get the hints too; only rows with an
+    explicit duplicate_of become 'duplicate'.
+
+    Returns:
+        Rows labelled by the classifier (duplicates included); hint-labelled
+        rows are left out so they are not recorded in the seen index
+    """
+    if classified is None:
+        classified = []
+
+    classification_map = {a["id"]: a for a in classified}
+    labelled = []
+    for raw_article in raw_articles:
+        classification = classification_map.get(raw_article.id)
+        if classification is None or classification.get("fallback"):
+            raw_article.section = raw_article.original_section or "tech"
+            raw_article.relevance = 0.5
+            raw_article.label_source = "hint"
+        elif classification.get("duplicate_of") is not None:
+            # Dropped by the classifier as a duplicate of a better article
+            raw_article.section = "duplicate"
+            raw_article.relevance = 0.0
+            raw_article.label_source = "llm"
+            labelled.append(raw_article)
+        else:
+            raw_article.section = classification.get("section") or raw_article.original_section
+            raw_article.relevance = classification.get("relevance", 0.5)
+            raw_article.label_source = "llm"
+            labelled.append(raw_article)
+    missing = sum(1 for a in raw_articles if a.id not in classification_map)
+    if classified and missing:
+        logger.warning(f"Classifier response left out {missing} articles, using their section hints")
+    return labelled
+
+
+def _record_seen_safely(db: Session, week_id: str, raw_articles: list[RawArticle]) -> None:
+    """Update the seen-article index; failures are logged and never fatal."""
+    if not get_settings().seen_index_enabled:
+        return
+    try:
+        record_seen(db, week_id, raw_articles)
+    except Exception as e:
+        logger.warning(f"Failed to update seen-article index (non-fatal): {e}")
+        db.rollback()
+
+
+def stage2_classify_articles(
+    db: Session,
+    week_id: str,
+    processor: LLMProcessor,
+    only_unclassified: bool = False,
+) -> None:
     """
     Stage 2: Classify articles using LLM (skip tips sources).
 
     Tips sources (Reddit, Simon Willison) are inherently tips content,
     so they skip LLM classification and use original_section directly.
+    Articles the classifier flags as duplicates are marked with section
+    'duplicate' so they are neither processed nor classified again.
+    Articles it leaves out keep their original_section hint and are
+    classified again by the next run.
 
     Args:
         db: Database session
         week_id: Week ID
         processor: LLM processor instance
+        only_unclassified: Only classify rows without a section (incremental runs)
     """
     logger.info("=== Stage 2: LLM Classification ===")
 
     # Load raw articles
-    raw_articles = db.query(RawArticle).filter(RawArticle.week_id == week_id).all()
+    query = db.query(RawArticle).filter(RawArticle.week_id == week_id)
+    if only_unclassified:
+        query = query.filter(RawArticle.section.is_(None))
+    raw_articles = query.all()
 
     if not raw_articles:
-        logger.warning("No raw articles found for classification")
+        if only_unclassified:
+            logger.info("No unclassified raw articles, skipping classification")
+        else:
+            logger.warning("No raw articles found for classification")
         return
 
-    # Separate tips articles from articles that need classification
-    tips_articles = []
-    articles_to_classify = []
+    # Incremental runs check new rows against the stories already kept
+    dedup = None
+    if only_unclassified and get_settings().near_dup_enabled:
+        dedup = NearDuplicateIndex()
+        for a in db.query(RawArticle).filter(
+            RawArticle.week_id == week_id,
+            RawArticle.section.in_(["tech", "investment"]),
+        ):
+            dedup.add(a.id, a.title, a.summary)
 
-    for a in raw_articles:
-        if a.original_section == "tips":
-            # Tips sources skip classification - use original_section directly
-            a.section = "tips"
-            a.relevance = 0.8  # Default high relevance for tips sources
-            tips_articles.append(a)
-        else:
-            articles_to_classify.append(a)
+    # Separate tips articles from articles that need classification
+    split = _split_for_classification(db, week_id, raw_articles, dedup)
 
-    logger.info(f"Tips articles (skip classification): {len(tips_articles)}")
-    logger.info(f"Articles to classify: {len(articles_to_classify)}")
+    logger.info(f"Tips articles (skip classification): {len(split.tips)}")
+    logger.info(f"Articles with reused labels (seen index): {len(split.reused)}")
+    logger.info(f"Near-duplicates (skip classification): {len(split.duplicates)}")
+    logger.info(f"Articles labelled by the local classifier: {len(split.local)}")
+    logger.info(f"Articles to classify: {len(split.to_classify)}")
 
     # Only classify non-tips articles
-    if articles_to_classify:
-        articles_for_llm = [
-            {
-                "source": a.source,
-                "title": a.title,
-                "summary": a.summary,
-                "link": a.link,
-                "published": a.published,
-                "original_section": a.original_section,
-            }
-            for a in articles_to_classify
-        ]
-
+    llm_labelled: list[RawArticle] = []
+    if split.to_classify:
+        classified = None
         try:
-            # Classify articles
-            classified = processor.classify_articles(articles_for_llm)
-
-            # Update database with classification results
-            classification_map = {a["title"]: a for a in classified}
-
-            for raw_article in articles_to_classify:
-                classification = classification_map.get(raw_article.title)
-                if classification:
-                    raw_article.section = classification.get("section", raw_article.original_section)
-                    raw_article.relevance = classification.get("relevance", 0.5)
+            classified = processor.classify_articles(_articles_for_llm(split.to_classify))
         except Exception as e:
             logger.error(f"Classification failed, falling back to original_section hints: {e}")
-            for raw_article in articles_to_classify:
-                raw_article.section = raw_article.original_section or "tech"
-                raw_article.relevance = 0.5
+        llm_labelled = _apply_classification(split.to_classify, classified)
+    _record_agreement(split, llm_labelled)
 
     db.commit()
-    logger.info(f"Classification complete: {len(tips_articles)} tips preserved, "
-                f"{len(articles_to_classify)} articles classified")
+    logger.info(f"Classification complete: {len(split.tips)} tips preserved, "
+                f"{len(split.reused)} reused, {len(split.local)} local, "
+                f"{len(split.to_classify)} articles classified")
 
+    # Hint-labelled rows stay out of the seen index so later runs classify them again
+    _record_seen_safely(db, week_id, llm_labelled + split.local + split.tips)
 
-def stage3_parallel_processing(db: Session, week_id: str, processor: LLMProcessor) -> dict:
+
+def stage1_2_stream(
+    db: Session,
+    week_id: str,
+    processor: LLMProcessor,
+    incremental: bool = False,
+) -> dict:
     """
-    Stage 3: Process content in parallel using ThreadPoolExecutor.
+    Stages 1-2 as a streaming pipeline instead of two barriers.
+
+    Source fetchers (HN, each RSS feed, YouTube) are producers that push
+    batches into a bounded queue as soon as they arrive. The calling thread
+    consumes it: week-boundary filtering, dedup and inserts happen per batch,
+    and every `stream_classify_batch_size` new articles are sent to the
+    classifier in a worker thread while other feeds are still downloading.
+    The slowest feed therefore only delays its own articles.
+
+    Only the calling thread touches the database session; classifier threads
+    receive plain dicts. The classifier's duplicate detection works within a
+    batch, while content-hash dedup still covers the whole period.
 
     Args:
         db: Database session
         week_id: Week ID
         processor: LLM processor instance
+        incremental: Keep existing raw rows and insert only new items
 
     Returns:
-        dict with processed data for each section
+        dict with counts of stored and classified items
     """
-    logger.info("=== Stage 3: Parallel LLM Processing ===")
-
     settings = get_settings()
+    logger.info("=== Stages 1-2: Streaming Fetch & Classification ===")
 
-    # Load classified articles
-    raw_articles = db.query(RawArticle).filter(RawArticle.week_id == week_id).all()
+    week_start, week_end = get_week_boundaries(week_id)
+    logger.info(f"Week boundaries: {week_start.strftime('%Y-%m-%d')} to {week_end.strftime('%Y-%m-%d')} (exclusive)")
 
-    # Group by section
-    tech_articles = [
-        {
-            "source": a.source,
-            "title": a.title,
-            "summary": a.summary,
-            "link": a.link,
-            "published": a.published,
-        }
-        for a in raw_articles if a.section == "tech"
-    ]
-    investment_articles = [
-        {
-            "source": a.source,
-            "title": a.title,
-            "summary": a.summary,
-            "link": a.link,
-            "published": a.published,
-        }
-        for a in raw_articles if a.section == "investment"
-    ]
-    tips_articles = [
-        {
-            "source": a.source,
-            "title": a.title,
-            "summary": a.summary,
-            "link": a.link,
-            "published": a.published,
+    known_hashes, known_video_ids = _prepare_raw_data(db, week_id, incremental)
+
+    # Bounded queue: producers block (back-pressure) when the consumer falls behind
+    items: queue.Queue = queue.Queue(maxsize=settings.stream_queue_maxsize)
+    stop = threading.Event()
+
+    def _put(item) -> None:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    fetchers = _source_fetchers(known_video_ids, on_rss_feed=lambda batch: _put(("articles", batch)))
+
+    def _produce(tag: str) -> None:
+        try:
+            data = fetchers[tag]()
+            if tag == "hn":
+                _put(("articles", data))
+            elif tag == "yt":
+                _put(("videos", data))
+            # RSS articles were already streamed feed by feed
+        finally:
+            _put(("done", tag))
+
+    counts = {"articles": 0, "videos": 0, "tips": 0, "reused": 0, "duplicates": 0, "local": 0, "classified": 0}
+    # Near-duplicate clusters span batches: later copies of a kept story are dropped
+    dedup = NearDuplicateIndex() if settings.near_dup_enabled else None
+    pending: list[RawArticle] = []
+    labelled: list[RawArticle] = []
+    in_flight: dict = {}
+
+    def _classify_pending() -> None:
+        split = _split_for_classification(db, week_id, pending, dedup)
+        counts["tips"] += len(split.tips)
+        counts["reused"] += len(split.reused)
+        counts["duplicates"] += len(split.duplicates)
+        counts["local"] += len(split.local)
+        labelled.extend(split.tips + split.local)
+        if split.to_classify:
+            future = submit_with_context(
+                classifiers, LLMProcessor().classify_articles, _articles_for_llm(split.to_classify),
+            )
+            in_flight[future] = split
+        else:
+            _record_agreement(split, [])
+        pending.clear()
+
+    def _collect_classified(wait: bool = False) -> None:
+        for future in [f for f in in_flight if wait or f.done()]:
+            split = in_flight.pop(future)
+            try:
+                classified = future.result()
+            except Exception as e:
+                logger.error(f"Classification batch failed, falling back to original_section hints: {e}")
+                classified = None
+            llm_labelled = _apply_classification(split.to_classify, classified)
+            _record_agreement(split, llm_labelled)
+            counts["classified"] += len(split.to_classify)
+            labelled.extend(llm_labelled)
+        db.flush()
+
+    with ThreadPoolExecutor(max_workers=3) as producers, \
+            ThreadPoolExecutor(max_workers=settings.stream_classify_workers) as classifiers:
+        for tag in fetchers:
+            submit_with_context(producers, _produce, tag)
+
+        try:
+            remaining = len(fetchers)
+            while remaining:
+                try:
+                    kind, payload = items.get(timeout=0.5)
+                except queue.Empty:
+                    _collect_classified()
+                    continue
+
+                if kind == "done":
+                    remaining -= 1
+                    logger.info(f"Source '{payload}' finished ({remaining} still fetching)")
+                elif kind == "articles":
+                    new_articles = _select_new_articles(db, week_id, payload, week_start, week_end, known_hashes)
+                    rows = bulk_insert_raw_articles_returning(
+                        db, [raw_article_values(week_id, a) for a in new_articles]
+                    )
+                    counts["articles"] += len(rows)
+                    pending.extend(rows)
+                    if len(pending) >= settings.stream_classify_batch_size:
+                        _classify_pending()
+                elif kind == "videos":
+                    counts["videos"] += bulk_insert_raw_videos(
+                        db, [raw_video_values(week_id, v) for v in payload]
+                    )
+
+                _collect_classified()
+
+            if pending:
+                _classify_pending()
+            _collect_classified(wait=True)
+        except Exception:
+            stop.set()
+            raise
+
+    db.commit()
+    logger.info(f"Stored {counts['articles']} raw articles and {counts['videos']} raw videos; "
+                f"{counts['tips']} tips preserved, {counts['reused']} reused, "
+                f"{counts['duplicates']} near-duplicates, {counts['local']} labelled locally, "
+                f"{counts['classified']} articles classified")
+
+    _record_seen_safely(db, week_id, labelled)
+
+    # Incremental runs may find rows left unclassified by an earlier fetch-only run
+    if incremental:
+        stage2_classify_articles(db, week_id, processor, only_unclassified=True)
+
+    return counts
+
+
+def compute_candidates_hash(db: Session, week_id: str) -> str:
+    """
+    Fingerprint the stage 3 input set for a period.
+
+    Covers every classified article (by content hash and section) and every
+    raw video, so the hash changes exactly when stage 3 would see a
+    different candidate set.
+    """
+    keys = []
+    rows = db.query(
+        RawArticle.id, RawArticle.content_hash, RawArticle.link, RawArticle.title, RawArticle.section
+    ).filter(
+        RawArticle.week_id == week_id,
+        RawArticle.section.in_(["tech", "investment", "tips"]),
+    )
+    for _, h, link, title, section in rows:
+        keys.append(f"{section}:{h or content_hash(link, title)}")
+    for (vid,) in db.query(RawVideo.video_id).filter(RawVideo.week_id == week_id):
+        keys.append(f"video:{vid}")
+
+    digest = hashlib.sha256()
+    for key in sorted(keys):
+        digest.update(key.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _store_candidates_hash(db: Session, week_id: str, candidates_hash: str) -> None:
+    """Remember which candidate set the saved posts of a period were built from."""
+    week = db.query(Week).filter(Week.id == week_id).first()
+    if week:
+        week.candidates_hash = candidates_hash
+        db.commit()
+
+
+# Stage 3 sections: results key -> LLMProcessor method and output count setting
+SECTION_PROCESSORS = {
+    "tech": ("process_tech_articles", "tech_output_count"),
+    "investment": ("process_investment_articles", "investment_output_count"),
+    "tips": ("process_tips_articles", "tips_output_count"),
+    "videos": ("process_youtube_videos", "video_output_count"),
+}
+
+
+def _empty_section_result(section: str) -> dict:
+    """Fallback result for a section whose processing failed."""
+    if section == "investment":
+        return {
+            "primaryMarket": {"de": [], "en": []},
+            "secondaryMarket": {"de": [], "en": []},
+            "ma": {"de": [], "en": []},
         }
-        for a in raw_articles if a.section == "tips"
-    ]
+    return {"de": [], "en": []}
+
+
+def _load_section_inputs(db: Session, week_id: str) -> dict[str, list[dict]]:
+    """Load classified articles (most relevant first) and videos, grouped by section."""
+    raw_articles = (
+        db.query(RawArticle)
+        .filter(RawArticle.week_id == week_id)
+        .order_by(RawArticle.relevance.desc().nullslast(), RawArticle.id)
+        .all()
+    )
+
+    inputs: dict[str, list[dict]] = {"tech": [], "investment": [], "tips": []}
+    for a in raw_articles:
+        if a.section in inputs:
+            raw_data = a.raw_data or {}
+            inputs[a.section].append({
+                "source": a.source,
+                "title": a.title,
+                "summary": a.summary,
+                "link": a.link,
+                "published": a.published,
+                # Pre-ranking signals (not shown in prompts)
+                "relevance": a.relevance,
+                "points": raw_data.get("points"),
+                "comments": raw_data.get("comments"),
+            })
 
-    # Load raw videos
     raw_videos = db.query(RawVideo).filter(RawVideo.week_id == week_id).all()
-    videos_for_llm = [v.raw_data for v in raw_videos if v.raw_data]
+    inputs["videos"] = [v.video_data for v in raw_videos if v.raw_data]
 
-    logger.info(f"Processing: tech={len(tech_articles)}, investment={len(investment_articles)}, "
-                f"tips={len(tips_articles)}, videos={len(videos_for_llm)}")
+    logger.info(f"Processing: tech={len(inputs['tech'])}, investment={len(inputs['investment'])}, "
+                f"tips={len(inputs['tips'])}, videos={len(inputs['videos'])}")
+    return inputs
 
-    results = {}
 
+def _process_section(section: str, items: list[dict]) -> dict:
+    """Run the LLM processor for one section; failures yield an empty result."""
+    method_name, count_setting = SECTION_PROCESSORS[section]
     # BUG-H3: Create per-thread LLMProcessor instances to avoid thread-safety issues
     # The OpenAI client may not be thread-safe, so each thread gets its own instance
-    def process_tech():
-        thread_processor = LLMProcessor()
-        return thread_processor.process_tech_articles(tech_articles, count=settings.tech_output_count)
-
-    def process_investment():
-        thread_processor = LLMProcessor()
-        return thread_processor.process_investment_articles(
-            investment_articles,
-            count=settings.investment_output_count,
-        )
+    thread_processor = LLMProcessor()
+    settings = get_settings()
+    count = getattr(settings, count_setting)
+    try:
+        if settings.map_reduce_enabled:
+            items = map_reduce_candidates(section, items, count)
+        if settings.prerank_enabled:
+            items = shortlist(section, items, count)
+        return getattr(thread_processor, method_name)(items, count=count)
+    except Exception as e:
+        logger.error(f"Error processing {section}: {e}")
+        return _empty_section_result(section)
 
-    def process_tips():
-        thread_processor = LLMProcessor()
-        return thread_processor.process_tips_articles(
-            tips_articles,
-            count=settings.tips_output_count,
-        )
 
-    def process_videos():
-        thread_processor = LLMProcessor()
-        return thread_processor.process_youtube_videos(videos_for_llm, count=settings.video_output_count)
+def stage3_parallel_processing(db: Session, week_id: str, processor: LLMProcessor) -> dict:
+    """
+    Stage 3: Process content in parallel using ThreadPoolExecutor.
+
+    Args:
+        db: Database session
+        week_id: Week ID
+        processor: LLM processor instance
+
+    Returns:
+        dict with processed data for each section
+    """
+    logger.info("=== Stage 3: Parallel LLM Processing ===")
+
+    settings = get_settings()
+    inputs = _load_section_inputs(db, week_id)
+    results = {}
 
     # Run in parallel with ThreadPoolExecutor
     with ThreadPoolExecutor(max_workers=settings.llm_max_workers) as executor:
         futures = {
-            executor.submit(process_tech): "tech",
-            executor.submit(process_investment): "investment",
-            executor.submit(process_tips): "tips",
-            executor.submit(process_videos): "videos",
+            submit_with_context(executor, _process_section, section, inputs[section]): section
+            for section in SECTION_PROCESSORS
         }
 
         for future in as_completed(futures):
             task_name = futures[future]
-            try:
-                results[task_name] = future.result()
-                logger.info(f"Completed: {task_name}")
-            except Exception as e:
-                logger.error(f"Error processing {task_name}: {e}")
-                # Provide fallback empty results
-                if task_name == "investment":
-                    results[task_name] = {
-                        "primaryMarket": {"de": [], "en": []},
-                        "secondaryMarket": {"de": [], "en": []},
-                        "ma": {"de": [], "en": []},
-                    }
-                else:
-                    results[task_name] = {"de": [], "en": []}
+            results[task_name] = future.result()
+            logger.info(f"Completed: {task_name}")
 
     # Generate trends (depends on tech and investment results)
     logger.info("Generating trends...")
-    results["trends"] = processor.generate_trends(
+    results["trends"] = _generate_trends(
+        week_id,
         results.get("tech", {"de": [], "en": []}),
-        results.get("investment", {})
+        results.get("investment", {}),
+        processor,
     )
 
     return results
 
 
-def _build_translation_tasks(results: dict) -> list:
-    """Build list of (section_name, en_items, fields_to_translate, field_name_map).
+def _generate_trends(week_id: str, tech_data: dict, investment_data: dict,
+                     processor: Optional[LLMProcessor] = None) -> dict:
+    """Trends of a period: extracted locally, or one LLM call if LOCAL_TRENDS_ENABLED is off."""
+    if get_settings().local_trends_enabled:
+        return generate_local_trends(week_id, tech_data, investment_data)
+    return (processor or LLMProcessor()).generate_trends(tech_data, investment_data)
 
-    field_name_map converts LLM output keys (camelCase) to DB column names (snake_case).
-    """
-    tasks: list[tuple] = []
 
-    # Tech
-    en_tech = results.get("tech", {}).get("en", [])
-    if en_tech:
-        tasks.append(("tech", en_tech, ["content", "category", "tags"], {}))
+# Translation task name -> (results key, fields to translate, field_name_map)
+# field_name_map converts LLM output keys (camelCase) to DB column names (snake_case).
+TRANSLATION_SPECS = {
+    "tech": ("tech", ["content", "category", "tags"], {}),
+    "video": ("videos", ["title", "summary"], {}),
+    "tip": ("tips", ["content", "tip", "category", "difficulty"], {}),
+    "primary_market": ("investment", ["content", "amount", "valuation"], {}),
+    "secondary_market": ("investment", ["content"], {}),
+    "ma": ("investment", ["content", "dealValue", "dealType"],
+           {"dealValue": "deal_value", "dealType": "deal_type"}),
+    "trend": ("trends", ["category", "title"], {}),
+}
 
-    # Videos
-    en_videos = results.get("videos", {}).get("en", [])
-    if en_videos:
-        tasks.append(("video", en_videos, ["title", "summary"], {}))
+# Investment translation tasks -> subcategory key in the investment results
+_INVESTMENT_SUBKEYS = {"primary_market": "primaryMarket", "secondary_market": "secondaryMarket", "ma": "ma"}
 
-    # Tips
-    en_tips = results.get("tips", {}).get("en", [])
-    if en_tips:
-        tasks.append(("tip", en_tips, ["content", "tip", "category", "difficulty"], {}))
-
-    # Investment subcategories
-    inv = results.get("investment", {})
-    if isinstance(inv, dict):
-        pm = inv.get("primaryMarket", {})
-        en_pm = pm.get("en", []) if isinstance(pm, dict) else []
-        if en_pm:
-            tasks.append(("primary_market", en_pm, ["content", "amount", "valuation"], {}))
-
-        sm = inv.get("secondaryMarket", {})
-        en_sm = sm.get("en", []) if isinstance(sm, dict) else []
-        if en_sm:
-            tasks.append(("secondary_market", en_sm, ["content"], {}))
-
-        ma = inv.get("ma", {})
-        en_ma = ma.get("en", []) if isinstance(ma, dict) else []
-        if en_ma:
-            tasks.append(("ma", en_ma, ["content", "dealValue", "dealType"],
-                         {"dealValue": "deal_value", "dealType": "deal_type"}))
 
-    # Trends
-    trends = results.get("trends", {})
-    if isinstance(trends, dict):
-        trends_section = trends.get("trends", {})
-        en_trends = trends_section.get("en", []) if isinstance(trends_section, dict) else []
-        if en_trends:
-            tasks.append(("trend", en_trends, ["category", "title"], {}))
+def _translation_items(task_name: str, section_result) -> list:
+    """EN items of one translation task, taken from its section's stage 3 result."""
+    if not isinstance(section_result, dict):
+        return []
+    if task_name in _INVESTMENT_SUBKEYS:
+        section_result = section_result.get(_INVESTMENT_SUBKEYS[task_name], {})
+    elif task_name == "trend":
+        section_result = section_result.get("trends", {})
+    return section_result.get("en", []) if isinstance(section_result, dict) else []
+
 
+def _build_translation_tasks(results: dict) -> list:
+    """Build list of (section_name, en_items, fields_to_translate, field_name_map)."""
+    tasks: list[tuple] = []
+    for task_name, (results_key, fields, name_map) in TRANSLATION_SPECS.items():
+        items = _translation_items(task_name, results.get(results_key, {}))
+        if items:
+            tasks.append((task_name, items, fields, name_map))
     return tasks
 
 
+def _translate_items(
+    items: list,
+    target_lang: str,
+    fields: list[str],
+    name_map: dict,
+    label: Optional[str] = None,
+) -> list[dict]:
+    """Translate items into one language; returns per-item dicts keyed by DB field name."""
+    thread_processor = LLMProcessor()
+    with span(label or target_lang, kind=TRANSLATION, items=len(items)):
+        translated = thread_processor.translate_batch(items, target_lang, fields)
+    return [
+        {name_map.get(k, k): v for k, v in entry.items()} if entry else {}
+        for entry in translated[:len(items)]
+    ]
+
+
+def _apply_translations(items: list, target_lang: str, translated: list[dict]) -> None:
+    """Attach one language's translations to the EN items under ``_translations``."""
+    for item, mapped in zip(items, translated):
+        if mapped and isinstance(item, dict):
+            item.setdefault("_translations", {})[target_lang] = mapped
+
+
 def stage3_5_translate_content(results: dict) -> dict:
     """
     Stage 3.5: Translate EN content to 6 additional languages using free models.
@@ -735,36 +1229,21 @@ def stage3_5_translate_content(results: dict) -> dict:
     logger.info(f"Translating {total_items} items across {len(translation_tasks)} sections "
                 f"into {len(TRANSLATION_LANGUAGES)} languages")
 
-    def do_translate(section_idx: int, target_lang: str):
-        section_name, items, fields, name_map = translation_tasks[section_idx]
-        thread_processor = LLMProcessor()
-        translated = thread_processor.translate_batch(items, target_lang, fields)
-
-        for i, item in enumerate(items):
-            if i < len(translated) and translated[i] and isinstance(item, dict):
-                mapped = {}
-                for k, v in translated[i].items():
-                    db_name = name_map.get(k, k)
-                    mapped[db_name] = v
-                item["_translations"][target_lang] = mapped
-
-    # Run translations in parallel (3 workers to respect free model rate limits)
-    work_units = [
-        (si, lang)
-        for si in range(len(translation_tasks))
-        for lang in TRANSLATION_LANGUAGES
-    ]
-
-    with ThreadPoolExecutor(max_workers=3) as executor:
+    # Run translations in parallel (limited workers to respect free model rate limits)
+    with ThreadPoolExecutor(max_workers=get_settings().translation_max_workers) as executor:
         futures = {}
-        for si, lang in work_units:
-            future = executor.submit(do_translate, si, lang)
-            futures[future] = f"{translation_tasks[si][0]}→{lang}"
+        for section_name, items, fields, name_map in translation_tasks:
+            for lang in TRANSLATION_LANGUAGES:
+                future = submit_with_context(
+                    executor, _translate_items, items, lang, fields, name_map, f"{section_name}:{lang}"
+                )
+                futures[future] = (section_name, items, lang)
 
         for future in as_completed(futures):
-            task_name = futures[future]
+            section_name, items, lang = futures[future]
+            task_name = f"{section_name}→{lang}"
             try:
-                future.result()
+                _apply_translations(items, lang, future.result())
                 logger.info(f"Translation done: {task_name}")
             except Exception as e:
                 logger.warning(f"Translation failed (skipping): {task_name}: {e}")
@@ -773,10 +1252,37 @@ def stage3_5_translate_content(results: dict) -> dict:
     return results
 
 
+def _ma_post_values(week_id: str, de_p: dict, en_p: dict) -> dict:
+    """Column values for an MAPost from a DE/EN post pair."""
+    return dict(
+        week_id=week_id,
+        content_de=de_p.get("content", ""),
+        content_en=en_p.get("content", ""),
+        acquirer=de_p.get("acquirer", ""),
+        target=de_p.get("target", ""),
+        deal_value_de=de_p.get("dealValue"),
+        deal_value_en=en_p.get("dealValue"),
+        deal_type_de=de_p.get("dealType", ""),
+        deal_type_en=en_p.get("dealType", ""),
+        industry=de_p.get("industry") or en_p.get("industry"),
+        author=de_p.get("author", {}),
+        timestamp=de_p.get("timestamp", ""),
+        source_url=de_p.get("sourceUrl"),
+        metrics=de_p.get("metrics", {}),
+        translations=en_p.get("_translations") or None,
+    )
+
+
 def stage4_save_to_database(db: Session, week_id: str, results: dict, raw_videos: list) -> None:
     """
     Stage 4: Save processed data to database.
 
+    Runs as a single transaction with a fixed number of statements: one
+    DELETE per content table, one INSERT ... ON CONFLICT (video_id) DO NOTHING
+    for videos and one bulk INSERT per section, independent of post count.
+    Videos that already belong to another period are left untouched (the
+    video_id is globally unique) and get no video post in this period.
+
     Args:
         db: Database session
         week_id: Week ID
@@ -788,9 +1294,6 @@ def stage4_save_to_database(db: Session, week_id: str, results: dict, raw_videos
     """
     logger.info("=== Stage 4: Saving to Database ===")
 
-    # Clear existing processed data
-    clear_week_data(db, week_id)
-
     tech_data = results.get("tech", {"de": [], "en": []})
     video_data = results.get("videos", {"de": [], "en": []})
     investment_data = results.get("investment", {})
@@ -800,25 +1303,19 @@ def stage4_save_to_database(db: Session, week_id: str, results: dict, raw_videos
     # Build video lookup for metadata
     video_lookup = {v.video_id: v for v in raw_videos}
 
-    # Save videos (skip duplicates due to global unique constraint on video_id)
-    video_posts = []
-    skipped_videos = 0
+    # Build video rows (and their tech feed posts) keyed by video_id
+    video_rows = {}
+    video_post_rows = {}
     logger.info(f"Saving {len(video_data.get('de', []))} video posts to database")
-    for i, (de_v, en_v) in enumerate(zip(video_data.get("de", []), video_data.get("en", []))):
+    for de_v, en_v in zip(video_data.get("de", []), video_data.get("en", [])):
         vid = de_v.get("video_id") or en_v.get("video_id")
-        if not vid:
-            continue
-
-        # Check if video already exists (from another week)
-        existing_video = db.query(Video).filter(Video.video_id == vid).first()
-        if existing_video:
-            skipped_videos += 1
+        if not vid or vid in video_rows:
             continue
 
         raw_video = video_lookup.get(vid)
         meta = raw_video.raw_data if raw_video else {}
 
-        video = Video(
+        video_rows[vid] = dict(
             week_id=week_id,
             video_id=vid,
             title_de=de_v.get("title", ""),
@@ -838,7 +1335,6 @@ def stage4_save_to_database(db: Session, week_id: str, results: dict, raw_videos
             category=de_v.get("category") or en_v.get("category"),
             translations=en_v.get("_translations") or None,
         )
-        db.add(video)
 
         # Create video post for tech feed
         # Map video translations (summary→content) for TechPost
@@ -849,7 +1345,7 @@ def stage4_save_to_database(db: Session, week_id: str, results: dict, raw_videos
             for lang, fields in video_trans.items():
                 tech_video_trans[lang] = {"content": fields.get("summary", "")}
 
-        video_post = TechPost(
+        video_post_rows[vid] = dict(
             week_id=week_id,
             content_de=de_v.get("summary", ""),
             content_en=en_v.get("summary", ""),
@@ -871,16 +1367,11 @@ def stage4_save_to_database(db: Session, week_id: str, results: dict, raw_videos
             video_thumbnail_url=meta.get("thumbnail_url"),
             translations=tech_video_trans,
         )
-        video_posts.append(video_post)
 
-    if skipped_videos > 0:
-        logger.info(f"Skipped {skipped_videos} videos (already exist in other weeks)")
-    logger.info(f"Created {len(video_posts)} video TechPost entries")
-
-    # Save tech posts with interspersed videos
+    # Regular tech posts
     regular_posts = []
-    for i, (de_p, en_p) in enumerate(zip(tech_data.get("de", []), tech_data.get("en", []))):
-        post = TechPost(
+    for de_p, en_p in zip(tech_data.get("de", []), tech_data.get("en", [])):
+        regular_posts.append(dict(
             week_id=week_id,
             content_de=de_p.get("content", ""),
             content_en=en_p.get("content", ""),
@@ -896,22 +1387,19 @@ def stage4_save_to_database(db: Session, week_id: str, results: dict, raw_videos
             source_url=de_p.get("sourceUrl"),
             metrics=de_p.get("metrics", {}),
             is_video=False,
+            video_id=None,
+            video_duration=None,
+            video_view_count=None,
+            video_thumbnail_url=None,
             translations=en_p.get("_translations") or None,
-        )
-        regular_posts.append(post)
-
-    # Intersperse videos among regular posts
-    all_tech_posts = intersperse_videos(regular_posts, video_posts)
-
-    for i, post in enumerate(all_tech_posts):
-        post.display_order = i
-        db.add(post)
-
-    # Save investment posts
-    for category, model_class, de_key, en_key in [
-        ("primaryMarket", PrimaryMarketPost, "de", "en"),
-        ("secondaryMarket", SecondaryMarketPost, "de", "en"),
-        ("ma", MAPost, "de", "en"),
+        ))
+
+    # Investment posts
+    section_rows: dict[type, list[dict]] = {PrimaryMarketPost: [], SecondaryMarketPost: [], MAPost: []}
+    for category, model_class in [
+        ("primaryMarket", PrimaryMarketPost),
+        ("secondaryMarket", SecondaryMarketPost),
+        ("ma", MAPost),
     ]:
         cat_data = investment_data.get(category, {})
         # Handle case where LLM returned a list instead of dict
@@ -926,7 +1414,7 @@ def stage4_save_to_database(db: Session, week_id: str, results: dict, raw_videos
         for de_p, en_p in zip(de_posts, en_posts):
             if model_class == PrimaryMarketPost:
                 # Use default values instead of skipping entries without amount
-                post = PrimaryMarketPost(
+                row = dict(
                     week_id=week_id,
                     content_de=de_p.get("content", ""),
                     content_en=en_p.get("content", ""),
@@ -947,7 +1435,7 @@ def stage4_save_to_database(db: Session, week_id: str, results: dict, raw_videos
             elif model_class == SecondaryMarketPost:
                 # Note: price, change, marketCap are now fetched from real-time API
                 # We only store ticker and content from LLM processing
-                post = SecondaryMarketPost(
+                row = dict(
                     week_id=week_id,
                     content_de=de_p.get("content", ""),
                     content_en=en_p.get("content", ""),
@@ -964,28 +1452,12 @@ def stage4_save_to_database(db: Session, week_id: str, results: dict, raw_videos
                     translations=en_p.get("_translations") or None,
                 )
             else:  # MAPost
-                post = MAPost(
-                    week_id=week_id,
-                    content_de=de_p.get("content", ""),
-                    content_en=en_p.get("content", ""),
-                    acquirer=de_p.get("acquirer", ""),
-                    target=de_p.get("target", ""),
-                    deal_value_de=de_p.get("dealValue"),
-                    deal_value_en=en_p.get("dealValue"),
-                    deal_type_de=de_p.get("dealType", ""),
-                    deal_type_en=en_p.get("dealType", ""),
-                    industry=de_p.get("industry") or en_p.get("industry"),
-                    author=de_p.get("author", {}),
-                    timestamp=de_p.get("timestamp", ""),
-                    source_url=de_p.get("sourceUrl"),
-                    metrics=de_p.get("metrics", {}),
-                    translations=en_p.get("_translations") or None,
-                )
-            db.add(post)
+                row = _ma_post_values(week_id, de_p, en_p)
+            section_rows[model_class].append(row)
 
-    # Save tips
-    for de_p, en_p in zip(tips_data.get("de", []), tips_data.get("en", [])):
-        post = TipPost(
+    # Tips
+    section_rows[TipPost] = [
+        dict(
             week_id=week_id,
             content_de=de_p.get("content", ""),
             content_en=en_p.get("content", ""),
@@ -1002,9 +1474,10 @@ def stage4_save_to_database(db: Session, week_id: str, results: dict, raw_videos
             metrics=de_p.get("metrics", {}),
             translations=en_p.get("_translations") or None,
         )
-        db.add(post)
+        for de_p, en_p in zip(tips_data.get("de", []), tips_data.get("en", []))
+    ]
 
-    # Save trends
+    # Trends
     trends_section = trends_data.get("trends", {})
     if isinstance(trends_section, dict):
         de_trends = trends_section.get("de", [])
@@ -1013,10 +1486,8 @@ def stage4_save_to_database(db: Session, week_id: str, results: dict, raw_videos
         de_trends = []
         en_trends = []
 
-    for de_t, en_t in zip(de_trends, en_trends):
-        if not isinstance(de_t, dict) or not isinstance(en_t, dict):
-            continue
-        trend = Trend(
+    section_rows[Trend] = [
+        dict(
             week_id=week_id,
             category_de=de_t.get("category", ""),
             category_en=en_t.get("category", ""),
@@ -1025,31 +1496,60 @@ def stage4_save_to_database(db: Session, week_id: str, results: dict, raw_videos
             posts=de_t.get("posts"),
             translations=en_t.get("_translations") or None,
         )
-        db.add(trend)
-
-    # Save/update team members
-    existing_members = db.query(TeamMember).all()
-    if not existing_members:
-        team_section = trends_data.get("teamMembers", {})
-        if isinstance(team_section, dict):
-            de_members = team_section.get("de", [])
-            en_members = team_section.get("en", [])
-        else:
-            de_members = []
-            en_members = []
-
-        for de_m, en_m in zip(de_members, en_members):
-            member = TeamMember(
-                name=de_m.get("name", ""),
-                role_de=de_m.get("role", ""),
-                role_en=en_m.get("role", ""),
-                handle=de_m.get("handle", ""),
-                avatar=de_m.get("avatar", ""),
-            )
-            db.add(member)
+        for de_t, en_t in zip(de_trends, en_trends)
+        if isinstance(de_t, dict) and isinstance(en_t, dict)
+    ]
 
     # BUG-H4: Add transaction rollback handling
     try:
+        # Clear existing processed data (same transaction)
+        clear_week_data(db, week_id, commit=False)
+
+        # Insert videos; ones already stored for another period are skipped
+        inserted_videos = set()
+        if video_rows:
+            stmt = pg_insert(Video).values(list(video_rows.values()))
+            stmt = stmt.on_conflict_do_nothing(index_elements=[Video.video_id]).returning(Video.video_id)
+            inserted_videos = set(db.scalars(stmt))
+        skipped_videos = len(video_rows) - len(inserted_videos)
+        if skipped_videos > 0:
+            logger.info(f"Skipped {skipped_videos} videos (already exist in other weeks)")
+
+        # Intersperse video posts among regular posts, in stage 3 order
+        video_posts = [row for vid, row in video_post_rows.items() if vid in inserted_videos]
+        logger.info(f"Created {len(video_posts)} video TechPost entries")
+        all_tech_posts = intersperse_videos(regular_posts, video_posts)
+        for i, row in enumerate(all_tech_posts):
+            row["display_order"] = i
+        section_rows[TechPost] = all_tech_posts
+
+        for model_class, rows in section_rows.items():
+            if rows:
+                db.execute(insert(model_class), rows)
+
+        # Save team members (only once, when none exist yet)
+        if not db.query(TeamMember.id).first():
+            team_section = trends_data.get("teamMembers", {})
+            if isinstance(team_section, dict):
+                de_members = team_section.get("de", [])
+                en_members = team_section.get("en", [])
+            else:
+                de_members = []
+                en_members = []
+
+            member_rows = [
+                dict(
+                    name=de_m.get("name", ""),
+                    role_de=de_m.get("role", ""),
+                    role_en=en_m.get("role", ""),
+                    handle=de_m.get("handle", ""),
+                    avatar=de_m.get("avatar", ""),
+                )
+                for de_m, en_m in zip(de_members, en_members)
+            ]
+            if member_rows:
+                db.execute(insert(TeamMember), member_rows)
+
         db.commit()
         logger.info(f"Saved processed data for {week_id}")
     except Exception as e:
@@ -1057,14 +1557,28 @@ def stage4_save_to_database(db: Session, week_id: str, results: dict, raw_videos
         db.rollback()
         raise
 
+    # Remember which stories ran so later periods can skip or down-weight them
+    if get_settings().seen_index_enabled:
+        published_urls = [p.get("sourceUrl") for p in tech_data.get("de", []) + tips_data.get("de", [])]
+        for category in ("primaryMarket", "secondaryMarket", "ma"):
+            cat_data = investment_data.get(category, {})
+            if isinstance(cat_data, dict):
+                published_urls.extend(p.get("sourceUrl") for p in cat_data.get("de", []) if isinstance(p, dict))
+        try:
+            mark_published(db, week_id, published_urls)
+        except Exception as e:
+            logger.warning(f"Failed to mark published articles (non-fatal): {e}")
+            db.rollback()
+
 
-def run_fetch_only(db: Session, week_id: Optional[str] = None) -> dict:
+def run_fetch_only(db: Session, week_id: Optional[str] = None, incremental: bool = False) -> dict:
     """
     Run only Stage 1: Fetch and store raw data.
 
     Args:
         db: Database session
         week_id: Week ID or None for current week
+        incremental: Keep existing raw rows and insert only new items
 
     Returns:
         dict with fetch statistics
@@ -1072,7 +1586,7 @@ def run_fetch_only(db: Session, week_id: Optional[str] = None) -> dict:
     week_id = week_id or current_day_id()
     logger.info(f"Starting fetch-only for {week_id}")
 
-    return stage1_fetch_and_store(db, week_id)
+    return stage1_fetch_and_store(db, week_id, incremental=incremental)
 
 
 def run_process_only(db: Session, week_id: Optional[str] = None) -> dict:
@@ -1106,10 +1620,11 @@ def run_process_only(db: Session, week_id: Optional[str] = None) -> dict:
     stage3_5_translate_content(results)
 
     # Load raw videos for metadata
-    raw_videos = db.query(RawVideo).filter(RawVideo.week_id == week_id).all()
+    raw_videos = db.query(RawVideo).options(undefer(RawVideo.transcript)).filter(RawVideo.week_id == week_id).all()
 
     # Stage 4: Save to database
     stage4_save_to_database(db, week_id, results, raw_videos)
+    _store_candidates_hash(db, week_id, compute_candidates_hash(db, week_id))
 
     return {
         "week_id": week_id,
@@ -1120,40 +1635,200 @@ def run_process_only(db: Session, week_id: Optional[str] = None) -> dict:
     }
 
 
-def run_collection(db: Session, week_id: Optional[str] = None):
+def _build_collection_graph(
+    db: Session,
+    run,
+    week_id: str,
+    processor: LLMProcessor,
+    incremental: bool,
+) -> TaskGraph:
     """
-    Run the full data collection pipeline (all stages).
+    Express the collection pipeline as a task DAG.
 
-    Args:
-        db: Database session
-        week_id: Week ID or None for current week
+        fetch -> classify -> load -> process:<section> -> translate:<task>:<lang>
+                                   process:tech + process:investment -> trends -> translate:trend:<lang>
+        everything -> save
+
+    Database work (fetch, classify, load, save) runs inline on the calling
+    thread; LLM processing and translation run on worker threads limited by
+    the "llm" and "translate" resources. Every node checkpoints its result
+    as a collection artifact named after the node, so a resumed run restores
+    finished nodes instead of recomputing them.
     """
-    week_id = week_id or current_day_id()
+    from app.services.i18n_utils import TRANSLATION_LANGUAGES
 
-    logger.info(f"Starting full collection for {week_id}")
+    settings = get_settings()
+    graph = TaskGraph(
+        limits={"llm": settings.llm_max_workers, "translate": settings.translation_max_workers},
+        name=f"collect-{week_id}",
+    )
 
-    # Stage 1: Fetch and store raw data
-    stage1_fetch_and_store(db, week_id)
+    def checkpoint(name: str):
+        return lambda result: save_artifact(db, run, name, result)
+
+    # Stages 1-2: Fetch, store and classify (streamed unless disabled)
+    def fetch(_):
+        if settings.stream_pipeline_enabled:
+            counts = stage1_2_stream(db, week_id, processor, incremental=incremental)
+            counts["classified_while_streaming"] = True
+            return counts
+        return stage1_fetch_and_store(db, week_id, incremental=incremental)
+
+    def classify(inputs):
+        if not inputs["fetch"].get("classified_while_streaming"):
+            stage2_classify_articles(db, week_id, processor, only_unclassified=incremental)
+        return {"candidates_hash": compute_candidates_hash(db, week_id)}
+
+    def load(inputs):
+        candidates_hash = inputs["classify"]["candidates_hash"]
+        if incremental:
+            week = db.query(Week).filter(Week.id == week_id).first()
+            if week and week.candidates_hash == candidates_hash:
+                logger.info(f"Candidate set unchanged for {week_id}, skipping stages 3-4")
+                graph.stop()
+        return _load_section_inputs(db, week_id)
+
+    graph.add("fetch", fetch, on_done=checkpoint("fetch"))
+    graph.add("classify", classify, deps=["fetch"], on_done=checkpoint("classify"))
+    graph.add("load", load, deps=["classify"])
+
+    # Stage 3: one node per section
+    for section in SECTION_PROCESSORS:
+        graph.add(
+            f"process:{section}",
+            lambda inputs, section=section: _process_section(section, inputs["load"][section]),
+            deps=["load"],
+            resource="llm",
+            on_done=checkpoint(f"process:{section}"),
+        )
 
-    # Initialize LLM processor
-    processor = LLMProcessor()
+    # Local trends only need the "llm" resource for the optional title polish
+    local_trends = settings.local_trends_enabled and not settings.trends_llm_polish
+    graph.add(
+        "trends",
+        lambda inputs: _generate_trends(week_id, inputs["process:tech"], inputs["process:investment"]),
+        deps=["process:tech", "process:investment"],
+        resource=None if local_trends else "llm",
+        on_done=checkpoint("trends"),
+    )
 
-    # Stage 2: Classification
-    stage2_classify_articles(db, week_id, processor)
+    # Stage 3.5: one node per translation task and language
+    translate_nodes = []
+    for task_name, (results_key, fields, name_map) in TRANSLATION_SPECS.items():
+        source = "trends" if results_key == "trends" else f"process:{results_key}"
+        for lang in TRANSLATION_LANGUAGES:
+            node = f"translate:{task_name}:{lang}"
+
+            def translate(inputs, task_name=task_name, source=source, lang=lang, fields=fields, name_map=name_map):
+                items = _translation_items(task_name, inputs[source])
+                if not items:
+                    return []
+                try:
+                    return _translate_items(items, lang, fields, name_map, f"{task_name}:{lang}")
+                except Exception as e:
+                    logger.warning(f"Translation failed (skipping): {task_name}→{lang}: {e}")
+                    return []
+
+            graph.add(node, translate, deps=[source], resource="translate", on_done=checkpoint(node))
+            translate_nodes.append((node, task_name, source, lang))
+
+    # Stage 4: assemble results, attach translations and save
+    def save(inputs):
+        results = {section: inputs[f"process:{section}"] for section in SECTION_PROCESSORS}
+        results["trends"] = inputs["trends"]
+        for node, task_name, source, lang in translate_nodes:
+            results_key = TRANSLATION_SPECS[task_name][0]
+            _apply_translations(_translation_items(task_name, results[results_key]), lang, inputs[node])
+
+        raw_videos = db.query(RawVideo).options(undefer(RawVideo.transcript)).filter(RawVideo.week_id == week_id).all()
+        candidates_hash = inputs["classify"]["candidates_hash"]
+        stage4_save_to_database(db, week_id, results, raw_videos)
+        _store_candidates_hash(db, week_id, candidates_hash)
+        return {"candidates_hash": candidates_hash}
+
+    graph.add(
+        "save",
+        save,
+        deps=["classify", "trends"] + [f"process:{s}" for s in SECTION_PROCESSORS] + [n[0] for n in translate_nodes],
+        on_done=checkpoint("save"),
+    )
+    return graph
 
-    # Stage 3: Parallel processing
-    results = stage3_parallel_processing(db, week_id, processor)
 
-    # Stage 3.5: Translate EN content to 6 additional languages
-    stage3_5_translate_content(results)
+def run_collection(
+    db: Session,
+    week_id: Optional[str] = None,
+    incremental: bool = False,
+    resume: bool = False,
+    run_id: Optional[int] = None,
+) -> Optional[int]:
+    """
+    Run the full data collection pipeline (all stages).
 
-    # Load raw videos for metadata
-    raw_videos = db.query(RawVideo).filter(RawVideo.week_id == week_id).all()
+    The stages run as a task DAG (see _build_collection_graph), so e.g. tech
+    translations start as soon as tech processing finishes instead of
+    waiting for every section and the trends.
 
-    # Stage 4: Save to database
-    stage4_save_to_database(db, week_id, results, raw_videos)
+    Incremental runs keep the period's raw rows, insert only new items,
+    classify only unclassified rows and skip stages 3-4 entirely when the
+    classified candidate set is unchanged since the last save.
+
+    Every completed node is checkpointed to ``collection_artifacts``. With
+    ``resume=True`` the latest unfinished run for the period (or ``run_id``)
+    continues from its checkpoints instead of starting over.
+
+    Args:
+        db: Database session
+        week_id: Week ID or None for current week
+        incremental: Re-collect on top of existing raw data instead of starting over
+        resume: Continue an unfinished run instead of starting a new one
+        run_id: Specific run to resume (implies resume)
+
+    Returns:
+        ID of the collection run
+
+    Raises:
+        ValueError: If resume is requested but no unfinished run exists
+    """
+    if resume or run_id is not None:
+        run = find_resumable_run(db, period_id=week_id, run_id=run_id)
+        if not run:
+            raise ValueError(f"No unfinished collection run to resume for {week_id or run_id or 'any period'}")
+        if not claim_run(db, run):
+            raise ValueError(f"Collection run {run.id} is already being resumed")
+        week_id = run.period_id
+        incremental = run.incremental
+        done = completed_stages(db, run)
+        logger.info(f"Resuming run {run.id} for {week_id}, completed stages: {sorted(done) or 'none'}")
+    else:
+        week_id = week_id or current_day_id()
+        run = start_run(db, week_id, incremental=incremental)
+        done = set()
+        logger.info(f"Starting {'incremental' if incremental else 'full'} collection for {week_id}")
 
-    logger.info(f"Collection complete for {week_id}")
+    with recording(run.id) as recorder, RunHeartbeat(run.id):
+        try:
+            graph = _build_collection_graph(db, run, week_id, LLMProcessor(), incremental)
+            for name in done:
+                if name in graph.tasks:
+                    graph.complete(name, load_artifact(db, run, name))
+            graph.run()
+        except KeyboardInterrupt:
+            db.rollback()
+            save_run_metrics(db, run.id, recorder)
+            finish_run(db, run, "interrupted")
+            raise
+        except Exception as e:
+            db.rollback()
+            save_run_metrics(db, run.id, recorder)
+            finish_run(db, run, "failed", error=str(e))
+            raise
+        # Metrics first: a run marked completed always has its metrics
+        save_run_metrics(db, run.id, recorder)
+        finish_run(db, run, "completed")
+
+    logger.info(f"Collection complete for {week_id} (run {run.id})")
+    return run.id
 
 
 def stage4_save_ma_to_database(db: Session, week_id: str, investment_data: dict) -> None:
@@ -1161,30 +1836,15 @@ def stage4_save_ma_to_database(db: Session, week_id: str, investment_data: dict)
     logger.info("=== Stage 4 (M&A only): Saving to Database ===")
 
     # Clear existing M&A posts for the week
-    db.query(MAPost).filter(MAPost.week_id == week_id).delete()
+    db.execute(delete(MAPost).where(MAPost.week_id == week_id))
 
     ma_data = investment_data.get("ma", {}) if isinstance(investment_data, dict) else {}
     de_posts = ma_data.get("de", []) if isinstance(ma_data, dict) else []
     en_posts = ma_data.get("en", []) if isinstance(ma_data, dict) else []
 
-    for de_p, en_p in zip(de_posts, en_posts):
-        post = MAPost(
-            week_id=week_id,
-            content_de=de_p.get("content", ""),
-            content_en=en_p.get("content", ""),
-            acquirer=de_p.get("acquirer", ""),
-            target=de_p.get("target", ""),
-            deal_value_de=de_p.get("dealValue"),
-            deal_value_en=en_p.get("dealValue"),
-            deal_type_de=de_p.get("dealType", ""),
-            deal_type_en=en_p.get("dealType", ""),
-            industry=de_p.get("industry") or en_p.get("industry"),
-            author=de_p.get("author", {}),
-            timestamp=de_p.get("timestamp", ""),
-            source_url=de_p.get("sourceUrl"),
-            metrics=de_p.get("metrics", {}),
-        )
-        db.add(post)
+    rows = [_ma_post_values(week_id, de_p, en_p) for de_p, en_p in zip(de_posts, en_posts)]
+    if rows:
+        db.execute(insert(MAPost), rows)
 
     try:
         db.commit()
@@ -1223,19 +1883,17 @@ def run_ma_collection(db: Session, week_id: Optional[str] = None):
 
     # Filter by week boundaries and store raw articles (original_section='investment' for compatibility)
     week_start, week_end = get_week_boundaries(week_id)
-    filtered = [a for a in rss_articles if is_article_in_week(a, week_start, week_end)]
-    for article in filtered:
-        raw_article = RawArticle(
-            week_id=week_id,
-            source=article.get("source", "Unknown"),
-            title=article.get("title", ""),
-            link=article.get("link", ""),
-            summary=article.get("summary", ""),
-            published=article.get("published", ""),
+    filtered = filter_articles_in_period(rss_articles, week_start, week_end)
+    bulk_insert_raw_articles(db, [
+        raw_article_values(
+            week_id,
+            article,
             original_section="investment",
             raw_data={},
+            content_hash=content_hash(article.get("link"), article.get("title")),
         )
-        db.add(raw_article)
+        for article in filtered
+    ])
     db.commit()
 
     # Build minimal article list for LLM
@@ -0,0 +1,162 @@
+"""
+zstd compression for large raw text fields.
+
+Article summaries (often full HTML) and video descriptions/transcripts are
+stored as zstd frames in bytea columns (see models.compression.CompressedText).
+Raw text from the same feeds shares a lot of boilerplate, so frames are
+compressed with a shared dictionary trained on stored rows. Dictionaries
+live in ``compression_dictionaries``; each frame records the ID of the
+dictionary it was written with, so older dictionaries keep decoding old
+rows after a new one has been trained.
+
+Train a dictionary (and optionally rewrite existing rows with it) with
+``python -m scripts.compress_raw``.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+import zstandard as zstd
+from sqlalchemy import func, select, text, update
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_dictionaries: Optional[dict[int, zstd.ZstdCompressionDict]] = None
+_active_id: Optional[int] = None
+
+
+def _load_dictionaries() -> dict[int, zstd.ZstdCompressionDict]:
+    """All stored dictionaries (read once per process); the newest one compresses."""
+    global _dictionaries, _active_id
+    with _lock:
+        if _dictionaries is None:
+            from app.database import get_engine
+            from app.models import CompressionDictionary
+
+            dictionaries: dict[int, zstd.ZstdCompressionDict] = {}
+            active_id = None
+            try:
+                with get_engine().connect() as conn:
+                    rows = conn.execute(
+                        select(CompressionDictionary.id, CompressionDictionary.data)
+                        .order_by(CompressionDictionary.created_at)
+                    ).all()
+                for dict_id, data in rows:
+                    dictionaries[dict_id] = zstd.ZstdCompressionDict(bytes(data))
+                    active_id = dict_id
+            except Exception as e:
+                logger.warning(f"Could not load compression dictionaries, compressing without: {e}")
+            _dictionaries, _active_id = dictionaries, active_id
+        return _dictionaries
+
+
+def reset_dictionaries() -> None:
+    """Forget the loaded dictionaries (after training a new one)."""
+    global _dictionaries, _active_id
+    with _lock:
+        _dictionaries, _active_id = None, None
+
+
+def compress_text(value: Optional[str]) -> Optional[bytes]:
+    """zstd frame of the UTF-8 text, using the newest dictionary if there is one."""
+    if value is None:
+        return None
+    dictionaries = _load_dictionaries()
+    level = get_settings().raw_compression_level
+    if _active_id is not None:
+        compressor = zstd.ZstdCompressor(level=level, dict_data=dictionaries[_active_id])
+    else:
+        compressor = zstd.ZstdCompressor(level=level)
+    return compressor.compress(value.encode("utf-8"))
+
+
+def decompress_text(data: Optional[bytes]) -> Optional[str]:
+    """Text of a zstd frame written by compress_text()."""
+    if data is None:
+        return None
+    data = bytes(data)
+    dict_id = zstd.get_frame_parameters(data).dict_id
+    if dict_id:
+        dictionaries = _load_dictionaries()
+        if dict_id not in dictionaries:
+            reset_dictionaries()  # Trained by another process since we loaded them
+            dictionaries = _load_dictionaries()
+        decompressor = zstd.ZstdDecompressor(dict_data=dictionaries[dict_id])
+    else:
+        decompressor = zstd.ZstdDecompressor()
+    return decompressor.decompress(data).decode("utf-8")
+
+
+def train_dictionary(samples: list[str], dict_size: Optional[int] = None) -> zstd.ZstdCompressionDict:
+    """
+    Train a dictionary on sample texts.
+
+    Raises:
+        ValueError: If there are too few samples or zstd cannot train on
+            them (e.g. many near-identical texts); callers keep compressing
+            with the current dictionary, or none
+    """
+    encoded = [s.encode("utf-8") for s in samples if s]
+    if len(encoded) < 100:
+        raise ValueError(f"Need at least 100 non-empty samples to train a dictionary, got {len(encoded)}")
+    try:
+        return zstd.train_dictionary(dict_size or get_settings().raw_compression_dict_size, encoded)
+    except zstd.ZstdError as e:
+        raise ValueError(f"Could not train a dictionary on {len(encoded)} samples: {e}") from e
+
+
+def save_dictionary(db: Session, dictionary: zstd.ZstdCompressionDict, samples: int) -> int:
+    """Store a trained dictionary; it becomes the active one for new rows."""
+    from app.models import CompressionDictionary
+
+    db.add(CompressionDictionary(id=dictionary.dict_id(), data=dictionary.as_bytes(), samples=samples))
+    db.commit()
+    reset_dictionaries()
+    logger.info(f"Stored compression dictionary {dictionary.dict_id()} ({len(dictionary.as_bytes())} bytes)")
+    return dictionary.dict_id()
+
+
+def table_sizes(db: Session, tables: list[str]) -> dict[str, int]:
+    """Total on-disk size (heap + TOAST + indexes) per table, in bytes (PostgreSQL)."""
+    return {
+        table: db.execute(text("SELECT pg_total_relation_size(:t)"), {"t": table}).scalar()
+        for table in tables
+    }
+
+
+def sample_texts(db: Session, limit: int = 5000) -> list[str]:
+    """Random raw summaries and video descriptions to train a dictionary on."""
+    from app.models import RawArticle, RawVideo
+
+    summaries = db.execute(select(RawArticle.summary).order_by(func.random()).limit(limit)).scalars().all()
+    descriptions = db.execute(
+        select(RawVideo.description).where(RawVideo.description.is_not(None))
+        .order_by(func.random()).limit(limit // 5)
+    ).scalars().all()
+    return [t for t in [*summaries, *descriptions] if t]
+
+
+def recompress(db: Session, batch_size: int = 1000) -> int:
+    """Rewrite all compressed raw fields with the active dictionary; returns rows rewritten."""
+    from app.models import RawArticle, RawVideo
+
+    rewritten = 0
+    for model, columns in ((RawArticle, ("summary",)), (RawVideo, ("description", "transcript"))):
+        last_id = 0
+        while True:
+            rows = db.execute(
+                select(model.id, *(getattr(model, c) for c in columns))
+                .where(model.id > last_id).order_by(model.id).limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            db.execute(update(model), [{"id": row[0], **dict(zip(columns, row[1:]))} for row in rows])
+            db.commit()
+            rewritten += len(rows)
+            last_id = rows[-1][0]
+    return rewritten
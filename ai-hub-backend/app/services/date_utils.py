@@ -0,0 +1,101 @@
+"""
+Article date normalization.
+
+Published dates arrive mostly as ISO-8601 strings written by our own
+fetchers, plus RFC-822 dates from feeds and the odd exotic format. Both
+common formats go through fast stdlib parsers; only strings they reject
+fall back to dateutil's heuristic parser. Results are memoized because the
+same strings repeat across feeds and runs.
+
+All results are naive datetimes: a timezone, if present, is dropped
+without conversion (the behaviour the week-boundary filter always had).
+"""
+
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+# Sentinel for "no parseable date" in the vectorized filter
+_NO_DATE = np.iinfo(np.int64).min
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@lru_cache(maxsize=65536)
+def _parse(date_str: str) -> Optional[datetime]:
+    text = date_str.strip()
+    if not text:
+        return None
+
+    # ISO-8601 (what rss_fetcher/hn_fetcher emit), incl. "Z" and offsets
+    if text[0].isdigit():
+        try:
+            return datetime.fromisoformat(text).replace(tzinfo=None)
+        except ValueError:
+            pass
+
+    # RFC-822 / RFC-2822 ("Sat, 07 Feb 2026 10:00:00 GMT")
+    try:
+        return parsedate_to_datetime(text).replace(tzinfo=None)
+    except (TypeError, ValueError, IndexError):
+        pass
+
+    from dateutil import parser as dateutil_parser
+
+    try:
+        return dateutil_parser.parse(text).replace(tzinfo=None)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def parse_article_date(date_str: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an article's published date (ISO-8601, RFC-822 or anything dateutil reads).
+
+    Args:
+        date_str: Date string from a fetcher or feed
+
+    Returns:
+        Naive datetime, or None if the string is empty or unparseable
+    """
+    if not date_str or not isinstance(date_str, str):
+        return None
+    return _parse(date_str)
+
+
+def _epoch_us(dt: Optional[datetime]) -> int:
+    if dt is None:
+        return _NO_DATE
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def in_period_mask(articles: list[dict], start: datetime, end: datetime) -> np.ndarray:
+    """
+    Boolean mask of articles published in [start, end).
+
+    Each distinct date string is parsed once; the boundary check then runs
+    as one vectorized comparison over the whole list. Articles without a
+    parseable date are included (lenient matching).
+    """
+    stamps: dict[str, int] = {}
+    values = np.empty(len(articles), dtype=np.int64)
+    for i, article in enumerate(articles):
+        date_str = article.get("published") or ""
+        stamp = stamps.get(date_str)
+        if stamp is None:
+            stamp = stamps[date_str] = _epoch_us(parse_article_date(date_str))
+        values[i] = stamp
+
+    undated = values == _NO_DATE
+    return undated | ((values >= _epoch_us(start)) & (values < _epoch_us(end)))
+
+
+def filter_articles_in_period(articles: list[dict], start: datetime, end: datetime) -> list[dict]:
+    """Articles published in [start, end) plus those without a parseable date."""
+    if not articles:
+        return []
+    mask = in_period_mask(articles, start, end)
+    return [article for article, keep in zip(articles, mask.tolist()) if keep]
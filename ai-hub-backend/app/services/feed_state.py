@@ -0,0 +1,112 @@
+"""
+Persisted validator store for conditional RSS requests.
+
+Most publishers answer ``If-None-Match``/``If-Modified-Since`` with
+304 Not Modified when their feed has not changed. The fetcher sends the
+ETag and Last-Modified of the previous full response and, on a 304,
+reuses the entries parsed from that response instead of downloading and
+parsing the feed again.
+
+States are loaded for all feeds of a run in one query and written back in
+one transaction at the end. Failures are logged and never fatal: without
+a state a feed is simply fetched in full.
+"""
+
+import logging
+from datetime import datetime
+from typing import Optional, TypedDict
+
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.database import get_session_local
+from app.models import FeedState
+
+logger = logging.getLogger(__name__)
+
+
+class FeedValidators(TypedDict):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    items: list[dict]
+
+
+def conditional_headers(state: Optional[FeedValidators]) -> dict[str, str]:
+    """If-None-Match/If-Modified-Since for a stored state (none without stored entries)."""
+    if not state or not state["items"]:
+        return {}
+    headers = {}
+    if state["etag"]:
+        headers["If-None-Match"] = state["etag"]
+    if state["last_modified"]:
+        headers["If-Modified-Since"] = state["last_modified"]
+    return headers
+
+
+def load_feed_states(urls: list[str]) -> dict[str, FeedValidators]:
+    """Stored validators and entries by feed URL (feeds without a state are missing)."""
+    if not urls:
+        return {}
+    db = get_session_local()()
+    try:
+        rows = db.query(FeedState).filter(FeedState.url.in_(urls)).all()
+    except Exception as e:
+        logger.warning(f"Could not load feed states, fetching all feeds in full: {e}")
+        return {}
+    finally:
+        db.close()
+    return {
+        row.url: FeedValidators(etag=row.etag, last_modified=row.last_modified, items=row.last_items or [])
+        for row in rows
+    }
+
+
+def store_feed_states(modified: dict[str, dict], statuses: dict[str, int]) -> None:
+    """
+    Persist the outcome of a run's feed requests.
+
+    Args:
+        modified: URL -> {"etag", "last_modified", "items"} of feeds that
+            returned a full 200 response
+        statuses: URL -> HTTP status of the other requests (304 or an
+            error status); only last_status and checked_at change
+    """
+    if not modified and not statuses:
+        return
+    now = datetime.utcnow()
+    db = get_session_local()()
+    try:
+        if modified:
+            stmt = pg_insert(FeedState).values([
+                {
+                    "url": url,
+                    "etag": state.get("etag"),
+                    "last_modified": state.get("last_modified"),
+                    "last_status": 200,
+                    "last_items": state["items"],
+                    "modified_at": now,
+                    "checked_at": now,
+                }
+                for url, state in modified.items()
+            ])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[FeedState.url],
+                set_={
+                    column: stmt.excluded[column]
+                    for column in ("etag", "last_modified", "last_status", "last_items", "modified_at", "checked_at")
+                },
+            )
+            db.execute(stmt)
+        for status in set(statuses.values()):
+            urls = [url for url, s in statuses.items() if s == status]
+            db.execute(
+                update(FeedState)
+                .where(FeedState.url.in_(urls))
+                .values(last_status=status, checked_at=now)
+            )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"Could not store feed states: {e}")
+    finally:
+        db.close()
@@ -2,7 +2,6 @@
 Hacker News fetching service using Algolia API.
 """
 
-import requests
 from datetime import datetime, timedelta
 from typing import Optional
 from bs4 import BeautifulSoup
@@ -11,6 +10,8 @@ import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from app.config import get_settings
+from app.services import cassette
+from app.services.metrics import span, submit_with_context, HN_QUERY
 
 logger = logging.getLogger(__name__)
 
@@ -66,7 +67,8 @@ def _fetch_single_query(
     Returns:
         List of HN stories with metadata
     """
-    url = "https://hn.algolia.com/api/v1/search_by_date"
+    settings = get_settings()
+    url = f"{settings.hn_api_base_url}/search_by_date"
     params = {
         "query": query,
         "tags": "story",
@@ -74,20 +76,23 @@ def _fetch_single_query(
         "hitsPerPage": limit * 2,
     }
 
-    settings = get_settings()
-    try:
-        resp = requests.get(
-            url,
-            params=params,
-            timeout=settings.hn_request_timeout_seconds,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-    except Exception as e:
-        logger.error(f"Error fetching HN stories for query '{query}': {e}")
-        return []
-
-    cutoff = datetime.now() - timedelta(days=days)
+    with span(query, kind=HN_QUERY) as query_span:
+        try:
+            resp = cassette.http_get(
+                url,
+                params=params,
+                timeout=settings.hn_request_timeout_seconds,
+            )
+            resp.raise_for_status()
+            data = resp.json()
+        except Exception as e:
+            logger.error(f"Error fetching HN stories for query '{query}': {e}")
+            query_span.status = "error"
+            query_span.error = str(e)[:500]
+            return []
+        query_span.items = len(data.get("hits", []))
+
+    cutoff = cassette.now() - timedelta(days=days)
     stories = []
 
     for hit in data.get("hits", []):
@@ -147,7 +152,7 @@ def fetch_hn_top_stories(
     logger.info(f"HN parallel query fetch: {len(queries)} queries, workers={settings.hn_max_workers}")
     with ThreadPoolExecutor(max_workers=settings.hn_max_workers) as executor:
         futures = {
-            executor.submit(_fetch_single_query, query, min_points, days, limit): query
+            submit_with_context(executor, _fetch_single_query, query, min_points, days, limit): query
             for query in queries
         }
 
@@ -174,11 +179,10 @@ def fetch_hn_top_stories(
 
 def fetch_hn_comments(story_id: str, limit: int = 5) -> list[str]:
     """Fetch top comments from an HN post."""
-    url = f"https://hn.algolia.com/api/v1/items/{story_id}"
-
     settings = get_settings()
+    url = f"{settings.hn_api_base_url}/items/{story_id}"
     try:
-        resp = requests.get(url, timeout=settings.hn_request_timeout_seconds)
+        resp = cassette.http_get(url, timeout=settings.hn_request_timeout_seconds)
         resp.raise_for_status()
         data = resp.json()
 
@@ -220,13 +224,6 @@ def detect_content_type(url: str) -> str:
 
 def fetch_youtube_transcript(url: str) -> Optional[str]:
     """Fetch YouTube video transcript."""
-    try:
-        from youtube_transcript_api import YouTubeTranscriptApi
-        from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
-    except ImportError:
-        logger.warning("youtube-transcript-api not installed")
-        return None
-
     patterns = [
         r"(?:v=|/v/|youtu\.be/)([a-zA-Z0-9_-]{11})",
         r"(?:embed/)([a-zA-Z0-9_-]{11})",
@@ -242,6 +239,17 @@ def fetch_youtube_transcript(url: str) -> Optional[str]:
     if not video_id:
         return None
 
+    return cassette.call("hn.transcript", {"video_id": video_id}, lambda: _fetch_transcript_text(video_id))
+
+
+def _fetch_transcript_text(video_id: str) -> Optional[str]:
+    try:
+        from youtube_transcript_api import YouTubeTranscriptApi
+        from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
+    except ImportError:
+        logger.warning("youtube-transcript-api not installed")
+        return None
+
     try:
         transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
 
@@ -276,7 +284,7 @@ def fetch_webpage_content(url: str) -> Optional[str]:
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
         }
         settings = get_settings()
-        resp = requests.get(url, headers=headers, timeout=min(15, settings.hn_request_timeout_seconds))
+        resp = cassette.http_get(url, headers=headers, timeout=min(15, settings.hn_request_timeout_seconds))
         resp.raise_for_status()
 
         soup = BeautifulSoup(resp.text, "lxml")
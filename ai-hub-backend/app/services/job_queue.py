@@ -0,0 +1,334 @@
+"""
+Postgres-backed job queue for distributed pipeline workers.
+
+Jobs are rows in ``pipeline_jobs``. Workers (scripts/worker.py, any number
+of containers) claim the best due job with ``SELECT ... FOR UPDATE SKIP
+LOCKED``, so concurrent workers never block on or double-claim a row. A
+running job's worker refreshes ``heartbeat_at`` from a background thread;
+jobs whose heartbeat is older than JOB_STALE_AFTER_SECONDS (worker crashed
+or was redeployed) are put back in the queue by the next worker that polls.
+
+Failed jobs are retried with exponential backoff (``run_after``) until
+``max_attempts`` is reached. Newsletter jobs are never retried: a send is
+not idempotent, so a retry would mail the languages already sent again. A
+fetch job with ``{"then_process": true}``
+enqueues the period's process job on success, so stages 1 and 2-4 can run
+on different workers.
+
+Job types and payloads:
+    fetch       {"period_id", "incremental", "then_process"}
+    process     {"period_id"}
+    translate   {"period_id"}           missing extra languages (all periods if omitted)
+    backfill    {"start", "end", "parallel", "incremental", "skip_completed"}
+    newsletter  {"period_id"}
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.database import get_session_local
+from app.models import PipelineJob
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+def _run_fetch(db: Session, job: PipelineJob, payload: dict) -> dict:
+    from app.services.collector import run_fetch_only
+    from app.services.period_utils import current_day_id
+
+    # Pin the period so the follow-up processes the same day even after midnight
+    period_id = payload.get("period_id") or current_day_id()
+    result = run_fetch_only(db, period_id, incremental=payload.get("incremental", False))
+    if payload.get("then_process"):
+        follow_up = enqueue(db, "process", {"period_id": period_id}, priority=job.priority, parent_id=job.id)
+        result = {**result, "processJobId": follow_up.id}
+    return result
+
+
+def _run_process(db: Session, job: PipelineJob, payload: dict) -> dict:
+    from app.services.collector import run_process_only
+
+    return run_process_only(db, payload.get("period_id"))
+
+
+def _run_translate(db: Session, job: PipelineJob, payload: dict) -> dict:
+    from app.services.translation_backfill import backfill_missing_translations
+
+    return {"updated": backfill_missing_translations(db, payload.get("period_id"))}
+
+
+def _run_backfill(db: Session, job: PipelineJob, payload: dict) -> dict:
+    from app.services.backfill import day_ids_between, run_backfill
+
+    return run_backfill(
+        day_ids_between(payload["start"], payload["end"]),
+        parallel=payload.get("parallel"),
+        incremental=payload.get("incremental", False),
+        skip_completed=payload.get("skip_completed", False),
+    )
+
+
+def _run_newsletter(db: Session, job: PipelineJob, payload: dict) -> dict:
+    from app.services.newsletter_sender import send_newsletter
+
+    send_newsletter(db, payload.get("period_id"))
+    return {"periodId": payload.get("period_id")}
+
+
+# job_type -> handler(db, job, payload) returning a JSON-serializable result
+HANDLERS: dict[str, Callable[[Session, PipelineJob, dict], Optional[dict]]] = {
+    "fetch": _run_fetch,
+    "process": _run_process,
+    "translate": _run_translate,
+    "backfill": _run_backfill,
+    "newsletter": _run_newsletter,
+}
+
+
+# Job types that must run at most once (a retry or requeue would repeat side effects)
+SINGLE_ATTEMPT = {"newsletter"}
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def enqueue(
+    db: Session,
+    job_type: str,
+    payload: Optional[dict] = None,
+    priority: int = 0,
+    max_attempts: Optional[int] = None,
+    parent_id: Optional[int] = None,
+) -> PipelineJob:
+    """
+    Add a job to the queue.
+
+    Job types in SINGLE_ATTEMPT always get max_attempts=1.
+
+    Raises:
+        ValueError: If the job type is unknown
+    """
+    if job_type not in HANDLERS:
+        raise ValueError(f"Unknown job type '{job_type}' (expected one of {', '.join(HANDLERS)})")
+    job = PipelineJob(
+        job_type=job_type,
+        payload=payload or {},
+        status=QUEUED,
+        priority=priority,
+        max_attempts=1 if job_type in SINGLE_ATTEMPT else max_attempts or get_settings().job_max_attempts,
+        run_after=datetime.utcnow(),
+        parent_id=parent_id,
+    )
+    db.add(job)
+    db.commit()
+    logger.info(f"Enqueued job {job.id} ({job_type}) {job.payload}")
+    return job
+
+
+def claim_next(db: Session, worker_id: str, job_types: Optional[list[str]] = None) -> Optional[PipelineJob]:
+    """Claim the highest-priority due job (skipping rows other workers hold locked)."""
+    query = db.query(PipelineJob).filter(
+        PipelineJob.status == QUEUED,
+        PipelineJob.run_after <= datetime.utcnow(),
+    )
+    if job_types:
+        query = query.filter(PipelineJob.job_type.in_(job_types))
+    job = query.order_by(
+        PipelineJob.priority.desc(), PipelineJob.run_after, PipelineJob.id,
+    ).with_for_update(skip_locked=True).first()
+    if job is None:
+        db.rollback()  # Release the snapshot
+        return None
+
+    now = datetime.utcnow()
+    job.status = RUNNING
+    job.attempts += 1
+    job.worker_id = worker_id
+    job.started_at = now
+    job.heartbeat_at = now
+    job.error = None
+    db.commit()
+    return job
+
+
+def requeue_stale(db: Session) -> int:
+    """Return running jobs with an expired heartbeat to the queue (or fail them when out of attempts)."""
+    settings = get_settings()
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.job_stale_after_seconds)
+    stale = db.query(PipelineJob).filter(
+        PipelineJob.status == RUNNING,
+        PipelineJob.heartbeat_at < cutoff,
+    ).with_for_update(skip_locked=True).all()
+    for job in stale:
+        logger.warning(f"Job {job.id} ({job.job_type}) lost its worker {job.worker_id}, requeueing")
+        _schedule_retry(job, f"Heartbeat lost (worker {job.worker_id})")
+    db.commit()
+    return len(stale)
+
+
+def _schedule_retry(job: PipelineJob, error: str) -> None:
+    settings = get_settings()
+    job.error = error
+    job.worker_id = None
+    if job.attempts >= job.max_attempts:
+        job.status = FAILED
+        job.finished_at = datetime.utcnow()
+        return
+    delay = min(settings.job_retry_base_seconds * 2 ** (job.attempts - 1), settings.job_retry_max_seconds)
+    job.status = QUEUED
+    job.run_after = datetime.utcnow() + timedelta(seconds=delay)
+
+
+class _Heartbeat:
+    """Refresh a running job's heartbeat_at from a daemon thread with its own session."""
+
+    def __init__(self, job_id: int, worker_id: str, interval: float):
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._beat, name=f"heartbeat-{job_id}", daemon=True)
+
+    def _beat(self) -> None:
+        while not self._stop.wait(self.interval):
+            db = get_session_local()()
+            try:
+                updated = db.execute(
+                    update(PipelineJob)
+                    .where(PipelineJob.id == self.job_id, PipelineJob.worker_id == self.worker_id)
+                    .values(heartbeat_at=datetime.utcnow())
+                ).rowcount
+                db.commit()
+                if not updated:
+                    logger.warning(f"Job {self.job_id} is no longer owned by {self.worker_id}")
+                    return
+            except Exception as e:
+                logger.warning(f"Heartbeat for job {self.job_id} failed: {e}")
+                db.rollback()
+            finally:
+                db.close()
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join(timeout=self.interval)
+
+
+def run_job(db: Session, job: PipelineJob, worker_id: str) -> None:
+    """Execute a claimed job and record its outcome."""
+    settings = get_settings()
+    logger.info(f"Running job {job.id} ({job.job_type}, attempt {job.attempts}/{job.max_attempts})")
+    start = time.monotonic()
+    try:
+        with _Heartbeat(job.id, worker_id, settings.job_heartbeat_seconds):
+            result = HANDLERS[job.job_type](db, job, dict(job.payload or {}))
+    except Exception as e:
+        db.rollback()
+        db.refresh(job)
+        if job.worker_id != worker_id:
+            logger.warning(f"Job {job.id} failed after being reclaimed elsewhere, not recording: {e}")
+            return
+        _schedule_retry(job, str(e))
+        db.commit()
+        logger.error(
+            f"Job {job.id} ({job.job_type}) failed: {e}"
+            + (f", retrying after {job.run_after:%H:%M:%S}" if job.status == QUEUED else ", giving up")
+        )
+        return
+
+    db.refresh(job)
+    if job.worker_id != worker_id:
+        logger.warning(f"Job {job.id} finished after being reclaimed elsewhere, not recording")
+        return
+    job.status = COMPLETED
+    job.result = result if isinstance(result, dict) else None
+    job.finished_at = datetime.utcnow()
+    db.commit()
+    logger.info(f"Job {job.id} ({job.job_type}) completed in {time.monotonic() - start:.1f}s")
+
+
+def run_worker(
+    worker_id: Optional[str] = None,
+    job_types: Optional[list[str]] = None,
+    burst: bool = False,
+    max_jobs: Optional[int] = None,
+) -> int:
+    """
+    Poll the queue and run jobs until stopped.
+
+    Args:
+        worker_id: Identifier stored on claimed jobs (default: host:pid)
+        job_types: Only claim these job types (default: all)
+        burst: Exit once the queue has no due job instead of polling
+        max_jobs: Exit after this many jobs
+
+    Returns:
+        Number of jobs run
+    """
+    settings = get_settings()
+    worker_id = worker_id or default_worker_id()
+    logger.info(f"Worker {worker_id} started (types: {', '.join(job_types or HANDLERS)})")
+
+    done = 0
+    while max_jobs is None or done < max_jobs:
+        db = get_session_local()()
+        try:
+            requeue_stale(db)
+            job = claim_next(db, worker_id, job_types)
+            if job is not None:
+                run_job(db, job, worker_id)
+                done += 1
+                continue
+        except Exception as e:
+            # Queue bookkeeping failed (e.g. a dropped connection); a job left running is requeued when stale
+            logger.error(f"Worker {worker_id} queue error, retrying in {settings.job_poll_interval_seconds}s: {e}")
+            db.rollback()
+        finally:
+            db.close()
+        if burst:
+            break
+        time.sleep(settings.job_poll_interval_seconds)
+
+    logger.info(f"Worker {worker_id} stopped after {done} jobs")
+    return done
+
+
+def job_to_dict(job: PipelineJob) -> dict:
+    """Status API representation of a job."""
+    return {
+        "id": job.id,
+        "jobType": job.job_type,
+        "payload": job.payload,
+        "status": job.status,
+        "priority": job.priority,
+        "attempts": job.attempts,
+        "maxAttempts": job.max_attempts,
+        "runAfter": job.run_after.isoformat() if job.run_after else None,
+        "workerId": job.worker_id,
+        "heartbeatAt": job.heartbeat_at.isoformat() if job.heartbeat_at else None,
+        "result": job.result,
+        "error": job.error,
+        "parentId": job.parent_id,
+        "createdAt": job.created_at.isoformat() if job.created_at else None,
+        "startedAt": job.started_at.isoformat() if job.started_at else None,
+        "finishedAt": job.finished_at.isoformat() if job.finished_at else None,
+    }
@@ -0,0 +1,133 @@
+"""
+Process-wide budget for outbound LLM calls.
+
+Every collection run sizes its own thread pools (LLM_MAX_WORKERS,
+TRANSLATION_MAX_WORKERS, ...), so several periods collected in one process
+multiply the number of requests in flight. All chat completions therefore
+pass through one shared budget: a cap on concurrent requests and a
+requests-per-minute token bucket. Either limit is off when set to 0.
+
+The budget is built from LLM_GLOBAL_MAX_CONCURRENT and
+LLM_GLOBAL_REQUESTS_PER_MINUTE on first use. The backfill runner adds its
+own limits with scoped_budget(): inside that block (and in worker threads
+started with submit_with_context) every call takes a slot from the scoped
+budget and then from the process-wide one, while other work in the process
+only sees the process-wide budget.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class LLMBudget:
+    """Concurrency cap plus token-bucket rate limit, safe to share across threads."""
+
+    def __init__(self, max_concurrent: int = 0, requests_per_minute: float = 0.0):
+        self.max_concurrent = max_concurrent
+        self.requests_per_minute = requests_per_minute
+        self._slots = threading.BoundedSemaphore(max_concurrent) if max_concurrent > 0 else None
+        self._lock = threading.Lock()
+        # Allow a burst of up to one request per concurrent slot (at least one)
+        self._capacity = float(max(1, max_concurrent))
+        self._tokens = self._capacity
+        self._refilled_at = time.monotonic()
+        self.calls = 0
+        self.in_flight = 0
+        self.wait_seconds = 0.0
+
+    def _take_token(self) -> None:
+        if self.requests_per_minute <= 0:
+            return
+        rate = self.requests_per_minute / 60.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._refilled_at) * rate)
+                self._refilled_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / rate
+            time.sleep(delay)
+
+    @contextmanager
+    def slot(self):
+        """Hold one request's share of the budget (blocks until it is available)."""
+        start = time.monotonic()
+        if self._slots is not None:
+            self._slots.acquire()
+        try:
+            self._take_token()
+            with self._lock:
+                self.wait_seconds += time.monotonic() - start
+                self.calls += 1
+                self.in_flight += 1
+            try:
+                yield
+            finally:
+                with self._lock:
+                    self.in_flight -= 1
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "inFlight": self.in_flight,
+                "waitSeconds": round(self.wait_seconds, 1),
+            }
+
+
+_budget: Optional[LLMBudget] = None
+_budget_lock = threading.Lock()
+_scoped: contextvars.ContextVar[Optional[LLMBudget]] = contextvars.ContextVar("llm_scoped_budget", default=None)
+
+
+def get_budget() -> LLMBudget:
+    """The process-wide budget (created from settings on first use)."""
+    global _budget
+    with _budget_lock:
+        if _budget is None:
+            settings = get_settings()
+            _budget = LLMBudget(
+                settings.llm_global_max_concurrent,
+                settings.llm_global_requests_per_minute,
+            )
+        return _budget
+
+
+@contextmanager
+def scoped_budget(max_concurrent: int = 0, requests_per_minute: float = 0.0) -> Iterator[LLMBudget]:
+    """Apply extra limits to the LLM calls made in this context (the process-wide budget still applies)."""
+    budget = LLMBudget(max_concurrent, requests_per_minute)
+    logger.info(
+        f"LLM budget: max {max_concurrent or 'unlimited'} concurrent, "
+        f"{requests_per_minute or 'unlimited'} requests/min"
+    )
+    token = _scoped.set(budget)
+    try:
+        yield budget
+    finally:
+        _scoped.reset(token)
+
+
+@contextmanager
+def llm_slot():
+    """Hold one request's share of the scoped budget (if any) and the process-wide budget."""
+    scoped = _scoped.get()
+    if scoped is None:
+        with get_budget().slot():
+            yield
+        return
+    with scoped.slot(), get_budget().slot():
+        yield
@@ -0,0 +1,199 @@
+"""
+Content-addressed cache of LLM section outputs.
+
+Section prompts (tech, investment, tips, videos) run at low temperature, so
+re-processing an unchanged raw set yields equivalent results. Each section
+result is stored in ``llm_section_cache`` under a SHA-256 of (model, prompt
+template version, normalized input items, count, temperature); a repeated
+call with the same key returns the stored result without an LLM call.
+
+Bump a section's entry in PROMPT_VERSIONS whenever its prompt template or
+post-processing changes, so old entries stop matching. Entries unused for
+LLM_CACHE_MAX_AGE_DAYS are evicted, and beyond LLM_CACHE_MAX_ENTRIES the
+least recently used ones go first.
+
+Disable globally with LLM_CACHE_ENABLED=false, or for one run with
+``with bypass(): ...`` (admin ``bypass_cache=true``, ``--no-llm-cache``).
+The cache is also skipped while a cassette is active.
+"""
+
+import contextvars
+import functools
+import hashlib
+import inspect
+import json
+import logging
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.config import get_settings
+from app.database import get_session_local
+from app.models import LLMSectionCache
+from app.services import cassette
+
+logger = logging.getLogger(__name__)
+
+PROMPT_VERSIONS = {
+    "tech": 1,
+    "investment": 1,
+    "tips": 1,
+    "videos": 1,
+}
+
+_bypass: contextvars.ContextVar[bool] = contextvars.ContextVar("llm_cache_bypass", default=False)
+
+
+@contextmanager
+def bypass(active: bool = True):
+    """Skip cache reads and writes for LLM calls made in this context."""
+    token = _bypass.set(active)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def enabled() -> bool:
+    return get_settings().llm_cache_enabled and not _bypass.get() and cassette.get_cassette() is None
+
+
+def _normalize(value) -> str:
+    return " ".join(str(value).split()) if value is not None else ""
+
+
+def cache_key(section: str, model: str, items: list[dict], fields: tuple[str, ...], count: int,
+              temperature: float) -> str:
+    """SHA-256 over everything that determines a section result."""
+    payload = {
+        "section": section,
+        "version": PROMPT_VERSIONS.get(section, 1),
+        "model": model,
+        "count": count,
+        "temperature": temperature,
+        "items": [[_normalize(item.get(f)) for f in fields] for item in items],
+    }
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _has_content(result) -> bool:
+    """True if a result contains any item (empty results are fallbacks, not worth caching)."""
+    if isinstance(result, list):
+        return bool(result)
+    if isinstance(result, dict):
+        return any(_has_content(v) for v in result.values())
+    return False
+
+
+def lookup(key: str) -> Optional[dict]:
+    db = get_session_local()()
+    try:
+        result = db.execute(
+            select(LLMSectionCache.result).where(LLMSectionCache.key == key)
+        ).scalar_one_or_none()
+        if result is not None:
+            db.execute(
+                update(LLMSectionCache)
+                .where(LLMSectionCache.key == key)
+                .values(last_used_at=datetime.utcnow(), hits=LLMSectionCache.hits + 1)
+            )
+            db.commit()
+        return result
+    finally:
+        db.close()
+
+
+def store(key: str, section: str, model: str, result: dict) -> None:
+    now = datetime.utcnow()
+    stmt = pg_insert(LLMSectionCache).values(
+        key=key,
+        section=section,
+        model=model,
+        prompt_version=PROMPT_VERSIONS.get(section, 1),
+        result=result,
+        created_at=now,
+        last_used_at=now,
+        hits=0,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[LLMSectionCache.key],
+        set_={"result": stmt.excluded.result, "last_used_at": now},
+    )
+    db = get_session_local()()
+    try:
+        db.execute(stmt)
+        db.commit()
+        evict(db)
+    finally:
+        db.close()
+
+
+def evict(db, max_entries: Optional[int] = None, max_age_days: Optional[int] = None) -> int:
+    """Delete entries unused for max_age_days, then the least recently used beyond max_entries."""
+    settings = get_settings()
+    max_entries = settings.llm_cache_max_entries if max_entries is None else max_entries
+    max_age_days = settings.llm_cache_max_age_days if max_age_days is None else max_age_days
+
+    deleted = 0
+    if max_age_days > 0:
+        cutoff = datetime.utcnow() - timedelta(days=max_age_days)
+        deleted += db.execute(
+            delete(LLMSectionCache).where(LLMSectionCache.last_used_at < cutoff)
+        ).rowcount
+    if max_entries > 0:
+        keep = select(LLMSectionCache.key).order_by(LLMSectionCache.last_used_at.desc()).limit(max_entries)
+        deleted += db.execute(
+            delete(LLMSectionCache).where(LLMSectionCache.key.not_in(keep.scalar_subquery()))
+        ).rowcount
+    db.commit()
+    if deleted:
+        logger.info(f"LLM cache: evicted {deleted} entries")
+    return deleted
+
+
+def cached_section(section: str, fields: tuple[str, ...], limit: int, temperature: float):
+    """
+    Cache an LLMProcessor section method ``(self, items, count)``.
+
+    Args:
+        section: Key in PROMPT_VERSIONS
+        fields: Item fields the prompt reads
+        limit: Items the prompt uses (items[:limit])
+        temperature: Temperature of the section's LLM call
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, items: list[dict], *args, **kwargs):
+            if not items or not enabled():
+                return method(self, items, *args, **kwargs)
+
+            bound = signature.bind(self, items, *args, **kwargs)
+            bound.apply_defaults()
+            count = bound.arguments["count"]
+
+            key = cache_key(section, self.processor_model, items[:limit], fields, count, temperature)
+            try:
+                cached = lookup(key)
+            except Exception as e:
+                logger.warning(f"LLM cache lookup failed for {section}: {e}")
+                cached = None
+            if cached is not None:
+                logger.info(f"LLM cache hit for {section} ({key[:12]})")
+                return cached
+
+            result = method(self, items, *args, **kwargs)
+            if _has_content(result):
+                try:
+                    store(key, section, self.processor_model, result)
+                except Exception as e:
+                    logger.warning(f"LLM cache store failed for {section}: {e}")
+            return result
+
+        return wrapper
+
+    return decorator
@@ -6,9 +6,17 @@ import json
 import re
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Optional
+
 from openai import OpenAI, RateLimitError
 
 from app.config import get_settings
+from app.services import cassette
+from app.services.llm_budget import llm_slot
+from app.services.llm_cache import cached_section
+from app.services.metrics import span, submit_with_context, LLM_CALL
 
 logger = logging.getLogger(__name__)
 
@@ -62,8 +70,108 @@ def parse_llm_json(text: str, fallback=None):
         return fallback
 
 
+def _record_usage(call_span, response) -> None:
+    """Copy token usage from a chat completion onto a metrics span."""
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        call_span.attrs["prompt_tokens"] = getattr(usage, "prompt_tokens", None)
+        call_span.attrs["completion_tokens"] = getattr(usage, "completion_tokens", None)
+
+
+def _completion_to_dict(response) -> dict:
+    """Reduce a chat completion to the fields the processor reads (for cassettes)."""
+    usage = getattr(response, "usage", None)
+    message = response.choices[0].message if response.choices else None
+    return {
+        "content": message.content if message else None,
+        "has_message": message is not None,
+        "usage": {
+            "prompt_tokens": getattr(usage, "prompt_tokens", None),
+            "completion_tokens": getattr(usage, "completion_tokens", None),
+        } if usage is not None else None,
+    }
+
+
+def _completion_from_dict(data: dict):
+    """Rebuild a completion-like object from _completion_to_dict() output."""
+    choices = [SimpleNamespace(message=SimpleNamespace(content=data["content"]))] if data["has_message"] else []
+    usage = SimpleNamespace(**data["usage"]) if data.get("usage") else None
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+def _rebuild_llm_error(error_type: str, message: str) -> Exception:
+    """Replay recorded 429s as RateLimitError so retry/fallback paths match the recording."""
+    if error_type == "RateLimitError":
+        import httpx
+
+        request = httpx.Request("POST", "https://openrouter.ai/api/v1/chat/completions")
+        return RateLimitError(message, response=httpx.Response(429, request=request), body=None)
+    return cassette.RecordedError(error_type, message)
+
+
+def _classification_entry(index: int, article: dict) -> str:
+    return (
+        f"[{index}] Source: {article['source']} (hint: {article.get('original_section', 'unknown')})\n"
+        f"    Title: {article['title']}\n"
+        f"    Summary: {article['summary'][:300]}"
+    )
+
+
+def _chunk_by_tokens(entries: list[tuple[dict, str]], budget: int) -> list[list[dict]]:
+    """Group articles into consecutive chunks whose prompt entries fit the token budget."""
+    from app.services.prerank import estimate_tokens
+
+    chunks: list[list[dict]] = []
+    current: list[dict] = []
+    used = 0
+    for article, text in entries:
+        tokens = estimate_tokens(text)
+        if current and used + tokens > budget:
+            chunks.append(current)
+            current, used = [], 0
+        current.append(article)
+        used += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+# What the map step of map-reduce selection looks for, per section
+SELECTION_FOCUS = {
+    "tech": "the most important and interesting AI technology news for non-technical professionals",
+    "investment": "the most significant AI funding rounds, public market moves and M&A deals",
+    "tips": "the most practical, reusable AI usage tips",
+    "videos": "the most valuable AI videos (clear explanations, practical tutorials, important news)",
+}
+
+
+def candidate_line(section: str, item: dict) -> str:
+    """One candidate as shown in selection prompts (also used to size map batches)."""
+    if section == "videos":
+        return (
+            f"{item.get('original_title', '')} (Channel: {item.get('channel_name', '')}, "
+            f"{item.get('view_count_formatted', '')} views, {item.get('duration_formatted', '')})\n"
+            f"    {(item.get('description') or '')[:200]}"
+        )
+    return f"{item['title']} (Source: {item['source']})\n    {(item.get('summary') or '')[:300]}"
+
+
+def _with_hints(article: dict) -> dict:
+    """Fallback classification: the feed's section hint at neutral relevance."""
+    article["section"] = article.get("original_section", "tech")
+    article["relevance"] = 0.5
+    article["fallback"] = True
+    return article
+
+
 class LLMProcessor:
-    """LLM processing service for content generation."""
+    """
+    LLM processing service for content generation.
+
+    An instance is not thread-safe (the OpenAI client may not be), so work
+    spread over worker threads creates one LLMProcessor per task instead of
+    sharing the caller's.
+    """
 
     # Free classifier models in priority order (fallback chain).
     # When one is rate-limited (429), the next one is tried automatically.
@@ -78,16 +186,39 @@ class LLMProcessor:
 
     def __init__(self):
         settings = get_settings()
-        if not settings.openrouter_api_key:
+        active_cassette = cassette.get_cassette()
+        replaying = active_cassette is not None and active_cassette.mode == cassette.REPLAY
+        if not settings.openrouter_api_key and not replaying:
             raise ValueError("OPENROUTER_API_KEY not configured")
 
         self.client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=settings.openrouter_api_key,
+            base_url=settings.openrouter_base_url,
+            api_key=settings.openrouter_api_key or "replay",
         )
         # High-quality model for content processing (unchanged)
         self.processor_model = "deepseek/deepseek-v3.2"
 
+    def _create_completion(self, model: str, prompt: str, temperature: float, timeout: float):
+        """Single chat completion request (recorded/replayed when a cassette is active)."""
+        def create():
+            with llm_slot():
+                return self.client.chat.completions.create(
+                    model=model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=temperature,
+                    timeout=timeout,
+                )
+
+        if cassette.get_cassette() is None:
+            return create()
+        data = cassette.call(
+            "llm",
+            {"model": model, "prompt": prompt, "temperature": temperature},
+            lambda: _completion_to_dict(create()),
+            rebuild_error=_rebuild_llm_error,
+        )
+        return _completion_from_dict(data)
+
     def _call_llm(self, prompt: str, temperature: float = 0.3, use_classifier: bool = False, timeout: float = 120.0) -> str:
         """Make an LLM API call with retry and fallback logic for rate limits.
 
@@ -117,12 +248,9 @@ class LLMProcessor:
 
         for attempt in range(max_retries):
             try:
-                response = self.client.chat.completions.create(
-                    model=model,
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=temperature,
-                    timeout=timeout,
-                )
+                with span(model, kind=LLM_CALL, attempt=attempt + 1, prompt_chars=len(prompt)) as call_span:
+                    response = self._create_completion(model, prompt, temperature, timeout)
+                    _record_usage(call_span, response)
                 if not response.choices or not response.choices[0].message:
                     logger.warning(f"Empty response from LLM model {model}")
                     return ""
@@ -140,7 +268,7 @@ class LLMProcessor:
                 raise
 
     def _call_with_fallback(self, prompt: str, temperature: float, timeout: float,
-                            expect_json: bool = False) -> str:
+                            expect_json: bool = False, models: Optional[list[str]] = None) -> str:
         """Try classifier models in order, falling back on rate limits or bad JSON.
 
         Each model gets 2 retry attempts with exponential backoff before
@@ -152,20 +280,19 @@ class LLMProcessor:
             timeout: Request timeout in seconds.
             expect_json: If True, validate that the response parses as JSON.
                          Invalid JSON is treated as a retriable failure.
+            models: Fallback chain to use (default: CLASSIFIER_MODELS).
         """
         retries_per_model = 2
         base_delay = 2
         last_error = None
 
-        for model in self.CLASSIFIER_MODELS:
+        models = models or self.CLASSIFIER_MODELS
+        for model in models:
             for attempt in range(retries_per_model):
                 try:
-                    response = self.client.chat.completions.create(
-                        model=model,
-                        messages=[{"role": "user", "content": prompt}],
-                        temperature=temperature,
-                        timeout=timeout,
-                    )
+                    with span(model, kind=LLM_CALL, attempt=attempt + 1, prompt_chars=len(prompt)) as call_span:
+                        response = self._create_completion(model, prompt, temperature, timeout)
+                        _record_usage(call_span, response)
                     if not response.choices or not response.choices[0].message:
                         logger.warning(f"Empty response from classifier model {model}")
                         return ""
@@ -179,6 +306,8 @@ class LLMProcessor:
                                 f"Invalid JSON from {model}, attempt {attempt + 1}/{retries_per_model}"
                             )
                             last_error = ValueError(f"Invalid JSON from {model}")
+                            call_span.status = "error"
+                            call_span.error = "invalid JSON"
                             if attempt < retries_per_model - 1:
                                 time.sleep(base_delay * (2 ** attempt))
                                 continue  # retry same model
@@ -203,7 +332,7 @@ class LLMProcessor:
                     # Non-rate-limit error: skip to next model immediately
                     break
 
-        logger.error(f"All {len(self.CLASSIFIER_MODELS)} classifier models exhausted")
+        logger.error(f"All {len(models)} classifier models exhausted")
         raise last_error or RuntimeError("All classifier models failed")
 
     def _try_translate_batch(
@@ -318,18 +447,52 @@ Output the translated JSON array with the same structure. Output ONLY the JSON a
         return all_translated
 
     def classify_articles(self, articles: list[dict]) -> list[dict]:
-        """Classify articles into sections (tech/investment/tips)."""
+        """
+        Classify articles into sections (tech/investment/tips).
+
+        Articles are split into chunks that fit CLASSIFY_CHUNK_TOKEN_BUDGET
+        and classified concurrently, each chunk starting at a different model
+        of the CLASSIFIER_MODELS chain so parallel chunks spread over the free
+        models' rate limits. A chunk that fails gets the original_section
+        hints (relevance 0.5) for its own articles only.
+
+        Results carry each article's "id" (its position if none was given).
+        Articles the classifier marks as duplicates have section "duplicate"
+        and "duplicate_of" (the id of the better article); articles that fell
+        back to their hints (failed chunk, missing from the response) have
+        "fallback" set.
+        """
         if not articles:
             return []
 
-        article_entries = []
-        for i, a in enumerate(articles):
-            article_entries.append(
-                f"[{i}] Source: {a['source']} (hint: {a.get('original_section', 'unknown')})\n"
-                f"    Title: {a['title']}\n"
-                f"    Summary: {a['summary'][:300]}"
-            )
-        articles_text = "\n\n".join(article_entries)
+        settings = get_settings()
+        for i, article in enumerate(articles):
+            article.setdefault("id", i)
+
+        chunks = _chunk_by_tokens(
+            [(a, _classification_entry(0, a)) for a in articles], settings.classify_chunk_token_budget,
+        )
+        if len(chunks) == 1:
+            classified = self._classify_chunk(chunks[0], self.CLASSIFIER_MODELS)
+        else:
+            logger.info(f"Classifying {len(articles)} articles in {len(chunks)} chunks")
+            models = self.CLASSIFIER_MODELS
+            with ThreadPoolExecutor(max_workers=settings.classify_max_workers) as executor:
+                futures = [
+                    # Each chunk starts at its own model
+                    submit_with_context(
+                        executor, LLMProcessor()._classify_chunk, chunk, models[i % len(models):] + models[:i % len(models)],
+                    )
+                    for i, chunk in enumerate(chunks)
+                ]
+                classified = [a for future in futures for a in future.result()]
+
+        classified.sort(key=lambda a: a.get("relevance", 0), reverse=True)
+        return classified
+
+    def _classify_chunk(self, articles: list[dict], models: list[str]) -> list[dict]:
+        """Classify one chunk; on failure every article of the chunk gets its hints."""
+        articles_text = "\n\n".join(_classification_entry(i, a) for i, a in enumerate(articles))
 
         prompt = f"""You are an AI news classifier for a bilingual (German/English) AI newsletter.
 
@@ -354,24 +517,17 @@ Fields:
 
 Output ONLY the JSON array, no markdown fences."""
 
-        response = self._call_llm(prompt, temperature=0.1, use_classifier=True)
+        try:
+            response = self._call_with_fallback(prompt, temperature=0.1, timeout=120.0, models=models)
+        except Exception as e:
+            logger.warning(f"Classification chunk of {len(articles)} failed, using hints: {e}")
+            return [_with_hints(a) for a in articles]
         classifications = parse_llm_json(response, fallback=None)
 
-        if classifications is None:
-            logger.warning("Could not parse classification response, using hints")
-            for a in articles:
-                a["section"] = a.get("original_section", "tech")
-                a["relevance"] = 0.5
-            return articles
-
-        classified = []
         # BUG-H7: Validate classification_map structure before use
         if not isinstance(classifications, list):
-            logger.warning("Classification result is not a list, using hints")
-            for a in articles:
-                a["section"] = a.get("original_section", "tech")
-                a["relevance"] = 0.5
-            return articles
+            logger.warning(f"Could not parse classification response for {len(articles)} articles, using hints")
+            return [_with_hints(a) for a in articles]
 
         classification_map = {}
         for c in classifications:
@@ -382,24 +538,69 @@ Output ONLY the JSON array, no markdown fences."""
                     idx = int(idx)
                 classification_map[idx] = c
 
+        classified = []
         for i, article in enumerate(articles):
             c = classification_map.get(i)
             if c is None:
-                article["section"] = article.get("original_section", "tech")
-                article["relevance"] = 0.5
-                classified.append(article)
+                classified.append(_with_hints(article))
                 continue
 
             if c.get("duplicate_of") is not None:
+                # Kept with its marker so callers can tell duplicates from omissions
+                dup = c["duplicate_of"]
+                if isinstance(dup, str) and dup.isdigit():
+                    dup = int(dup)
+                if isinstance(dup, int) and 0 <= dup < len(articles):
+                    dup = articles[dup].get("id", dup)
+                article["duplicate_of"] = dup
+                article["section"] = "duplicate"
+                article["relevance"] = 0.0
+                classified.append(article)
                 continue
 
-            article["section"] = c["section"]
+            article["section"] = c.get("section") or article.get("original_section", "tech")
             article["relevance"] = c.get("relevance", 0.5)
             classified.append(article)
-
-        classified.sort(key=lambda a: a.get("relevance", 0), reverse=True)
         return classified
 
+    def select_candidates(self, section: str, items: list[dict], keep: int,
+                          models: Optional[list[str]] = None) -> list[int]:
+        """
+        Map step of map-reduce selection: pick the `keep` best items of one batch.
+
+        Uses the free classifier chain (starting at models[0] if given).
+
+        Returns:
+            Indices into items, best first
+
+        Raises:
+            ValueError: If the response is not a list of indices
+        """
+        entries = "\n".join(
+            f"[{i}] {candidate_line(section, item)}" for i, item in enumerate(items)
+        )
+        prompt = f"""You are pre-selecting candidates for a bilingual (German/English) AI newsletter.
+From these {len(items)} items, pick the {keep} that are {SELECTION_FOCUS[section]}.
+
+ITEMS:
+{entries}
+
+Return ONLY a JSON array of the selected item indices, best first, e.g. [0, 3, 7, 12].
+Output ONLY valid JSON, no explanation."""
+
+        response = self._call_with_fallback(prompt, temperature=0.1, timeout=120.0, expect_json=True, models=models)
+        indices = parse_llm_json(response, fallback=None)
+        if not isinstance(indices, list):
+            raise ValueError(f"Selection response is not a list: {str(indices)[:100]}")
+        selected = []
+        for idx in indices:
+            if isinstance(idx, str) and idx.isdigit():
+                idx = int(idx)
+            if isinstance(idx, int) and 0 <= idx < len(items) and idx not in selected:
+                selected.append(idx)
+        return selected[:keep]
+
+    @cached_section("tech", ("source", "title", "link", "summary", "published"), limit=40, temperature=0.3)
     def process_tech_articles(
         self,
         articles: list[dict],
@@ -454,6 +655,12 @@ Rules:
         response = self._call_llm(prompt, temperature=0.3)
         return parse_llm_json(response, fallback={"de": [], "en": []})
 
+    @cached_section(
+        "videos",
+        ("video_id", "original_title", "channel_name", "view_count_formatted", "duration_formatted", "description"),
+        limit=20,
+        temperature=0.3,
+    )
     def process_youtube_videos(
         self,
         videos: list[dict],
@@ -510,6 +717,7 @@ Output ONLY valid JSON."""
         response = self._call_llm(prompt, temperature=0.3)
         return parse_llm_json(response, fallback={"de": [], "en": []})
 
+    @cached_section("investment", ("source", "title", "link", "summary", "published"), limit=40, temperature=0.3)
     def process_investment_articles(self, articles: list[dict], count: int = 10) -> dict:
         """Process investment articles into bilingual feed format."""
         if not articles:
@@ -765,6 +973,7 @@ Output ONLY valid JSON."""
                         ma[lang] = arr[:count]
         return result
 
+    @cached_section("tips", ("source", "title", "summary"), limit=15, temperature=0.2)
     def process_tips_articles(self, articles: list[dict], count: int = 15) -> dict:
         """Process tips articles into bilingual feed format."""
         if not articles:
@@ -861,17 +1070,59 @@ Output ONLY valid JSON."""
         if not isinstance(result, dict):
             logger.warning(f"Trends result is not a dict (got {type(result).__name__}), using fallback")
             result = {"trends": {"de": [], "en": []}}
-        result["teamMembers"] = self._default_team_members()
+        result["teamMembers"] = self.default_team_members()
         return result
 
+    def polish_trend_titles(self, titles: list[str], contexts: list[str]) -> list[tuple[str, str]]:
+        """
+        Rewrite locally extracted trend phrases into short EN/DE topic titles.
+
+        Uses the free classifier chain; one call for all trends.
+
+        Args:
+            titles: Extracted phrases, best first
+            contexts: A post excerpt in which each phrase appears
+
+        Returns:
+            (DE title, EN title) per phrase, in input order
+
+        Raises:
+            ValueError: If the response is not a list of title objects
+        """
+        entries = "\n".join(
+            f'[{i}] "{title}" - {context}' for i, (title, context) in enumerate(zip(titles, contexts))
+        )
+        prompt = f"""These {len(titles)} key phrases were extracted as this week's trending AI topics.
+Each comes with a news excerpt it appears in.
+
+{entries}
+
+Rewrite each phrase as a short topic title (2-5 words) in English and German.
+Keep names of companies, products and people unchanged. Keep the order.
+
+Output JSON array, one object per phrase:
+[{{"en": "Topic Name", "de": "Themenname"}}]
+Output ONLY valid JSON."""
+
+        response = self._call_with_fallback(prompt, temperature=0.2, timeout=60.0, expect_json=True)
+        result = parse_llm_json(response, fallback=None)
+        if not isinstance(result, list):
+            raise ValueError(f"Trend titles response is not a list: {str(result)[:100]}")
+        return [
+            (str(entry.get("de") or entry.get("en") or title), str(entry.get("en") or title))
+            for entry, title in zip(result, titles)
+            if isinstance(entry, dict)
+        ]
+
     def _default_trends(self) -> dict:
         """Return default trends structure."""
         return {
             "trends": {"de": [], "en": []},
-            "teamMembers": self._default_team_members(),
+            "teamMembers": self.default_team_members(),
         }
 
-    def _default_team_members(self) -> dict:
+    @staticmethod
+    def default_team_members() -> dict:
         """Return default team members."""
         return {
             "de": [
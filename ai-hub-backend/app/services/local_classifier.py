@@ -0,0 +1,323 @@
+"""
+Local article classifier (section + relevance) trained on past LLM labels.
+
+The model is a softmax regression over hashed word unigrams and bigrams of
+title and summary start, plus source and feed-hint tokens. A second,
+sigmoid output predicts relevance. Training and inference are NumPy only.
+The trained weights live in one .npz artifact (LOCAL_CLASSIFIER_PATH,
+default ``models/article_classifier.npz``), which ships with the image.
+
+In stage 2, articles whose top section probability reaches
+LOCAL_CLASSIFIER_THRESHOLD are labelled locally; the rest still go to the
+LLM classifier. A share of the confident ones (LOCAL_CLASSIFIER_AUDIT_RATE)
+goes to the LLM as well, and the agreement between both is recorded as
+'classifier' metric spans of the run.
+
+Retrain with ``python -m scripts.train_classifier``.
+"""
+
+import json
+import logging
+import os
+import random
+import re
+import threading
+import zlib
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+SECTIONS = ["tech", "investment", "tips"]
+N_FEATURES = 2 ** 18
+
+_TAG = re.compile(r"<[^>]+>")
+_WORD = re.compile(r"\w+")
+_SUMMARY_CHARS = 500
+
+_lock = threading.Lock()
+_loaded: dict[str, Optional["LocalClassifier"]] = {}
+
+
+def default_path() -> str:
+    return get_settings().local_classifier_path or os.path.join(
+        os.path.dirname(__file__), "..", "..", "models", "article_classifier.npz"
+    )
+
+
+def _tokens(article: dict) -> list[str]:
+    title = _WORD.findall((article.get("title") or "").lower())
+    summary = _WORD.findall(_TAG.sub(" ", article.get("summary") or "")[:_SUMMARY_CHARS].lower())
+    tokens = ["__bias__", f"src:{article.get('source', '')}", f"hint:{article.get('original_section', '')}"]
+    for prefix, words in (("t:", title), ("s:", summary)):
+        tokens.extend(prefix + w for w in words)
+        tokens.extend(f"{prefix}{a} {b}" for a, b in zip(words, words[1:]))
+    return tokens
+
+
+def featurize(articles: list[dict]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Hashed, log-scaled, L2-normalized features in CSR form.
+
+    Returns:
+        (indices, values, indptr); every row has at least the bias feature
+    """
+    indices, values, indptr = [], [], [0]
+    for article in articles:
+        counts: dict[int, int] = {}
+        for token in _tokens(article):
+            h = zlib.crc32(token.encode("utf-8")) & (N_FEATURES - 1)
+            counts[h] = counts.get(h, 0) + 1
+        row_values = 1.0 + np.log(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+        indices.extend(counts)
+        values.append(row_values / np.linalg.norm(row_values))
+        indptr.append(len(indices))
+    return (
+        np.array(indices, dtype=np.int64),
+        np.concatenate(values) if values else np.zeros(0, dtype=np.float32),
+        np.array(indptr, dtype=np.int64),
+    )
+
+
+def _rows(indices: np.ndarray, values: np.ndarray, indptr: np.ndarray, rows: np.ndarray):
+    """CSR sub-matrix of the given rows."""
+    parts = [np.arange(indptr[r], indptr[r + 1]) for r in rows]
+    lengths = np.array([len(p) for p in parts], dtype=np.int64)
+    positions = np.concatenate(parts)
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    return indices[positions], values[positions], starts, lengths
+
+
+def _softmax(logits: np.ndarray) -> np.ndarray:
+    shifted = np.exp(logits - logits.max(axis=1, keepdims=True))
+    return shifted / shifted.sum(axis=1, keepdims=True)
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+class LocalClassifier:
+    """Trained weights: columns are the section logits, then the relevance logit."""
+
+    def __init__(self, weights: np.ndarray, bias: np.ndarray, metadata: Optional[dict] = None):
+        self.weights = weights
+        self.bias = bias
+        self.metadata = metadata or {}
+
+    def _logits(self, idx: np.ndarray, val: np.ndarray, starts: np.ndarray) -> np.ndarray:
+        return np.add.reduceat(self.weights[idx] * val[:, None], starts, axis=0) + self.bias
+
+    def predict(self, articles: list[dict]) -> tuple[list[str], np.ndarray, np.ndarray]:
+        """
+        Classify articles.
+
+        Returns:
+            (sections, confidence = top section probability, relevance in [0, 1])
+        """
+        if not articles:
+            return [], np.zeros(0), np.zeros(0)
+        indices, values, indptr = featurize(articles)
+        logits = self._logits(indices, values, indptr[:-1])
+        probs = _softmax(logits[:, :len(SECTIONS)])
+        best = probs.argmax(axis=1)
+        return [SECTIONS[i] for i in best], probs.max(axis=1), _sigmoid(logits[:, len(SECTIONS)])
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f, weights=self.weights.astype(np.float32), bias=self.bias.astype(np.float32),
+                metadata=np.array(json.dumps(self.metadata)),
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "LocalClassifier":
+        with np.load(path) as data:
+            return cls(data["weights"], data["bias"], json.loads(str(data["metadata"])))
+
+
+def get_classifier() -> Optional[LocalClassifier]:
+    """The bundled classifier, or None when disabled or not trained yet (loaded once per process)."""
+    settings = get_settings()
+    if not settings.local_classifier_enabled:
+        return None
+    path = default_path()
+    with _lock:
+        if path not in _loaded:
+            try:
+                _loaded[path] = LocalClassifier.load(path)
+                logger.info(f"Loaded local classifier from {path} ({_loaded[path].metadata.get('trainedAt')})")
+            except FileNotFoundError:
+                logger.info(f"No local classifier at {path}, classifying with the LLM only")
+                _loaded[path] = None
+            except Exception as e:
+                logger.warning(f"Could not load local classifier from {path}: {e}")
+                _loaded[path] = None
+        return _loaded[path]
+
+
+def reset_classifier() -> None:
+    with _lock:
+        _loaded.clear()
+
+
+def split_confident(articles: list[dict], threshold: Optional[float] = None,
+                    audit_rate: Optional[float] = None) -> tuple[dict, dict, list[int]]:
+    """
+    Local predictions for a batch.
+
+    Args:
+        articles: Article dicts with an "id" each
+        threshold: Minimum top probability to trust (default LOCAL_CLASSIFIER_THRESHOLD)
+        audit_rate: Share of confident predictions also sent to the LLM
+
+    Returns:
+        (confident {id: (section, relevance)} to apply locally,
+         audited {id: section} to compare with the LLM,
+         ids of low-confidence articles)
+    """
+    settings = get_settings()
+    threshold = settings.local_classifier_threshold if threshold is None else threshold
+    audit_rate = settings.local_classifier_audit_rate if audit_rate is None else audit_rate
+    classifier = get_classifier()
+    if classifier is None or not articles:
+        return {}, {}, [a["id"] for a in articles]
+
+    sections, confidence, relevance = classifier.predict(articles)
+    confident, audited, uncertain = {}, {}, []
+    for article, section, conf, rel in zip(articles, sections, confidence.tolist(), relevance.tolist()):
+        if conf < threshold:
+            uncertain.append(article["id"])
+        elif random.random() < audit_rate:
+            audited[article["id"]] = section
+        else:
+            confident[article["id"]] = (section, round(rel, 3))
+    return confident, audited, uncertain
+
+
+# --- Training ---
+
+
+def load_training_data(db: Session, max_samples: int = 50000) -> list[dict]:
+    """
+    LLM-labelled raw articles, newest first, one per content hash.
+
+    Only rows with label_source "llm" are used: labels from the local
+    classifier itself, the seen index, tips rules and hint fallbacks would
+    feed the model its own predictions back. Duplicates are left out.
+    """
+    from app.models import RawArticle
+
+    rows = db.query(
+        RawArticle.source, RawArticle.title, RawArticle.summary, RawArticle.original_section,
+        RawArticle.section, RawArticle.relevance, RawArticle.content_hash,
+    ).filter(
+        RawArticle.label_source == "llm",
+        RawArticle.section.in_(SECTIONS),
+        RawArticle.relevance.is_not(None),
+    ).order_by(RawArticle.created_at.desc()).limit(max_samples * 2)
+
+    samples, seen = [], set()
+    for source, title, summary, original_section, section, relevance, digest in rows:
+        key = digest or title
+        if key in seen:
+            continue
+        seen.add(key)
+        samples.append({
+            "source": source, "title": title, "summary": summary, "original_section": original_section,
+            "section": section, "relevance": float(relevance),
+        })
+        if len(samples) >= max_samples:
+            break
+    return samples
+
+
+def train(samples: list[dict], epochs: int = 6, learning_rate: float = 5.0, batch_size: int = 256,
+          holdout: float = 0.1, threshold: Optional[float] = None, seed: int = 13) -> LocalClassifier:
+    """
+    Train on labelled samples; holdout metrics are stored in the model metadata.
+
+    Raises:
+        ValueError: If there are too few samples
+    """
+    if len(samples) < 200:
+        raise ValueError(f"Need at least 200 labelled articles to train, got {len(samples)}")
+    threshold = get_settings().local_classifier_threshold if threshold is None else threshold
+
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(len(samples))
+    n_test = max(int(len(samples) * holdout), 1)
+    test, train_rows = order[:n_test], order[n_test:]
+
+    indices, values, indptr = featurize(samples)
+    labels = np.array([SECTIONS.index(s["section"]) for s in samples])
+    targets = np.zeros((len(samples), len(SECTIONS)), dtype=np.float32)
+    targets[np.arange(len(samples)), labels] = 1.0
+    relevance = np.clip(np.array([s["relevance"] for s in samples], dtype=np.float32), 0, 1)
+
+    model = LocalClassifier(
+        np.zeros((N_FEATURES, len(SECTIONS) + 1), dtype=np.float32),
+        np.zeros(len(SECTIONS) + 1, dtype=np.float32),
+    )
+    for epoch in range(epochs):
+        lr = learning_rate / (1 + epoch)
+        shuffled = rng.permutation(train_rows)
+        for start in range(0, len(shuffled), batch_size):
+            rows = shuffled[start:start + batch_size]
+            idx, val, starts, lengths = _rows(indices, values, indptr, rows)
+            logits = model._logits(idx, val, starts)
+            grad = np.concatenate([
+                _softmax(logits[:, :len(SECTIONS)]) - targets[rows],
+                (_sigmoid(logits[:, len(SECTIONS)]) - relevance[rows])[:, None],
+            ], axis=1) / len(rows)
+            np.add.at(model.weights, idx, -lr * val[:, None] * np.repeat(grad, lengths, axis=0))
+            model.bias -= lr * grad.sum(axis=0)
+
+    test_samples = [samples[i] for i in test]
+    predicted, confidence, predicted_relevance = model.predict(test_samples)
+    correct = np.array([p == s["section"] for p, s in zip(predicted, test_samples)])
+    confident = confidence >= threshold
+    model.metadata = {
+        "trainedAt": datetime.utcnow().isoformat(),
+        "samples": len(train_rows),
+        "holdout": len(test),
+        "accuracy": round(float(correct.mean()), 4),
+        "threshold": threshold,
+        "confidentShare": round(float(confident.mean()), 4),
+        "confidentAccuracy": round(float(correct[confident].mean()), 4) if confident.any() else None,
+        "relevanceMae": round(float(np.abs(predicted_relevance - relevance[test]).mean()), 4),
+        "classCounts": {s: int((labels == i).sum()) for i, s in enumerate(SECTIONS)},
+    }
+    return model
+
+
+def agreement_summary(db: Session, runs: int = 20) -> dict:
+    """Local/LLM agreement on audited articles over the most recent runs that recorded it."""
+    from app.models import CollectionRunMetric
+    from app.services.metrics import CLASSIFIER
+
+    recent_runs = db.query(CollectionRunMetric.run_id).filter(
+        CollectionRunMetric.kind == CLASSIFIER,
+    ).group_by(CollectionRunMetric.run_id).order_by(func.max(CollectionRunMetric.run_id).desc()).limit(runs)
+    spans = db.query(CollectionRunMetric.attrs).filter(
+        CollectionRunMetric.kind == CLASSIFIER,
+        CollectionRunMetric.run_id.in_(recent_runs.scalar_subquery()),
+    ).all()
+
+    totals = {"local": 0, "llm": 0, "audited": 0, "agreed": 0}
+    for (attrs,) in spans:
+        for key in totals:
+            totals[key] += (attrs or {}).get(key, 0)
+    classified = totals["local"] + totals["llm"]
+    return {
+        **totals,
+        "localShare": round(totals["local"] / classified, 4) if classified else None,
+        "agreement": round(totals["agreed"] / totals["audited"], 4) if totals["audited"] else None,
+    }
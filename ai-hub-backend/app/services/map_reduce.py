@@ -0,0 +1,119 @@
+"""
+Map-reduce candidate selection for stage 3.
+
+A section's final selection prompt holds only as many candidates as fit its
+token budget (see prerank). On large days the rest of the pool would
+never be considered. When a pool does not fit, it is split into map batches
+of about MAP_REDUCE_BATCH_TOKEN_BUDGET tokens. Every batch picks its best
+items in one LLM call (free classifier chain), and batches run in
+parallel. The survivors form the pool for the final section processor, so
+every candidate is looked at while wall-clock time grows by one LLM call
+depth instead of one call per batch.
+
+Section nodes run concurrently under the collector's "llm" resource, so
+the map calls of all sections share one process-wide set of
+MAP_REDUCE_MAX_WORKERS slots instead of each section adding its own.
+
+Batches are striped over the locally ranked pool (item i goes to batch
+i mod n), so every batch sees a similar mix of strong and weak candidates
+and the per-batch quota is fair. A batch whose call fails keeps its
+locally best items instead.
+"""
+
+import logging
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from app.config import get_settings
+from app.services.llm_processor import LLMProcessor, candidate_line
+from app.services.metrics import submit_with_context
+from app.services.prerank import estimate_tokens, prompt_capacity, prompt_tokens, rank
+
+logger = logging.getLogger(__name__)
+
+_MAX_LEVELS = 3
+
+_map_slots: Optional[threading.BoundedSemaphore] = None
+_map_slots_lock = threading.Lock()
+
+
+def _slots() -> threading.BoundedSemaphore:
+    """Map-call slots shared by every section (created from settings on first use)."""
+    global _map_slots
+    with _map_slots_lock:
+        if _map_slots is None:
+            _map_slots = threading.BoundedSemaphore(max(1, get_settings().map_reduce_max_workers))
+        return _map_slots
+
+
+def _fits(section: str, items: list[dict]) -> bool:
+    cap, budget = prompt_capacity(section)
+    return len(items) <= cap and int(prompt_tokens(section, items).sum()) <= budget
+
+
+def _final_target(section: str, items: list[dict], count: int) -> int:
+    """How many candidates the final prompt holds, from the pool's median item size."""
+    cap, budget = prompt_capacity(section)
+    median = max(int(sorted(prompt_tokens(section, items).tolist())[len(items) // 2]), 1)
+    return max(min(budget // median, cap), min(count, cap))
+
+
+def _select_batch(section: str, batch: list[dict], keep: int, models: list[str]) -> list[dict]:
+    try:
+        with _slots():
+            indices = LLMProcessor().select_candidates(section, batch, keep, models=models)
+    except Exception as e:
+        logger.warning(f"Map batch of {len(batch)} {section} candidates failed, keeping local top {keep}: {e}")
+        return batch[:keep]
+    return [batch[i] for i in indices] or batch[:keep]
+
+
+def _map_level(section: str, pool: list[dict], target: int) -> list[dict]:
+    settings = get_settings()
+    tokens = sum(estimate_tokens(candidate_line(section, item)) for item in pool)
+    n_batches = max(2, math.ceil(tokens / settings.map_reduce_batch_token_budget))
+    batches = [pool[i::n_batches] for i in range(n_batches)]
+    keep = math.ceil(target / n_batches)
+
+    models = LLMProcessor.CLASSIFIER_MODELS
+    with ThreadPoolExecutor(max_workers=settings.map_reduce_max_workers) as executor:
+        futures = [
+            submit_with_context(
+                executor, _select_batch, section, batch, keep, models[i % len(models):] + models[:i % len(models)],
+            )
+            for i, batch in enumerate(batches)
+        ]
+        survivors = [item for future in futures for item in future.result()]
+
+    logger.info(f"Map-reduce {section}: {len(pool)} candidates in {n_batches} batches -> {len(survivors)}")
+    return survivors
+
+
+def map_reduce_candidates(section: str, items: list[dict], count: int) -> list[dict]:
+    """
+    Reduce a section's candidate pool to what its final prompt can hold.
+
+    Args:
+        section: Section key ('tech', 'investment', 'tips', 'videos')
+        items: Full candidate pool
+        count: Items the final processor must select
+
+    Returns:
+        The pool unchanged if it already fits, otherwise the map survivors
+        in local rank order
+    """
+    if not items or _fits(section, items):
+        return items
+
+    pool = rank(section, items)
+    target = _final_target(section, pool, count)
+    for _ in range(_MAX_LEVELS):
+        if len(pool) <= target:
+            break
+        survivors = _map_level(section, pool, target)
+        if len(survivors) >= len(pool):
+            break
+        pool = rank(section, survivors)
+    return pool
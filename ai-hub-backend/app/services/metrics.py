@@ -0,0 +1,267 @@
+"""
+Pipeline instrumentation: spans per stage and sub-task.
+
+Code wraps units of work in ``span(name, kind=...)``. While a recorder is
+active (``recording()`` around a collection run) every span is collected
+with its duration, item count and status; afterwards the spans are stored
+in ``collection_run_metrics``. Without an active recorder spans are no-ops.
+
+The recorder lives in a context variable, so worker threads only see it
+when submitted through ``submit_with_context`` (which copies the caller's
+context). Concurrent runs in one process therefore keep separate metrics.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import case, func, insert
+from sqlalchemy.orm import Session
+
+from app.models import CollectionRun, CollectionRunMetric
+
+logger = logging.getLogger(__name__)
+
+# Span kinds used across the pipeline
+STAGE = "stage"
+FEED = "feed"
+HN_QUERY = "hn_query"
+YOUTUBE = "youtube"
+TRANSCRIPT = "transcript"
+LLM_CALL = "llm_call"
+TRANSLATION = "translation"
+CLASSIFIER = "classifier"
+
+_recorder: contextvars.ContextVar[Optional["MetricsRecorder"]] = contextvars.ContextVar(
+    "metrics_recorder", default=None
+)
+_stage: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("metrics_stage", default=None)
+
+
+@dataclass
+class Span:
+    """One timed unit of work. Set ``items`` / ``attrs`` inside the with-block."""
+
+    name: str
+    kind: str
+    stage: Optional[str]
+    started_at: datetime
+    items: Optional[int] = None
+    attrs: dict[str, Any] = field(default_factory=dict)
+    duration_ms: float = 0.0
+    status: str = "ok"
+    error: Optional[str] = None
+
+
+class MetricsRecorder:
+    """Thread-safe collector for the spans of one run."""
+
+    def __init__(self, run_id: Optional[int] = None):
+        self.run_id = run_id
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def add(self, span_: Span) -> None:
+        with self._lock:
+            self.spans.append(span_)
+
+
+@contextmanager
+def span(name: str, kind: str = STAGE, items: Optional[int] = None, **attrs):
+    """
+    Time a block of work.
+
+    Spans of kind 'stage' also become the stage label of every span opened
+    inside them (including in threads started via submit_with_context).
+    Exceptions are recorded as status 'error' and re-raised.
+    """
+    recorder = _recorder.get()
+    current = Span(
+        name=name,
+        kind=kind,
+        stage=name if kind == STAGE else _stage.get(),
+        started_at=datetime.utcnow(),
+        items=items,
+        attrs=attrs,
+    )
+    token = _stage.set(name) if kind == STAGE else None
+    start = time.perf_counter()
+    try:
+        yield current
+    except BaseException as e:
+        current.status = "error"
+        current.error = str(e)[:500]
+        raise
+    finally:
+        current.duration_ms = (time.perf_counter() - start) * 1000
+        if token is not None:
+            _stage.reset(token)
+        if recorder is not None:
+            recorder.add(current)
+
+
+def submit_with_context(executor, fn, *args, **kwargs):
+    """executor.submit() that runs fn in a copy of the caller's context (keeps the recorder)."""
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+@contextmanager
+def recording(run_id: Optional[int] = None):
+    """Activate a recorder for the duration of the block."""
+    recorder = MetricsRecorder(run_id)
+    token = _recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorder.reset(token)
+
+
+def save_run_metrics(db: Session, run_id: int, recorder: MetricsRecorder) -> int:
+    """
+    Persist recorded spans for a run (bulk insert, commits).
+
+    Failures are logged and never fatal: metrics must not fail a collection.
+    """
+    rows = [
+        {
+            "run_id": run_id,
+            "stage": s.stage,
+            "kind": s.kind,
+            "name": s.name[:200],
+            "started_at": s.started_at,
+            "duration_ms": round(s.duration_ms, 2),
+            "items": s.items,
+            "status": s.status,
+            "error": s.error,
+            "attrs": s.attrs or None,
+        }
+        for s in recorder.spans
+    ]
+    if not rows:
+        return 0
+    try:
+        db.execute(insert(CollectionRunMetric), rows)
+        db.commit()
+    except Exception as e:
+        logger.warning(f"Failed to store run metrics (non-fatal): {e}")
+        db.rollback()
+        return 0
+    logger.info(f"Stored {len(rows)} metric spans for run {run_id}")
+    return len(rows)
+
+
+def summarize_run_metrics(db: Session, run_id: int) -> list[dict]:
+    """
+    Aggregate a run's spans per (stage, kind, name).
+
+    Returns:
+        List of dicts with count, totalMs, maxMs, items and errors, slowest first
+    """
+    rows = db.query(
+        CollectionRunMetric.stage,
+        CollectionRunMetric.kind,
+        CollectionRunMetric.name,
+        func.count(CollectionRunMetric.id),
+        func.sum(CollectionRunMetric.duration_ms),
+        func.max(CollectionRunMetric.duration_ms),
+        func.sum(CollectionRunMetric.items),
+        func.sum(case((CollectionRunMetric.status == "error", 1), else_=0)),
+    ).filter(
+        CollectionRunMetric.run_id == run_id,
+    ).group_by(
+        CollectionRunMetric.stage, CollectionRunMetric.kind, CollectionRunMetric.name,
+    ).all()
+
+    summary = [
+        {
+            "stage": stage,
+            "kind": kind,
+            "name": name,
+            "count": count,
+            "totalMs": round(total or 0, 1),
+            "maxMs": round(max_ms or 0, 1),
+            "items": items,
+            "errors": errors or 0,
+        }
+        for stage, kind, name, count, total, max_ms, items, errors in rows
+    ]
+    summary.sort(key=lambda m: m["totalMs"], reverse=True)
+    return summary
+
+
+def _label(value) -> str:
+    """Escape a Prometheus label value."""
+    return str(value or "").replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_prometheus(db: Session) -> str:
+    """
+    Render collection metrics in the Prometheus text exposition format.
+
+    Run counters cover all runs; span series describe the latest finished
+    run, so a scrape after every daily run yields one sample per source,
+    model and stage to trend over time.
+    """
+    lines = []
+
+    def metric(name: str, help_text: str, metric_type: str, samples: list[tuple[dict, float]]) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for labels, value in samples:
+            label_str = ",".join(f'{k}="{_label(v)}"' for k, v in labels.items())
+            lines.append(f"{name}{{{label_str}}} {value}" if label_str else f"{name} {value}")
+
+    status_counts = db.query(CollectionRun.status, func.count(CollectionRun.id)).group_by(CollectionRun.status).all()
+    metric(
+        "ai_hub_collection_runs_total", "Collection runs by status.", "counter",
+        [({"status": status}, count) for status, count in status_counts],
+    )
+
+    last_success = db.query(func.max(CollectionRun.finished_at)).filter(CollectionRun.status == "completed").scalar()
+    if last_success:
+        metric(
+            "ai_hub_collection_last_success_timestamp_seconds",
+            "Finish time of the latest successful collection run.", "gauge",
+            [({}, int((last_success - datetime(1970, 1, 1)).total_seconds()))],
+        )
+
+    run = db.query(CollectionRun).filter(
+        CollectionRun.finished_at.isnot(None),
+    ).order_by(CollectionRun.finished_at.desc()).first()
+    if not run:
+        return "\n".join(lines) + "\n"
+
+    run_labels = {"period": run.period_id, "status": run.status}
+    metric(
+        "ai_hub_collection_last_run_duration_seconds", "Wall time of the latest finished run.", "gauge",
+        [(run_labels, round((run.finished_at - run.started_at).total_seconds(), 3))],
+    )
+
+    summary = summarize_run_metrics(db, run.id)
+    span_labels = [({"stage": m["stage"], "kind": m["kind"], "name": m["name"]}, m) for m in summary]
+    metric(
+        "ai_hub_collection_span_seconds", "Total span time in the latest finished run.", "gauge",
+        [(labels, round(m["totalMs"] / 1000, 3)) for labels, m in span_labels],
+    )
+    metric(
+        "ai_hub_collection_span_max_seconds", "Slowest single span in the latest finished run.", "gauge",
+        [(labels, round(m["maxMs"] / 1000, 3)) for labels, m in span_labels],
+    )
+    metric(
+        "ai_hub_collection_span_count", "Number of spans in the latest finished run.", "gauge",
+        [(labels, m["count"]) for labels, m in span_labels],
+    )
+    metric(
+        "ai_hub_collection_span_errors", "Failed spans in the latest finished run.", "gauge",
+        [(labels, m["errors"]) for labels, m in span_labels],
+    )
+    metric(
+        "ai_hub_collection_span_items", "Items produced by spans in the latest finished run.", "gauge",
+        [(labels, m["items"]) for labels, m in span_labels if m["items"] is not None],
+    )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,182 @@
+"""
+Local near-duplicate detection for raw articles.
+
+Aggregators (Techmeme, Google News, Yahoo Finance, press wires) repeat
+stories that other feeds carry under a different URL, so exact link/hash
+dedup misses them. Before classification, every article gets a MinHash
+signature over word shingles of its title and summary start. LSH banding
+finds candidate pairs without comparing all pairs. Pairs whose estimated
+Jaccard similarity reaches NEAR_DUP_THRESHOLD are merged into clusters.
+Each cluster keeps one representative, chosen by source priority, then
+HN points and comments, then summary length. The others are marked as
+duplicates and never reach the classifier.
+
+Source priority is the ``weight`` of a source in sources.yaml (as for
+pre-ranking); aggregators default to a lower priority than original
+publishers.
+"""
+
+import logging
+import re
+import zlib
+from collections import defaultdict
+from typing import Callable, Hashable, Optional, TypeVar
+
+import numpy as np
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Lower priority for feeds that mostly repeat other publishers' stories
+AGGREGATOR_PRIORITY = {
+    "Techmeme": 0.5,
+    "Google News M&A": 0.5,
+    "Yahoo Finance": 0.7,
+    "PR Newswire": 0.7,
+    "GlobeNewswire M&A": 0.7,
+}
+
+_PRIME = 4294967311  # Smallest prime above 2**32
+_TAG = re.compile(r"<[^>]+>")
+_WORD = re.compile(r"\w+")
+_SUMMARY_CHARS = 400
+_SHINGLE_SIZE = 2
+
+
+def source_priorities() -> dict[str, float]:
+    from app.services.prerank import source_weights
+
+    return {**AGGREGATOR_PRIORITY, **source_weights()}
+
+
+def shingles(title: str, summary: str) -> np.ndarray:
+    """CRC32 hashes of the word shingles of a title and the start of its summary."""
+    text = f"{title or ''} {_TAG.sub(' ', summary or '')[:_SUMMARY_CHARS]}"
+    words = _WORD.findall(text.lower())
+    if len(words) < _SHINGLE_SIZE:
+        grams = words
+    else:
+        grams = [" ".join(words[i:i + _SHINGLE_SIZE]) for i in range(len(words) - _SHINGLE_SIZE + 1)]
+    return np.unique(np.array([zlib.crc32(g.encode("utf-8")) for g in grams], dtype=np.uint64))
+
+
+class NearDuplicateIndex:
+    """
+    MinHash/LSH index of kept articles.
+
+    One index can be fed several batches (streaming stage 1-2): later
+    batches are checked against everything kept so far, and an article
+    matching an already kept one is always the duplicate.
+    """
+
+    def __init__(self, threshold: Optional[float] = None, num_perm: Optional[int] = None,
+                 bands: Optional[int] = None, seed: int = 1):
+        settings = get_settings()
+        self.threshold = settings.near_dup_threshold if threshold is None else threshold
+        num_perm = num_perm or settings.near_dup_num_perm
+        self.bands = bands or settings.near_dup_bands
+        if num_perm % self.bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({self.bands})")
+        self.rows = num_perm // self.bands
+
+        rng = np.random.default_rng(seed)
+        # a < 2**31 and hashes < 2**32 keep a*x + b below 2**64
+        self._a = rng.integers(1, 2**31, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 2**31, size=num_perm, dtype=np.uint64)
+        self._buckets: dict[tuple[int, bytes], list[Hashable]] = defaultdict(list)
+        self._signatures: dict[Hashable, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def signature(self, hashes: np.ndarray) -> Optional[np.ndarray]:
+        """MinHash signature of a shingle hash set (None for an empty set)."""
+        if hashes.size == 0:
+            return None
+        return ((np.outer(self._a, hashes) + self._b[:, None]) % _PRIME).min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> list[tuple[int, bytes]]:
+        return [(band, signature[band * self.rows:(band + 1) * self.rows].tobytes()) for band in range(self.bands)]
+
+    def _similar(self, a: np.ndarray, b: np.ndarray) -> bool:
+        return float(np.mean(a == b)) >= self.threshold
+
+    def add(self, key: Hashable, title: str, summary: str) -> None:
+        """Register an article as kept without checking it (e.g. rows labelled earlier)."""
+        signature = self.signature(shingles(title, summary))
+        if signature is None:
+            return
+        self._signatures[key] = signature
+        for band_key in self._band_keys(signature):
+            self._buckets[band_key].append(key)
+
+    def partition(
+        self,
+        items: list[T],
+        key: Callable[[T], Hashable],
+        text: Callable[[T], tuple[str, str]],
+        rank: Callable[[T], tuple],
+    ) -> tuple[list[T], list[T]]:
+        """
+        Split a batch into kept representatives and near-duplicates.
+
+        Args:
+            items: Articles of the batch
+            key: Unique key of an item
+            text: (title, summary) of an item
+            rank: Sort key, higher is a better representative
+
+        Returns:
+            (kept items, duplicate items), each in input order
+        """
+        signatures = {key(item): self.signature(shingles(*text(item))) for item in items}
+        parent = {k: k for k in signatures}
+
+        def find(k):
+            while parent[k] != k:
+                parent[k] = parent[parent[k]]
+                k = parent[k]
+            return k
+
+        # Candidate pairs share at least one band; batch items join clusters
+        # with each other and with kept items from earlier batches
+        batch_buckets: dict[tuple[int, bytes], list[Hashable]] = defaultdict(list)
+        matches_kept: set[Hashable] = set()
+        for k, signature in signatures.items():
+            if signature is None:
+                continue
+            for band_key in self._band_keys(signature):
+                for other in batch_buckets[band_key]:
+                    if find(other) != find(k) and self._similar(signature, signatures[other]):
+                        parent[find(other)] = find(k)
+                batch_buckets[band_key].append(k)
+                if k not in matches_kept and any(
+                    self._similar(signature, self._signatures[kept]) for kept in self._buckets.get(band_key, ())
+                ):
+                    matches_kept.add(k)
+
+        clusters: dict[Hashable, list[T]] = defaultdict(list)
+        for item in items:
+            clusters[find(key(item))].append(item)
+
+        keep: set[Hashable] = set()
+        for members in clusters.values():
+            if any(key(m) in matches_kept for m in members):
+                continue  # The story is already represented by an earlier batch
+            keep.add(key(max(members, key=rank)))
+
+        kept, duplicates = [], []
+        for item in items:
+            k = key(item)
+            if k in keep:
+                kept.append(item)
+                if signatures[k] is not None:
+                    self._signatures[k] = signatures[k]
+                    for band_key in self._band_keys(signatures[k]):
+                        self._buckets[band_key].append(k)
+            else:
+                duplicates.append(item)
+        return kept, duplicates
@@ -0,0 +1,211 @@
+"""
+Local pre-ranking of stage 3 candidates.
+
+Section prompts used to take the first 40/20/15 items in whatever order
+they arrived. Candidates are now scored locally and only the best ones are
+sent, as many as fit the section's token budget
+(PRERANK_<SECTION>_TOKEN_BUDGET). The number is kept between the section's
+output count and the cap its prompt slices to.
+
+Scores are a weighted sum of features scaled to [0, 1], computed for all
+candidates at once with NumPy:
+
+    articles  stage 2 relevance, HN points and comments, recency, keyword hits
+    videos    views, like ratio, duration fit, recency, keyword hits
+
+Article scores are multiplied by the source's ``weight`` from sources.yaml
+(default 1.0). Recency is relative to the newest candidate, so backfills of
+old periods rank the same way as live runs.
+"""
+
+import logging
+from typing import Optional
+
+import numpy as np
+
+from app.config import get_settings
+from app.services.date_utils import parse_article_date
+
+logger = logging.getLogger(__name__)
+
+# Per section: prompt cap, fields the prompt shows with their character
+# limits, and fixed characters of per-item labels (for token estimates)
+PROMPT_SPECS = {
+    "tech": (40, {"source": None, "title": None, "link": None, "summary": 500, "published": None}, 40),
+    "investment": (40, {"source": None, "title": None, "link": None, "summary": 500, "published": None}, 40),
+    "tips": (15, {"source": None, "title": 200, "summary": 100}, 10),
+    "videos": (20, {
+        "video_id": None, "original_title": None, "channel_name": None,
+        "view_count_formatted": None, "duration_formatted": None, "description": 300,
+    }, 60),
+}
+
+# Lowercase substrings that mark a useful candidate, with their weight
+KEYWORDS = {
+    "tech": {
+        "release": 1.0, "launch": 1.0, "open source": 1.0, "open-source": 1.0, "announce": 0.7,
+        "model": 0.5, "benchmark": 0.5, "paper": 0.5, "agent": 0.5, "gpt": 0.5, "claude": 0.5,
+        "gemini": 0.5, "llama": 0.5, "regulation": 0.5,
+    },
+    "investment": {
+        "raises": 1.0, "funding": 1.0, "series": 0.7, "seed": 0.5, "valuation": 1.0, "ipo": 1.0,
+        "acquire": 1.0, "acquisition": 1.0, "merger": 1.0, "investors": 0.5, "融资": 1.0, "收购": 1.0,
+    },
+    "tips": {
+        "how to": 1.0, "tip": 1.0, "prompt": 1.0, "workflow": 1.0, "guide": 0.5, "trick": 1.0,
+        "use case": 0.7, "automate": 0.7,
+    },
+    "videos": {
+        "tutorial": 1.0, "explained": 1.0, "how to": 1.0, "guide": 0.5, "news": 0.5, "course": 0.5,
+        "build": 0.5, "demo": 0.5,
+    },
+}
+
+# Feature weights, in the column order of _article_features/_video_features
+ARTICLE_WEIGHTS = {
+    "tech": np.array([3.0, 0.6, 0.4, 1.0, 0.5]),
+    "investment": np.array([3.0, 0.2, 0.2, 1.0, 0.8]),
+    "tips": np.array([1.0, 0.8, 0.6, 1.0, 1.0]),
+}
+VIDEO_WEIGHTS = np.array([1.5, 0.5, 0.7, 1.0, 0.8])
+
+_RECENCY_HALF_LIFE_HOURS = 48.0
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count: ~4 characters per token for Latin text, ~1 per CJK character."""
+    non_ascii = (len(text.encode("utf-8")) - len(text)) // 2
+    return (len(text) - non_ascii) // 4 + non_ascii
+
+
+def _prompt_tokens(section: str, item: dict) -> int:
+    _, fields, overhead = PROMPT_SPECS[section]
+    chars = "".join(str(item.get(field) or "")[:limit] for field, limit in fields.items())
+    return estimate_tokens(chars) + overhead // 4
+
+
+def _scaled(values: np.ndarray) -> np.ndarray:
+    """Scale to [0, 1] by the maximum (all zeros stay zero)."""
+    top = values.max(initial=0.0)
+    return values / top if top > 0 else values
+
+
+def _recency(dates: list[Optional[str]]) -> np.ndarray:
+    """Exponential decay from the newest date; undated items get a neutral 0.5."""
+    stamps = np.array(
+        [d.timestamp() if d else np.nan for d in map(parse_article_date, dates)],
+        dtype=np.float64,
+    )
+    if np.isnan(stamps).all():
+        return np.full(len(dates), 0.5)
+    age_hours = (np.nanmax(stamps) - stamps) / 3600
+    return np.where(np.isnan(stamps), 0.5, 0.5 ** (age_hours / _RECENCY_HALF_LIFE_HOURS))
+
+
+def _keyword_hits(section: str, texts: list[str]) -> np.ndarray:
+    keywords = KEYWORDS[section]
+    hits = np.array(
+        [sum(w for term, w in keywords.items() if term in text.lower()) for text in texts],
+        dtype=np.float64,
+    )
+    return np.minimum(hits / 3.0, 1.0)
+
+
+def _article_features(section: str, articles: list[dict]) -> np.ndarray:
+    relevance = np.array([a.get("relevance") or 0.0 for a in articles], dtype=np.float64)
+    points = np.log1p([max(a.get("points") or 0, 0) for a in articles])
+    comments = np.log1p([max(a.get("comments") or 0, 0) for a in articles])
+    return np.column_stack([
+        relevance,
+        _scaled(points),
+        _scaled(comments),
+        _recency([a.get("published") for a in articles]),
+        _keyword_hits(section, [f"{a.get('title', '')} {str(a.get('summary') or '')[:500]}" for a in articles]),
+    ])
+
+
+def _video_features(videos: list[dict]) -> np.ndarray:
+    views = np.array([max(v.get("view_count") or 0, 0) for v in videos], dtype=np.float64)
+    likes = np.array([max(v.get("like_count") or 0, 0) for v in videos], dtype=np.float64)
+    minutes = np.array([(v.get("duration_seconds") or 0) / 60 for v in videos], dtype=np.float64)
+    like_ratio = np.divide(likes, views, out=np.zeros_like(likes), where=views > 0)
+    # Shorts and multi-hour streams fit a newsletter badly; 5-40 minutes is best
+    duration_fit = np.interp(minutes, [0, 1, 5, 40, 90], [0.0, 0.1, 1.0, 1.0, 0.3])
+    return np.column_stack([
+        _scaled(np.log1p(views)),
+        np.minimum(like_ratio / 0.05, 1.0),  # 5% likes per view is already excellent
+        duration_fit,
+        _recency([v.get("published_at") for v in videos]),
+        _keyword_hits("videos", [f"{v.get('original_title', '')} {str(v.get('description') or '')[:300]}" for v in videos]),
+    ])
+
+
+def source_weights() -> dict[str, float]:
+    """Source name -> ranking weight from sources.yaml (`weight:` on a source entry)."""
+    from app.services.collector import load_sources
+
+    return {
+        source["name"]: float(source["weight"])
+        for sources in load_sources().values()
+        for source in sources
+        if "weight" in source
+    }
+
+
+def score(section: str, items: list[dict], weights_by_source: Optional[dict[str, float]] = None) -> np.ndarray:
+    """Local score of each candidate (higher is better)."""
+    if not items:
+        return np.zeros(0)
+    if section == "videos":
+        return _video_features(items) @ VIDEO_WEIGHTS
+    weights_by_source = source_weights() if weights_by_source is None else weights_by_source
+    multipliers = np.array([weights_by_source.get(a.get("source"), 1.0) for a in items], dtype=np.float64)
+    return (_article_features(section, items) @ ARTICLE_WEIGHTS[section]) * multipliers
+
+
+def budget_count(tokens: np.ndarray, budget: int, minimum: int, maximum: int) -> int:
+    """How many leading items fit the token budget, clamped to [minimum, maximum]."""
+    fitting = int(np.searchsorted(np.cumsum(tokens), budget, side="right"))
+    return max(min(fitting, maximum), min(minimum, maximum), 0)
+
+
+def rank(section: str, items: list[dict]) -> list[dict]:
+    """Candidates in descending score order (ties keep their incoming, stage 2, order)."""
+    order = np.argsort(-score(section, items), kind="stable")
+    return [items[i] for i in order]
+
+
+def prompt_tokens(section: str, items: list[dict]) -> np.ndarray:
+    """Estimated prompt tokens of each item in the section's selection prompt."""
+    return np.array([_prompt_tokens(section, item) for item in items], dtype=np.int64)
+
+
+def prompt_capacity(section: str) -> tuple[int, int]:
+    """(item cap, token budget) of a section's selection prompt."""
+    return PROMPT_SPECS[section][0], getattr(get_settings(), f"prerank_{section}_token_budget")
+
+
+def shortlist(section: str, items: list[dict], count: int) -> list[dict]:
+    """
+    The best-scoring candidates of a section that fit its token budget.
+
+    Args:
+        section: Section key ('tech', 'investment', 'tips', 'videos')
+        items: Candidates (article or video dicts)
+        count: Items the LLM must select (never send fewer, if available)
+
+    Returns:
+        Candidates in descending score order
+    """
+    if not items:
+        return []
+    cap, budget = prompt_capacity(section)
+    ranked = rank(section, items)[:cap]
+    tokens = prompt_tokens(section, ranked)
+    n = budget_count(tokens, budget, count, len(ranked))
+
+    logger.info(
+        f"Pre-ranked {section}: {len(items)} candidates -> {n} sent "
+        f"(~{int(tokens[:n].sum())} of {budget} prompt tokens)"
+    )
+    return ranked[:n]
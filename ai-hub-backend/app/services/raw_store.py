@@ -0,0 +1,163 @@
+"""
+Bulk writes for raw articles and videos.
+
+Rows are inserted with a single executemany-style statement (SQLAlchemy's
+insertmanyvalues batches them into multi-row INSERTs) instead of one ORM
+object per item. Very large batches, e.g. historical backfills, use
+PostgreSQL COPY when the psycopg2 driver is available.
+"""
+
+import csv
+import io
+import json
+import logging
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models import RawArticle, RawVideo
+from app.services.compression import compress_text
+
+logger = logging.getLogger(__name__)
+
+RAW_ARTICLE_COLUMNS = [
+    "week_id", "source", "title", "link", "summary", "published",
+    "original_section", "raw_data", "content_hash", "created_at",
+]
+COPY_NULL = "\\N"
+# Written as zstd bytea (CompressedText); COPY bypasses the type's bind processing
+COMPRESSED_COLUMNS = {"summary"}
+
+
+def raw_article_values(week_id: str, article: dict, **overrides) -> dict:
+    """Column values for a RawArticle built from a fetched article dict."""
+    values = {
+        "week_id": week_id,
+        "source": article.get("source", "Unknown"),
+        "title": article.get("title", ""),
+        "link": article.get("link", ""),
+        "summary": article.get("summary", ""),
+        "published": article.get("published", ""),
+        "original_section": article.get("original_section", "tech"),
+        "raw_data": {
+            "points": article.get("points"),
+            "comments": article.get("comments"),
+            "hn_url": article.get("hn_url"),
+        },
+        "content_hash": article.get("content_hash"),
+    }
+    values.update(overrides)
+    return values
+
+
+def raw_video_values(week_id: str, video: dict) -> dict:
+    """Column values for a RawVideo built from a fetched video dict."""
+    return {
+        "week_id": week_id,
+        "video_id": video.get("video_id", ""),
+        "title": video.get("original_title", ""),
+        "channel_name": video.get("channel_name", ""),
+        "channel_id": video.get("channel_id"),
+        "description": video.get("description"),
+        "transcript": video.get("transcript"),
+        "thumbnail_url": video.get("thumbnail_url"),
+        "published_at": video.get("published_at"),
+        "duration_seconds": video.get("duration_seconds"),
+        "duration_formatted": video.get("duration_formatted"),
+        "view_count": video.get("view_count"),
+        "like_count": video.get("like_count"),
+        # Description and transcript have their own (compressed) columns
+        "raw_data": {k: v for k, v in video.items() if k not in ("description", "transcript")},
+    }
+
+
+def _copy_field(row: dict, col: str, now: datetime):
+    """Encode one value for COPY (NULL is written as \\N)."""
+    value = row.get(col)
+    if col == "created_at" and value is None:
+        return now
+    if value is None:
+        return COPY_NULL
+    if col == "raw_data":
+        return json.dumps(value)
+    if col in COMPRESSED_COLUMNS:
+        return "\\x" + compress_text(value).hex()  # bytea hex input
+    return value
+
+
+def _copy_raw_articles(db: Session, rows: list[dict]) -> None:
+    """Stream rows into raw_articles with COPY ... FROM STDIN (psycopg2 only)."""
+    now = datetime.utcnow()
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        writer.writerow([_copy_field(row, col, now) for col in RAW_ARTICLE_COLUMNS])
+    buf.seek(0)
+
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {RawArticle.__tablename__} ({', '.join(RAW_ARTICLE_COLUMNS)}) "
+            f"FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')",
+            buf,
+        )
+    finally:
+        cursor.close()
+
+
+def _can_copy(db: Session) -> bool:
+    """COPY needs PostgreSQL through psycopg2."""
+    bind = db.get_bind()
+    return bind.dialect.name == "postgresql" and bind.dialect.driver == "psycopg2"
+
+
+def bulk_insert_raw_articles(db: Session, rows: Iterable[dict]) -> int:
+    """
+    Insert raw article rows in bulk (no commit).
+
+    Uses one executemany INSERT, or COPY once the batch reaches
+    RAW_COPY_THRESHOLD rows on PostgreSQL.
+
+    Args:
+        db: Database session
+        rows: Column dicts, e.g. from raw_article_values()
+
+    Returns:
+        Number of rows inserted
+    """
+    rows = list(rows)
+    if not rows:
+        return 0
+
+    threshold = get_settings().raw_copy_threshold
+    if threshold and len(rows) >= threshold and _can_copy(db):
+        _copy_raw_articles(db, rows)
+        logger.info(f"Copied {len(rows)} raw articles")
+    else:
+        db.execute(insert(RawArticle), rows)
+    return len(rows)
+
+
+def bulk_insert_raw_articles_returning(db: Session, rows: Iterable[dict]) -> list[RawArticle]:
+    """
+    Insert raw article rows in bulk and return them as ORM objects (no commit).
+
+    Used where the caller keeps working with the rows (e.g. classification
+    while streaming); still a single batched INSERT ... RETURNING.
+    """
+    rows = list(rows)
+    if not rows:
+        return []
+    return list(db.scalars(insert(RawArticle).returning(RawArticle), rows))
+
+
+def bulk_insert_raw_videos(db: Session, rows: Iterable[dict]) -> int:
+    """Insert raw video rows with one executemany INSERT (no commit)."""
+    rows = list(rows)
+    if not rows:
+        return 0
+    db.execute(insert(RawVideo), rows)
+    return len(rows)
@@ -0,0 +1,253 @@
+"""
+Weekly rollup built from daily periods.
+
+Daily periods already hold processed, translated posts. Instead of running
+fetch and LLM processing again for a week id, the rollup copies the best
+posts of the week's child days into the week: rows are deduplicated by
+canonical source URL (video id for video posts) and ranked by the stored
+impact, the classifier relevance of the underlying raw article, and source
+engagement (HN points/comments, post metrics). Translations are copied
+from the day rows as they are.
+
+Trends are merged from the days' trend rows (topics recurring on more days
+rank first), so a rollup costs no fetches and no LLM calls. With
+``llm_trends=True`` a single trends call over the rolled-up posts replaces
+them; those trends have no extra-language translations and fall back to
+English.
+"""
+
+import logging
+import math
+from typing import Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models import (
+    Week, TechPost, PrimaryMarketPost, SecondaryMarketPost, MAPost, TipPost, Trend, RawArticle,
+)
+from app.services.article_utils import canonical_url, normalize_title
+
+logger = logging.getLogger(__name__)
+
+IMPACT_WEIGHT = {"critical": 4.0, "high": 3.0, "medium": 2.0, "low": 1.0}
+DEFAULT_IMPACT_WEIGHT = 2.0  # Sections without an impact field
+RELEVANCE_WEIGHT = 2.0
+ENGAGEMENT_WEIGHT = 0.5
+
+
+def child_day_ids(db: Session, week_id: str) -> list[str]:
+    """Daily periods belonging to a week, oldest first."""
+    return [
+        day_id for (day_id,) in db.query(Week.id).filter(
+            Week.parent_week_id == week_id,
+            Week.period_type == "day",
+        ).order_by(Week.sort_date)
+    ]
+
+
+def _article_signals(db: Session, day_ids: list[str]) -> dict[str, tuple[float, int]]:
+    """(relevance, engagement) per canonical URL from the days' classified raw articles."""
+    signals: dict[str, tuple[float, int]] = {}
+    rows = db.query(RawArticle.link, RawArticle.relevance, RawArticle.raw_data).filter(
+        RawArticle.week_id.in_(day_ids),
+        RawArticle.relevance.isnot(None),
+    )
+    for link, relevance, raw_data in rows:
+        raw_data = raw_data or {}
+        engagement = (raw_data.get("points") or 0) + (raw_data.get("comments") or 0)
+        key = canonical_url(link)
+        best_relevance, best_engagement = signals.get(key, (0.0, 0))
+        signals[key] = (max(best_relevance, relevance), max(best_engagement, engagement))
+    return signals
+
+
+def _metric_total(metrics: Optional[dict]) -> int:
+    """Sum of the numeric engagement metrics stored on a post."""
+    total = 0
+    for key in ("comments", "retweets", "likes"):
+        value = (metrics or {}).get(key)
+        if isinstance(value, (int, float)):
+            total += int(value)
+    return total
+
+
+def _score(row, signals: dict[str, tuple[float, int]]) -> float:
+    relevance, engagement = signals.get(canonical_url(row.source_url), (0.5, 0))
+    impact = IMPACT_WEIGHT.get(getattr(row, "impact", None) or "", DEFAULT_IMPACT_WEIGHT)
+    engagement += _metric_total(row.metrics)
+    return impact + RELEVANCE_WEIGHT * relevance + ENGAGEMENT_WEIGHT * math.log1p(engagement)
+
+
+def _dedup_key(row) -> str:
+    if getattr(row, "is_video", False) and row.video_id:
+        return f"video:{row.video_id}"
+    return canonical_url(row.source_url) or "content:" + normalize_title(row.content_en)[:120]
+
+
+def _rank(rows: list, signals: dict[str, tuple[float, int]], limit: int) -> list:
+    """Best-scoring row per story, highest score first (later days win ties)."""
+    ranked = sorted(
+        enumerate(rows),
+        key=lambda pair: (_score(pair[1], signals), pair[0]),
+        reverse=True,
+    )
+    seen: set[str] = set()
+    selected = []
+    for _, row in ranked:
+        key = _dedup_key(row)
+        if key in seen:
+            continue
+        seen.add(key)
+        selected.append(row)
+        if len(selected) >= limit:
+            break
+    return selected
+
+
+def _copy_values(row, week_id: str) -> dict:
+    """Column values of a day row re-targeted at the week (translations included)."""
+    values = {
+        attr.key: getattr(row, attr.key)
+        for attr in row.__mapper__.column_attrs
+        if attr.key not in ("id", "week_id")
+    }
+    values["week_id"] = week_id
+    return values
+
+
+def _merge_trends(rows: list[Trend], week_id: str, limit: int = 10) -> list[dict]:
+    """Day trends grouped by title; topics seen on more days (then more recently) first."""
+    groups: dict[str, dict] = {}
+    for order, row in enumerate(rows):
+        key = normalize_title(row.title_en)
+        if not key:
+            continue
+        group = groups.setdefault(key, {"days": 0, "last": order, "posts": 0, "row": row})
+        group["days"] += 1
+        group["last"] = order
+        group["posts"] += row.posts or 0
+        # Keep the most recent row that carries translations
+        if row.translations or not group["row"].translations:
+            group["row"] = row
+
+    ranked = sorted(groups.values(), key=lambda g: (g["days"], g["last"]), reverse=True)[:limit]
+    merged = []
+    for group in ranked:
+        values = _copy_values(group["row"], week_id)
+        values["posts"] = group["posts"] or group["days"]
+        merged.append(values)
+    return merged
+
+
+def _llm_trends(week_id: str, tech_rows: list, investment_rows: dict) -> list[dict]:
+    """One trends call over the rolled-up English content."""
+    from app.services.llm_processor import LLMProcessor
+
+    tech_data = {"en": [{"content": row.content_en} for row in tech_rows]}
+    investment_data = {
+        key: {"en": [{"content": row.content_en} for row in rows]}
+        for key, rows in investment_rows.items()
+    }
+    trends = LLMProcessor().generate_trends(tech_data, investment_data).get("trends", {})
+    return [
+        dict(
+            week_id=week_id,
+            category_de=de_t.get("category", ""),
+            category_en=en_t.get("category", ""),
+            title_de=de_t.get("title", ""),
+            title_en=en_t.get("title", ""),
+            posts=None,
+            translations=None,
+        )
+        for de_t, en_t in zip(trends.get("de", []), trends.get("en", []))
+        if isinstance(de_t, dict) and isinstance(en_t, dict)
+    ]
+
+
+def build_week_rollup(db: Session, week_id: str, llm_trends: Optional[bool] = None) -> dict:
+    """
+    Replace a week's content with a rollup of its child days.
+
+    Args:
+        db: Database session
+        week_id: Week ID (e.g. '2026-kw42')
+        llm_trends: Generate trends with one LLM call instead of merging the
+            days' trends (default: ROLLUP_LLM_TRENDS)
+
+    Returns:
+        Number of rows written per section
+
+    Raises:
+        ValueError: If the week has no daily periods
+    """
+    from app.services.collector import clear_week_data, intersperse_videos
+
+    settings = get_settings()
+    if llm_trends is None:
+        llm_trends = settings.rollup_llm_trends
+
+    day_ids = child_day_ids(db, week_id)
+    if not day_ids:
+        raise ValueError(f"No daily periods found for {week_id}")
+    logger.info(f"Rolling up {week_id} from {len(day_ids)} days: {', '.join(day_ids)}")
+
+    signals = _article_signals(db, day_ids)
+
+    def day_rows(model) -> list:
+        # Oldest day first so that later days win score ties
+        order = {day_id: i for i, day_id in enumerate(day_ids)}
+        rows = db.query(model).filter(model.week_id.in_(day_ids)).all()
+        rows.sort(key=lambda r: (order[r.week_id], getattr(r, "display_order", 0) or 0, r.id))
+        return rows
+
+    tech_all = day_rows(TechPost)
+    tech = _rank([r for r in tech_all if not r.is_video], signals, settings.rollup_tech_count)
+    videos = _rank([r for r in tech_all if r.is_video], signals, settings.rollup_video_count)
+    investment = {
+        "primaryMarket": _rank(day_rows(PrimaryMarketPost), signals, settings.rollup_investment_count),
+        "secondaryMarket": _rank(day_rows(SecondaryMarketPost), signals, settings.rollup_investment_count),
+        "ma": _rank(day_rows(MAPost), signals, settings.rollup_investment_count),
+    }
+    tips = _rank(day_rows(TipPost), signals, settings.rollup_tips_count)
+
+    tech_rows = []
+    for i, row in enumerate(intersperse_videos(tech, videos)):
+        values = _copy_values(row, week_id)
+        values["display_order"] = i
+        tech_rows.append(values)
+
+    trend_rows: list[dict] = []
+    if llm_trends:
+        try:
+            trend_rows = _llm_trends(week_id, tech, investment)
+        except Exception as e:
+            logger.warning(f"LLM trends failed for {week_id}, merging daily trends instead: {e}")
+    if not trend_rows:
+        trend_rows = _merge_trends(day_rows(Trend), week_id)
+
+    section_rows = {
+        TechPost: tech_rows,
+        PrimaryMarketPost: [_copy_values(r, week_id) for r in investment["primaryMarket"]],
+        SecondaryMarketPost: [_copy_values(r, week_id) for r in investment["secondaryMarket"]],
+        MAPost: [_copy_values(r, week_id) for r in investment["ma"]],
+        TipPost: [_copy_values(r, week_id) for r in tips],
+        Trend: trend_rows,
+    }
+
+    try:
+        # The week's Video rows stay: day rows cannot be copied (video_id is unique)
+        clear_week_data(db, week_id, commit=False, keep_videos=True)
+        for model, rows in section_rows.items():
+            if rows:
+                db.execute(insert(model), rows)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Weekly rollup failed for {week_id}: {e}")
+        raise
+
+    counts = {model.__tablename__: len(rows) for model, rows in section_rows.items()}
+    logger.info(f"Weekly rollup saved for {week_id}: {counts}")
+    return counts
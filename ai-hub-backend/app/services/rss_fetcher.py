@@ -1,23 +1,41 @@
 """
 RSS feed fetching service.
+
+fetch_rss_feeds_parallel runs all feeds on one asyncio loop with a shared
+httpx client (HTTP/2, keep-alive). Requests are capped globally
+(RSS_MAX_WORKERS) and per host (RSS_PER_HOST_LIMIT, with
+RSS_HOST_DELAY_SECONDS between request starts), so the Reddit feeds queue
+behind each other while other hosts proceed. feedparser is CPU-bound and
+runs in a small thread pool (RSS_PARSE_WORKERS) off the event loop.
 """
 
+import asyncio
+import contextvars
+import time
 import feedparser
+import httpx
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, NamedTuple, Optional
+from urllib.parse import urlsplit
 import logging
-import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
 from app.config import get_settings
+from app.services import cassette
+from app.services.feed_state import FeedValidators, conditional_headers, load_feed_states, store_feed_states
+from app.services.metrics import span, FEED
 
 logger = logging.getLogger(__name__)
 
 
 def fetch_feed(url: str, days: int = 7) -> list[dict]:
     """Fetch and parse an RSS feed, returning entries from the last N days."""
-    cutoff = datetime.now() - timedelta(days=days)
-    feed = feedparser.parse(url)
+    cutoff = cassette.now() - timedelta(days=days)
+    if cassette.get_cassette() is not None:
+        feed = feedparser.parse(cassette.http_get(url, timeout=get_settings().rss_request_timeout_seconds).content)
+    else:
+        feed = feedparser.parse(url)
     articles = []
 
     for entry in feed.entries:
@@ -40,24 +58,18 @@ def fetch_feed(url: str, days: int = 7) -> list[dict]:
     return articles
 
 
-def fetch_feed_with_timeout(url: str, days: int = 7, timeout: int | float = 20) -> list[dict]:
-    """Fetch and parse a single RSS/Atom feed with an HTTP timeout.
+class FeedResult(NamedTuple):
+    """Outcome of one feed request."""
 
-    Uses requests to download content with timeout, then parses via feedparser.
-    """
-    cutoff = datetime.now() - timedelta(days=days)
-    headers = {
-        "User-Agent": "Mozilla/5.0 (compatible; AI-Hub-Bot/1.0; +https://www.datacubeai.space)"
-    }
-    try:
-        resp = requests.get(url, headers=headers, timeout=timeout)
-        resp.raise_for_status()
-        feed = feedparser.parse(resp.content)
-    except Exception as e:
-        logger.error(f"RSS request failed for {url}: {e}")
-        return []
+    articles: list[dict]  # Entries within the age cutoff
+    status: Optional[int] = None  # HTTP status (None if no response was received)
+    validators: Optional[dict] = None  # etag, last_modified and all items of a full 200 response
 
-    articles = []
+
+def _parse_entries(content: bytes) -> list[dict]:
+    """All entries of a feed document (no age cutoff)."""
+    feed = feedparser.parse(content)
+    entries = []
     for entry in getattr(feed, "entries", []) or []:
         published = None
         if hasattr(entry, "published_parsed") and entry.published_parsed:
@@ -65,17 +77,126 @@ def fetch_feed_with_timeout(url: str, days: int = 7, timeout: int | float = 20)
         elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
             published = datetime(*entry.updated_parsed[:6])
 
-        if published and published < cutoff:
-            continue
-
-        articles.append({
+        entries.append({
             "title": getattr(entry, "title", ""),
             "link": getattr(entry, "link", ""),
             "summary": getattr(entry, "summary", ""),
             "published": published.isoformat() if published else "",
         })
+    return entries
 
-    return articles
+
+def _recent(entries: list[dict], cutoff: datetime) -> list[dict]:
+    """Copies of the entries published after cutoff (undated entries are kept)."""
+    return [
+        dict(entry)
+        for entry in entries
+        if not entry["published"] or datetime.fromisoformat(entry["published"]) >= cutoff
+    ]
+
+
+_USER_AGENT = "Mozilla/5.0 (compatible; AI-Hub-Bot/1.0; +https://www.datacubeai.space)"
+
+
+def _request_failed(url: str, e: Exception, feed_span) -> FeedResult:
+    logger.error(f"RSS request failed for {url}: {e}")
+    feed_span.status = "error"
+    feed_span.error = str(e)[:500]
+    response = getattr(e, "response", None)
+    return FeedResult([], getattr(response, "status_code", None))
+
+
+def _not_modified(resp, state: Optional[FeedValidators]) -> bool:
+    return resp.status_code == 304 and bool(state and state["items"])
+
+
+def _full_result(resp, entries: list[dict], cutoff: datetime) -> FeedResult:
+    validators = {
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "items": entries,
+    }
+    return FeedResult(_recent(entries, cutoff), resp.status_code, validators)
+
+
+class HostLimiter:
+    """
+    Request slots for the async fetcher.
+
+    At most `per_host` requests run against one host at a time, and
+    consecutive requests to a host start at least `delay` seconds apart
+    (politeness). A request waiting for its host holds no global slot, so
+    the `max_concurrency` global slots go to hosts that are ready.
+    """
+
+    def __init__(self, max_concurrency: int, per_host: int, delay: float):
+        self.per_host = per_host
+        self.delay = delay
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._hosts: dict[str, asyncio.Semaphore] = {}
+        self._next_start: dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        host = urlsplit(url).hostname or url
+        host_slots = self._hosts.setdefault(host, asyncio.Semaphore(self.per_host))
+        async with host_slots:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.delay
+            if start > now:
+                await asyncio.sleep(start - now)
+            async with self._global:
+                yield
+
+
+async def _http_get_async(client: httpx.AsyncClient, url: str, headers: dict, timeout: int | float):
+    """GET through the client, or through the active cassette (record/replay) on a thread."""
+    if cassette.get_cassette() is not None:
+        return await asyncio.to_thread(cassette.http_get, url, headers=headers, timeout=timeout)
+    return await client.get(url, headers=headers, timeout=timeout)
+
+
+async def _fetch_feed_async(
+    client: httpx.AsyncClient,
+    limiter: HostLimiter,
+    parse_pool: ThreadPoolExecutor,
+    url: str,
+    days: int,
+    timeout: int | float,
+    name: Optional[str],
+    state: Optional[FeedValidators],
+) -> FeedResult:
+    """
+    Fetch one feed under the limiter and parse it in the pool.
+
+    With a stored state the request is conditional: a 304 reuses the
+    state's entries without downloading or parsing the feed (span attribute
+    not_modified). The result carries the status and, for a full response,
+    the validators to store for the next run. Recorded as a 'feed' metrics
+    span labelled with name (or the URL).
+    """
+    with span(name or url, kind=FEED) as feed_span:
+        cutoff = cassette.now() - timedelta(days=days)
+        queued = time.perf_counter()
+        try:
+            async with limiter.slot(url):
+                feed_span.attrs["wait_ms"] = round((time.perf_counter() - queued) * 1000, 1)
+                resp = await _http_get_async(client, url, {"User-Agent": _USER_AGENT, **conditional_headers(state)}, timeout)
+            if _not_modified(resp, state):
+                feed_span.attrs["not_modified"] = True
+                result = FeedResult(_recent(state["items"], cutoff), 304)
+            else:
+                resp.raise_for_status()
+                entries = await asyncio.get_running_loop().run_in_executor(
+                    parse_pool, contextvars.copy_context().run, _parse_entries, resp.content,
+                )
+                result = _full_result(resp, entries, cutoff)
+        except Exception as e:
+            result = _request_failed(url, e, feed_span)
+        feed_span.items = len(result.articles)
+        return result
 
 
 def fetch_rss_feeds(
@@ -117,14 +238,30 @@ def fetch_rss_feeds(
 def fetch_rss_feeds_parallel(
     sources: dict[str, list[dict]],
     exclude_names: Optional[set[str]] = None,
+    on_feed: Optional[Callable[[list[dict]], None]] = None,
 ) -> list[dict]:
-    """Fetch all RSS feeds from sources config in parallel.
+    """Fetch all RSS feeds from sources config concurrently.
 
     Returns list of articles with 'source' and 'original_section' fields set.
     Deduplicates across all sources by URL.
+
+    If on_feed is given, it is called with each feed's new articles as soon
+    as that feed completes, so callers can start working before the slowest
+    feed has finished.
+
+    Sync wrapper around an asyncio fetch (one keep-alive HTTP/2 client,
+    global and per-host request limits, parsing in a thread pool); it runs
+    its own event loop and must not be called from a running one.
     """
+    return asyncio.run(_fetch_rss_feeds_async(sources, exclude_names or set(), on_feed))
+
+
+async def _fetch_rss_feeds_async(
+    sources: dict[str, list[dict]],
+    exclude_names: set[str],
+    on_feed: Optional[Callable[[list[dict]], None]],
+) -> list[dict]:
     settings = get_settings()
-    exclude_names = exclude_names or set()
 
     tasks: list[tuple[str, str, str]] = []  # (section, name, url)
     for section, source_list in sources.items():
@@ -140,35 +277,52 @@ def fetch_rss_feeds_parallel(
     seen_urls: set[str] = set()
     all_articles: list[dict] = []
 
-    logger.info(f"Parallel RSS fetch: {len(tasks)} sources, workers={settings.rss_max_workers}")
-    with ThreadPoolExecutor(max_workers=settings.rss_max_workers) as executor:
-        future_map = {
-            executor.submit(
-                fetch_feed_with_timeout,
-                url,
-                7,
-                settings.rss_request_timeout_seconds,
-            ): (section, name, url)
-            for (section, name, url) in tasks
-        }
-
-        for future in as_completed(future_map):
-            section, name, url = future_map[future]
-            try:
-                articles = future.result()
-            except Exception as e:
-                logger.error(f"[{section}] Error fetching {name}: {e}")
-                continue
+    # Conditional requests (not under a cassette: replay must not depend on stored state)
+    conditional = settings.rss_conditional_get_enabled and cassette.get_cassette() is None
+    states = await asyncio.to_thread(load_feed_states, [url for _, _, url in tasks]) if conditional else {}
+    modified: dict[str, dict] = {}
+    statuses: dict[str, int] = {}
 
-            added = 0
-            for article in articles or []:
-                link = article.get("link")
-                if link and link not in seen_urls:
-                    seen_urls.add(link)
-                    article["source"] = name
-                    article["original_section"] = section
-                    all_articles.append(article)
-                    added += 1
-            logger.info(f"[{section}] {name}: {len(articles or [])} fetched, {added} new")
+    logger.info(
+        f"Async RSS fetch: {len(tasks)} sources, concurrency={settings.rss_max_workers}, "
+        f"per host={settings.rss_per_host_limit}, parse workers={settings.rss_parse_workers}"
+    )
+    limiter = HostLimiter(settings.rss_max_workers, settings.rss_per_host_limit, settings.rss_host_delay_seconds)
+    limits = httpx.Limits(max_connections=settings.rss_max_workers, max_keepalive_connections=settings.rss_max_workers)
+    async with httpx.AsyncClient(http2=settings.rss_http2_enabled, limits=limits, follow_redirects=True) as client:
+        with ThreadPoolExecutor(max_workers=settings.rss_parse_workers) as parse_pool:
+
+            async def fetch(section: str, name: str, url: str):
+                result = await _fetch_feed_async(
+                    client, limiter, parse_pool, url, 7, settings.rss_request_timeout_seconds, name, states.get(url),
+                )
+                return section, name, url, result
+
+            for next_done in asyncio.as_completed([fetch(*task) for task in tasks]):
+                section, name, url, result = await next_done
+                articles = result.articles
+                if result.validators is not None:
+                    modified[url] = result.validators
+                elif result.status is not None:
+                    statuses[url] = result.status
+
+                added = 0
+                for article in articles or []:
+                    link = article.get("link")
+                    if link and link not in seen_urls:
+                        seen_urls.add(link)
+                        article["source"] = name
+                        article["original_section"] = section
+                        all_articles.append(article)
+                        added += 1
+                not_modified = " (not modified)" if result.status == 304 else ""
+                logger.info(f"[{section}] {name}: {len(articles or [])} fetched{not_modified}, {added} new")
+                if on_feed and added:
+                    # On a thread: the callback may block (e.g. a bounded queue) and
+                    # must not stall in-flight requests and limiter slots
+                    await asyncio.to_thread(on_feed, all_articles[-added:])
 
+    if conditional:
+        await asyncio.to_thread(store_feed_states, modified, statuses)
+        logger.info(f"RSS conditional GET: {sum(1 for s in statuses.values() if s == 304)}/{len(tasks)} not modified")
     return all_articles
@@ -0,0 +1,141 @@
+"""
+Cross-period seen-article index.
+
+RSS feeds return up to a week of entries, so the daily pipeline fetches the
+same stories on several consecutive days. The index remembers every
+classified article (canonical URL hash + title hash) with its labels and the
+period in which it was first published, so later runs can reuse labels
+without LLM calls and skip or down-weight stories that already ran.
+"""
+
+import logging
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import case, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models import SeenArticle
+from app.services.article_utils import canonical_url, content_hash, title_hash
+
+logger = logging.getLogger(__name__)
+
+# Sections whose labels are worth remembering
+INDEXED_SECTIONS = ("tech", "investment", "tips")
+
+
+def lookup_seen(db: Session, articles: list[dict]) -> dict[str, SeenArticle]:
+    """
+    Find index entries for a list of articles.
+
+    Matches on the canonical URL hash first and falls back to the title hash,
+    which catches the same story syndicated under a different URL.
+
+    Args:
+        db: Database session
+        articles: Dicts with 'link' and 'title' (and optionally 'content_hash')
+
+    Returns:
+        dict mapping each matched article's content hash to its index entry
+    """
+    if not articles:
+        return {}
+
+    url_keys: dict[str, str] = {}
+    title_keys: dict[str, str] = {}
+    for a in articles:
+        h = a.get("content_hash") or content_hash(a.get("link"), a.get("title"))
+        url_keys[h] = h
+        th = title_hash(a.get("title"))
+        if th:
+            title_keys.setdefault(th, h)
+
+    matches: dict[str, SeenArticle] = {}
+    for entry in db.query(SeenArticle).filter(SeenArticle.url_hash.in_(list(url_keys))):
+        matches[entry.url_hash] = entry
+
+    remaining = {th: h for th, h in title_keys.items() if h not in matches}
+    if remaining:
+        for entry in db.query(SeenArticle).filter(SeenArticle.title_hash.in_(list(remaining))):
+            h = remaining.get(entry.title_hash)
+            if h and h not in matches:
+                matches[h] = entry
+
+    return matches
+
+
+def record_seen(db: Session, period_id: str, articles: Iterable) -> int:
+    """
+    Upsert classified raw articles into the index.
+
+    Existing labels are kept (the first classification wins), while
+    last_period_id and times_seen track re-appearances.
+
+    Args:
+        db: Database session
+        period_id: Period the articles were collected for
+        articles: RawArticle rows with section/relevance set
+
+    Returns:
+        Number of rows upserted
+    """
+    rows = {}
+    now = datetime.utcnow()
+    for a in articles:
+        if a.section not in INDEXED_SECTIONS:
+            continue
+        h = a.content_hash or content_hash(a.link, a.title)
+        rows[h] = {
+            "url_hash": h,
+            "title_hash": title_hash(a.title),
+            "canonical_url": canonical_url(a.link),
+            "title": a.title or "",
+            "first_period_id": period_id,
+            "last_period_id": period_id,
+            "section": a.section,
+            "relevance": a.relevance,
+            "times_seen": 1,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    if not rows:
+        return 0
+
+    stmt = pg_insert(SeenArticle).values(list(rows.values()))
+    excluded = stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SeenArticle.url_hash],
+        set_={
+            "last_period_id": excluded.last_period_id,
+            "times_seen": case(
+                (SeenArticle.last_period_id != excluded.last_period_id, SeenArticle.times_seen + 1),
+                else_=SeenArticle.times_seen,
+            ),
+            "section": func.coalesce(SeenArticle.section, excluded.section),
+            "relevance": func.coalesce(SeenArticle.relevance, excluded.relevance),
+            "updated_at": excluded.updated_at,
+        },
+    )
+    db.execute(stmt)
+    db.commit()
+    return len(rows)
+
+
+def mark_published(db: Session, period_id: str, urls: Iterable[Optional[str]]) -> int:
+    """
+    Record that the stories behind these source URLs were published in a period.
+
+    Only entries without an earlier publication are updated, so
+    published_period_id always points at the first period a story ran in.
+    """
+    hashes = {content_hash(u) for u in urls if u}
+    if not hashes:
+        return 0
+    updated = db.query(SeenArticle).filter(
+        SeenArticle.url_hash.in_(list(hashes)),
+        SeenArticle.published_period_id.is_(None),
+    ).update({SeenArticle.published_period_id: period_id}, synchronize_session=False)
+    db.commit()
+    return updated
@@ -0,0 +1,196 @@
+"""
+Small dependency-driven task scheduler.
+
+The collector is expressed as a DAG of named tasks (fetch -> classify ->
+per-section processing -> per-section/per-language translation -> trends ->
+save). Each task starts as soon as all of its dependencies have finished,
+subject to a concurrency limit for the resource it uses (e.g. "llm" or
+"translate"), so a run takes roughly as long as its critical path.
+
+Tasks without a resource run inline on the thread that called run(). Use
+that for anything touching the database session, which must not be shared
+across threads. Completion callbacks also run on that thread, for every
+task that succeeds, even after another task has failed (so checkpoints of
+finished work are kept).
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from app.services.metrics import span, submit_with_context, STAGE
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Task:
+    """A node in the graph. fn receives a dict of dependency results."""
+
+    name: str
+    fn: Callable[[dict], Any]
+    deps: list[str] = field(default_factory=list)
+    resource: Optional[str] = None  # None = run inline on the scheduler thread
+    on_done: Optional[Callable[[Any], None]] = None
+
+
+class TaskGraph:
+    """
+    Run tasks in dependency order with per-resource concurrency limits.
+
+    Args:
+        limits: Max concurrent tasks per resource name (unlisted resources get 1)
+        name: Label used in log messages
+    """
+
+    def __init__(self, limits: Optional[dict[str, int]] = None, name: str = "graph"):
+        self.limits = limits or {}
+        self.name = name
+        self.tasks: dict[str, Task] = {}
+        self.results: dict[str, Any] = {}
+        self.timings: dict[str, float] = {}
+        self.stopped = False
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[[dict], Any],
+        deps: Optional[list[str]] = None,
+        resource: Optional[str] = None,
+        on_done: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """Register a task. Dependencies may be added later but must exist before run()."""
+        if name in self.tasks:
+            raise ValueError(f"Duplicate task '{name}'")
+        self.tasks[name] = Task(name, fn, list(deps or []), resource, on_done)
+
+    def complete(self, name: str, result: Any) -> None:
+        """Mark a task as already done (e.g. restored from a checkpoint)."""
+        self.results[name] = result
+
+    def stop(self) -> None:
+        """Start no further tasks; run() returns once running tasks finish."""
+        self.stopped = True
+
+    def _validate(self) -> None:
+        for task in self.tasks.values():
+            missing = [d for d in task.deps if d not in self.tasks]
+            if missing:
+                raise ValueError(f"Task '{task.name}' depends on unknown tasks: {missing}")
+
+        # Kahn's algorithm: every task must be reachable in topological order
+        indegree = {name: len(task.deps) for name, task in self.tasks.items()}
+        dependents: dict[str, list[str]] = {name: [] for name in self.tasks}
+        for task in self.tasks.values():
+            for dep in task.deps:
+                dependents[dep].append(task.name)
+        queue = [name for name, degree in indegree.items() if degree == 0]
+        visited = 0
+        while queue:
+            name = queue.pop()
+            visited += 1
+            for child in dependents[name]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    queue.append(child)
+        if visited != len(self.tasks):
+            raise ValueError(f"Task graph '{self.name}' contains a cycle")
+
+    @staticmethod
+    def _execute(task: Task, inputs: dict) -> Any:
+        """Run a task inside a stage span named after it."""
+        with span(task.name, kind=STAGE):
+            return task.fn(inputs)
+
+    def _finish(self, task: Task, result: Any, started: float) -> None:
+        self.results[task.name] = result
+        self.timings[task.name] = time.perf_counter() - started
+        logger.info(f"[{self.name}] {task.name} done in {self.timings[task.name]:.1f}s")
+        if task.on_done:
+            task.on_done(result)
+
+    def run(self) -> dict[str, Any]:
+        """
+        Execute all pending tasks.
+
+        Returns:
+            dict mapping task name to result (including pre-completed tasks)
+
+        Raises:
+            Exception: The first task failure, after running tasks have finished
+        """
+        self._validate()
+        pending = [name for name in self.tasks if name not in self.results]
+        in_use: dict[str, int] = {}
+        running: dict = {}  # future -> (task, start time)
+        error: Optional[BaseException] = None
+        graph_start = time.perf_counter()
+
+        max_workers = max(1, sum(self.limits.values()))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=self.name) as executor:
+            while pending or running:
+                progressed = False
+                if not self.stopped and error is None:
+                    for name in list(pending):
+                        task = self.tasks[name]
+                        if any(dep not in self.results for dep in task.deps):
+                            continue
+                        inputs = {dep: self.results[dep] for dep in task.deps}
+
+                        if task.resource is None:
+                            pending.remove(name)
+                            started = time.perf_counter()
+                            try:
+                                result = self._execute(task, inputs)
+                            except Exception as e:
+                                logger.error(f"[{self.name}] {name} failed: {e}")
+                                error = e
+                                break
+                            self._finish(task, result, started)
+                            progressed = True
+                            break  # Re-evaluate readiness after every inline task
+
+                        limit = self.limits.get(task.resource, 1)
+                        if in_use.get(task.resource, 0) >= limit:
+                            continue
+                        pending.remove(name)
+                        in_use[task.resource] = in_use.get(task.resource, 0) + 1
+                        future = submit_with_context(executor, self._execute, task, inputs)
+                        running[future] = (task, time.perf_counter())
+                        progressed = True
+
+                if progressed:
+                    continue
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task, started = running.pop(future)
+                    in_use[task.resource] -= 1
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"[{self.name}] {task.name} failed: {e}")
+                        error = error or e
+                        continue
+                    if error is None:
+                        self._finish(task, result, started)
+                        continue
+                    # A sibling already failed: still record (and checkpoint) this
+                    # result, without letting a callback error mask the failure
+                    try:
+                        self._finish(task, result, started)
+                    except Exception as e:
+                        logger.error(f"[{self.name}] {task.name} completion callback failed: {e}")
+
+        if error is not None:
+            raise error
+        if pending and not self.stopped:
+            raise RuntimeError(f"Task graph '{self.name}' could not schedule: {pending}")
+
+        logger.info(f"[{self.name}] finished in {time.perf_counter() - graph_start:.1f}s "
+                    f"({len(self.timings)} tasks run)")
+        return self.results
@@ -0,0 +1,123 @@
+"""
+Cached, parallel YouTube transcript fetching.
+
+Popular videos come back in the YouTube search on several consecutive days.
+Transcripts are stored in ``video_transcripts`` keyed by video ID, so a run
+only fetches transcripts it has never seen. Videos without a transcript are
+cached as negative entries (NULL transcript) that expire after
+TRANSCRIPT_NEGATIVE_TTL_HOURS, since captions are sometimes added later.
+Fetch errors (rate limiting, IP blocks, network failures) are not cached,
+so the next run tries again. Misses are fetched in a bounded thread pool.
+
+The cache is bypassed while a cassette is recording or replaying, so that
+cassettes stay complete and independent of the database.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.config import get_settings
+from app.database import get_session_local
+from app.models import VideoTranscript
+from app.services import cassette
+from app.services.metrics import span, submit_with_context, TRANSCRIPT
+from app.services.youtube_fetcher import fetch_video_transcript
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()  # Fetch failed with an error: neither used nor cached
+
+
+def _fetch_one(video_id: str):
+    with span(video_id, kind=TRANSCRIPT) as transcript_span:
+        try:
+            transcript = fetch_video_transcript(video_id)
+        except Exception as e:
+            logger.warning(f"Failed to fetch transcript for video {video_id}: {e}")
+            transcript_span.status = "error"
+            transcript_span.error = str(e)[:500]
+            return _MISSING
+        transcript_span.items = 1 if transcript else 0
+        return transcript
+
+
+def _load_cached(video_ids: list[str]) -> dict[str, Optional[str]]:
+    """Cached transcripts, skipping negative entries older than the TTL."""
+    negative_cutoff = datetime.utcnow() - timedelta(hours=get_settings().transcript_negative_ttl_hours)
+    db = get_session_local()()
+    try:
+        rows = db.query(VideoTranscript).filter(VideoTranscript.video_id.in_(video_ids)).all()
+    finally:
+        db.close()
+    return {
+        row.video_id: row.transcript
+        for row in rows
+        if row.transcript is not None or row.fetched_at >= negative_cutoff
+    }
+
+
+def _store(results: dict[str, Optional[str]]) -> None:
+    if not results:
+        return
+    now = datetime.utcnow()
+    stmt = pg_insert(VideoTranscript).values([
+        {"video_id": video_id, "transcript": transcript, "fetched_at": now}
+        for video_id, transcript in results.items()
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[VideoTranscript.video_id],
+        set_={"transcript": stmt.excluded.transcript, "fetched_at": stmt.excluded.fetched_at},
+    )
+    db = get_session_local()()
+    try:
+        db.execute(stmt)
+        db.commit()
+    finally:
+        db.close()
+
+
+def get_transcripts(video_ids: list[str]) -> dict[str, Optional[str]]:
+    """
+    Transcripts for a list of videos, from the cache where possible.
+
+    Args:
+        video_ids: YouTube video IDs
+
+    Returns:
+        dict mapping each video ID to its transcript (None if it has none
+        or the fetch failed)
+    """
+    settings = get_settings()
+    video_ids = list(dict.fromkeys(v for v in video_ids if v))
+    use_cache = settings.transcript_cache_enabled and cassette.get_cassette() is None
+
+    cached: dict[str, Optional[str]] = {}
+    if use_cache and video_ids:
+        try:
+            cached = _load_cached(video_ids)
+        except Exception as e:
+            logger.warning(f"Transcript cache lookup failed, fetching all: {e}")
+
+    misses = [v for v in video_ids if v not in cached]
+    fetched: dict[str, Optional[str]] = {}
+    if misses:
+        with ThreadPoolExecutor(max_workers=settings.transcript_max_workers) as executor:
+            futures = {v: submit_with_context(executor, _fetch_one, v) for v in misses}
+            fetched = {v: future.result() for v, future in futures.items()}
+
+    new_entries = {v: t for v, t in fetched.items() if t is not _MISSING}
+    if use_cache:
+        try:
+            _store(new_entries)
+        except Exception as e:
+            logger.warning(f"Failed to cache transcripts: {e}")
+
+    logger.info(
+        f"Transcripts: {len(cached)} cached, {len(misses)} fetched "
+        f"({sum(1 for t in new_entries.values() if t)} found)"
+    )
+    return {**cached, **new_entries, **{v: None for v, t in fetched.items() if t is _MISSING}}
@@ -0,0 +1,150 @@
+"""
+Translation backfill for stored content.
+
+Finds rows of a period that are missing any of TRANSLATION_LANGUAGES and
+translates their English fields with the free model chain, one work unit
+per (section, language), three at a time.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.models import (
+    Week, TechPost, PrimaryMarketPost, SecondaryMarketPost,
+    MAPost, TipPost, Video, Trend,
+)
+from app.services.i18n_utils import TRANSLATION_LANGUAGES
+from app.services.llm_processor import LLMProcessor
+
+logger = logging.getLogger(__name__)
+
+CONFIGS = {
+    "tech": (TechPost, ["content", "category", "tags"], {}),
+    "video": (Video, ["title", "summary"], {}),
+    "tip": (TipPost, ["content", "tip", "category", "difficulty"], {}),
+    "primary_market": (PrimaryMarketPost, ["content", "amount", "valuation"], {}),
+    "secondary_market": (SecondaryMarketPost, ["content"], {}),
+    "ma": (MAPost, ["content", "deal_value", "deal_type"], {}),
+    "trend": (Trend, ["category", "title"], {}),
+}
+
+
+def backfill_missing_translations(db: Session, period_id: Optional[str] = None) -> int:
+    """
+    Translate rows missing any extra language.
+
+    Args:
+        db: Database session
+        period_id: Only backfill this period (default: all periods)
+
+    Returns:
+        Number of rows updated
+    """
+    # Resolve periods
+    if period_id:
+        week_ids = [period_id]
+    else:
+        weeks = db.query(Week).order_by(Week.id).all()
+        week_ids = [w.id for w in weeks]
+
+    logger.info(f"Backfill translations: {len(week_ids)} period(s)")
+    grand_total = 0
+
+    for wid in week_ids:
+        logger.info(f"Backfilling {wid}")
+
+        # Collect all sections that need translation for this period
+        section_data = []  # (section_name, records, en_items, fields, name_map, missing_langs)
+        for section_name, (model_cls, fields, name_map) in CONFIGS.items():
+            records = db.query(model_cls).filter(model_cls.week_id == wid).all()
+
+            # Find records missing ANY language (not just records with no translations)
+            to_translate = []
+            missing_langs_per_record = []
+            for r in records:
+                existing = r.translations or {}
+                missing = [lang for lang in TRANSLATION_LANGUAGES if lang not in existing]
+                if missing:
+                    to_translate.append(r)
+                    missing_langs_per_record.append(missing)
+
+            if not to_translate:
+                continue
+
+            # Figure out which languages need work across all records in this section
+            all_missing = set()
+            for ml in missing_langs_per_record:
+                all_missing.update(ml)
+
+            en_items = []
+            for record in to_translate:
+                d = {"_translations": dict(record.translations or {})}
+                for f in fields:
+                    val = getattr(record, f"{f}_en", None)
+                    if val is not None:
+                        d[f] = val
+                en_items.append(d)
+
+            section_data.append((section_name, to_translate, en_items, fields, name_map, sorted(all_missing)))
+            logger.info(f"  {section_name}: {len(to_translate)} records, missing langs: {sorted(all_missing)}")
+
+        if not section_data:
+            logger.info(f"  {wid}: nothing to translate")
+            continue
+
+        # Build work units: only for missing languages per section
+        lock = threading.Lock()
+        work_units = [
+            (si, lang)
+            for si in range(len(section_data))
+            for lang in section_data[si][5]  # missing_langs
+        ]
+
+        def do_translate(section_idx: int, target_lang: str):
+            section_name, _, en_items, fields, name_map, _ = section_data[section_idx]
+            proc = LLMProcessor()
+            translated = proc.translate_batch(en_items, target_lang, fields)
+            with lock:
+                for i, en_item in enumerate(en_items):
+                    if i < len(translated) and translated[i]:
+                        mapped = {}
+                        for k, v in translated[i].items():
+                            db_name = name_map.get(k, k)
+                            mapped[db_name] = v
+                        en_item["_translations"][target_lang] = mapped
+
+        # 3 parallel workers (same as stage3_5)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {}
+            for si, lang in work_units:
+                future = executor.submit(do_translate, si, lang)
+                futures[future] = f"{section_data[si][0]}→{lang}"
+
+            for future in as_completed(futures):
+                task_name = futures[future]
+                try:
+                    future.result()
+                    logger.info(f"    {task_name}: done")
+                except Exception as e:
+                    logger.warning(f"    {task_name}: failed ({e})")
+
+        # Write back to DB
+        period_total = 0
+        for section_name, records, en_items, _, _, _ in section_data:
+            for i, record in enumerate(records):
+                t = en_items[i].get("_translations")
+                if t:
+                    record.translations = t
+                    period_total += 1
+
+        if period_total > 0:
+            db.commit()
+        grand_total += period_total
+        logger.info(f"  {wid}: {period_total} records updated")
+
+    logger.info(f"Backfill complete: {grand_total} total records across {len(week_ids)} periods")
+    return grand_total
@@ -0,0 +1,264 @@
+"""
+Local trend extraction from a period's processed posts.
+
+Trends used to come from a separate DeepSeek call over the first 30 EN
+posts, which ran on the critical path after stage 3. They are now
+extracted locally:
+
+1. Every EN post (tech, primary/secondary market, M&A) is split into
+   phrases of one to three words that neither start nor end with a stop
+   word, e.g. "OpenAI", "GPT-5", "open-weight models", "Series B".
+2. Each phrase is counted once per post (document frequency) and compared
+   with its rate in the previous TRENDS_BACKGROUND_PERIODS periods of the
+   same kind (daily or weekly). The score is
+
+       posts * log((rate + s) / (background rate + s)) * shape
+
+   with s one post's share of the period, so a phrase that is frequent now
+   and rare before (a burst) beats one that is always there ("AI",
+   "company"). Shape prefers multi-word and capitalised phrases. Without a
+   background (first periods) the ranking falls back to frequency.
+3. The best phrases become trends; a phrase whose posts mostly overlap an
+   already chosen one is the same story and is skipped.
+
+Categories follow the section the phrase appears in most. Titles are the
+most common spelling of the phrase, in both languages. With
+TRENDS_LLM_POLISH one small free-model call rewrites them into short EN/DE
+topic titles; if it fails the local titles are kept.
+"""
+
+import logging
+import re
+from collections import Counter, defaultdict
+from typing import Optional
+
+import numpy as np
+
+from app.config import get_settings
+from app.database import get_session_local
+from app.models import MAPost, PrimaryMarketPost, SecondaryMarketPost, TechPost, Week
+from app.services.period_utils import is_daily_id
+
+logger = logging.getLogger(__name__)
+
+# Section of the stage 3 results -> (DE category, EN category)
+CATEGORIES = {
+    "tech": ("KI · Trend", "AI · Trending"),
+    "primaryMarket": ("Startups · Finanzierung", "Startups · Funding"),
+    "secondaryMarket": ("Finanzen · Märkte", "Finance · Markets"),
+    "ma": ("Finanzen · M&A", "Finance · M&A"),
+}
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below
+between both but by can could did do does doing down during each few for from further had has have having
+he her here hers him his how i if in into is it its itself just last latest major more most my new next
+no nor not now of off on once only or other our out over own per same she should so some such than that
+the their them then there these they this those through to too under until up us very via was we were
+what when where which while who whom why will with within without would year years you your week weeks
+today yesterday says said according report reports reported announced announces launched launches
+""".split())
+
+_MIN_POSTS = 2
+_MAX_WORDS = 3
+_OVERLAP = 0.8  # Share of the smaller post set that makes two phrases one story
+_TITLE_CHARS = 200
+_TAG = re.compile(r"<[^>]+>")
+_CLAUSE = re.compile(r"[,;:!?()\[\]\"“”‘’|/]|\.(?:\s|$)|\s[-–—]\s")
+_TOKEN = re.compile(r"[A-Za-z0-9$][\w.+&'-]*[\w+]|[A-Za-z0-9]")
+
+
+def _phrases(text: str) -> dict[str, str]:
+    """Candidate phrases of a text: lowercase key -> spelling as written."""
+    found: dict[str, str] = {}
+    for clause in _CLAUSE.split(_TAG.sub(" ", text or "")):
+        words = _TOKEN.findall(clause)
+        for n in range(1, _MAX_WORDS + 1):
+            for i in range(len(words) - n + 1):
+                gram = words[i:i + n]
+                first, last = gram[0].lower(), gram[-1].lower()
+                if first in STOPWORDS or last in STOPWORDS:
+                    continue
+                if n == 1 and (len(first) < 3 or not first[0].isalpha()):
+                    continue  # Short tokens and bare numbers/amounts are not topics
+                found.setdefault(" ".join(w.lower() for w in gram), " ".join(gram))
+    return found
+
+
+def _section_posts(tech_data: dict, investment_data: dict) -> list[tuple[str, str]]:
+    """(section, EN text) of every processed post."""
+    posts = []
+    for post in tech_data.get("en", []) if isinstance(tech_data, dict) else []:
+        if isinstance(post, dict):
+            tags = " , ".join(t for t in post.get("tags") or [] if isinstance(t, str))
+            posts.append(("tech", f"{post.get('content', '')} , {tags}"))
+    for section in ["primaryMarket", "secondaryMarket", "ma"]:
+        section_data = investment_data.get(section, {}) if isinstance(investment_data, dict) else {}
+        # Handle case where LLM returned a list instead of dict
+        for post in section_data.get("en", []) if isinstance(section_data, dict) else []:
+            if isinstance(post, dict):
+                posts.append((section, post.get("content", "")))
+    return posts
+
+
+def background_periods(week_id: str, limit: int) -> list[list[str]]:
+    """EN post texts of the `limit` periods of the same kind before week_id, oldest first."""
+    if limit <= 0:
+        return []
+    pattern = "____-__-__" if is_daily_id(week_id) else "%-kw%"
+    db = get_session_local()()
+    try:
+        period_ids = [
+            row[0]
+            for row in db.query(Week.id)
+            .filter(Week.id < week_id, Week.id.like(pattern))
+            .order_by(Week.id.desc())
+            .limit(limit)
+            .all()
+        ]
+        by_period: dict[str, list[str]] = {p: [] for p in period_ids}
+        for model in (TechPost, PrimaryMarketPost, SecondaryMarketPost, MAPost):
+            rows = db.query(model.week_id, model.content_en).filter(model.week_id.in_(period_ids)).all()
+            for period_id, content in rows:
+                by_period[period_id].append(content or "")
+    finally:
+        db.close()
+    return [by_period[p] for p in sorted(by_period) if by_period[p]]
+
+
+def _shape(key: str, spellings: Counter) -> float:
+    words = key.count(" ") + 1
+    capitalised = sum(c for s, c in spellings.items() if any(ch.isupper() for ch in s)) / sum(spellings.values())
+    return 1.0 + 0.5 * (words - 1) + 0.5 * capitalised
+
+
+def rank_phrases(posts: list[tuple[str, str]], background: list[list[str]]) -> list[dict]:
+    """
+    Score the phrases of a period's posts against a background of earlier periods.
+
+    Args:
+        posts: (section, text) of the period's posts
+        background: Post texts of each earlier period
+
+    Returns:
+        Phrases in descending score order, each a dict with key, title,
+        section, score and posts (set of post indices)
+    """
+    occurrences: dict[str, set[int]] = defaultdict(set)
+    spellings: dict[str, Counter] = defaultdict(Counter)
+    sections: dict[str, Counter] = defaultdict(Counter)
+    for i, (section, text) in enumerate(posts):
+        for key, spelling in _phrases(text).items():
+            occurrences[key].add(i)
+            spellings[key][spelling] += 1
+            sections[key][section] += 1
+
+    keys = [k for k, ids in occurrences.items() if len(ids) >= _MIN_POSTS]
+    if not keys:
+        return []
+
+    counts = np.array([len(occurrences[k]) for k in keys], dtype=np.float64)
+    rate = counts / len(posts)
+    smoothing = 1.0 / len(posts)
+
+    # Per background period: share of its posts containing each phrase
+    index = {k: j for j, k in enumerate(keys)}
+    background_rates = np.zeros((len(background), len(keys)))
+    for p, texts in enumerate(background):
+        if not texts:
+            continue
+        period_counts = Counter(k for text in texts for k in _phrases(text) if k in index)
+        for key, c in period_counts.items():
+            background_rates[p, index[key]] = c / len(texts)
+    background_rate = background_rates.mean(axis=0) if len(background) else np.zeros(len(keys))
+
+    burst = np.log((rate + smoothing) / (background_rate + smoothing))
+    shape = np.array([_shape(k, spellings[k]) for k in keys])
+    scores = counts * burst * shape
+
+    ranked = []
+    for j in np.argsort(-scores, kind="stable"):
+        if scores[j] <= 0:
+            break
+        key = keys[j]
+        ranked.append({
+            "key": key,
+            "title": spellings[key].most_common(1)[0][0],
+            "section": sections[key].most_common(1)[0][0],
+            "score": float(scores[j]),
+            "posts": occurrences[key],
+        })
+    return ranked
+
+
+def select_trends(ranked: list[dict], count: int) -> list[dict]:
+    """The best phrases, skipping ones that mostly cover the same posts as a chosen phrase."""
+    chosen: list[dict] = []
+    for phrase in ranked:
+        if len(chosen) >= count:
+            break
+        if any(
+            len(phrase["posts"] & other["posts"]) >= _OVERLAP * min(len(phrase["posts"]), len(other["posts"]))
+            for other in chosen
+        ):
+            continue
+        chosen.append(phrase)
+    return chosen
+
+
+def _polish(chosen: list[dict], posts: list[tuple[str, str]]) -> Optional[list[tuple[str, str]]]:
+    """(DE title, EN title) per trend from one free-model call, or None if it fails."""
+    from app.services.llm_processor import LLMProcessor
+
+    contexts = [posts[min(phrase["posts"])][1][:200] for phrase in chosen]
+    try:
+        titles = LLMProcessor().polish_trend_titles([p["title"] for p in chosen], contexts)
+    except Exception as e:
+        logger.warning(f"Trend title polish failed, keeping local titles: {e}")
+        return None
+    if len(titles) != len(chosen):
+        logger.warning(f"Trend title polish returned {len(titles)} of {len(chosen)} titles, keeping local titles")
+        return None
+    return titles
+
+
+def generate_trends(week_id: str, tech_data: dict, investment_data: dict) -> dict:
+    """
+    Trending topics of a period, in the structure of LLMProcessor.generate_trends.
+
+    Args:
+        week_id: Period ID (its predecessors form the background)
+        tech_data: Stage 3 tech result
+        investment_data: Stage 3 investment result
+
+    Returns:
+        {"trends": {"de": [...], "en": [...]}, "teamMembers": {...}}
+    """
+    from app.services.llm_processor import LLMProcessor
+
+    settings = get_settings()
+    result = {"trends": {"de": [], "en": []}, "teamMembers": LLMProcessor.default_team_members()}
+    posts = _section_posts(tech_data, investment_data)
+    if not posts:
+        return result
+
+    try:
+        background = background_periods(week_id, settings.trends_background_periods)
+    except Exception as e:
+        logger.warning(f"Could not load trend background for {week_id}, ranking by frequency: {e}")
+        background = []
+
+    chosen = select_trends(rank_phrases(posts, background), settings.trends_count)
+    titles = _polish(chosen, posts) if chosen and settings.trends_llm_polish else None
+    for i, phrase in enumerate(chosen):
+        category_de, category_en = CATEGORIES[phrase["section"]]
+        title_de, title_en = titles[i] if titles else (phrase["title"], phrase["title"])
+        n_posts = len(phrase["posts"])
+        result["trends"]["de"].append({"category": category_de, "title": title_de[:_TITLE_CHARS], "posts": n_posts})
+        result["trends"]["en"].append({"category": category_en, "title": title_en[:_TITLE_CHARS], "posts": n_posts})
+
+    logger.info(
+        f"Extracted {len(chosen)} trends for {week_id} from {len(posts)} posts "
+        f"against {len(background)} background periods"
+    )
+    return result
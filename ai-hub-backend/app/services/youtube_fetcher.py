@@ -4,12 +4,13 @@ YouTube video fetching service using YouTube Data API v3.
 
 import re
 import logging
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Optional
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 from app.config import get_settings
+from app.services import cassette
 
 logger = logging.getLogger(__name__)
 
@@ -74,7 +75,10 @@ def fetch_youtube_videos(
     """
     settings = get_settings()
 
-    if not settings.youtube_api_key:
+    active_cassette = cassette.get_cassette()
+    replaying = active_cassette is not None and active_cassette.mode == cassette.REPLAY
+
+    if not settings.youtube_api_key and not replaying:
         logger.warning("YouTube API key not configured")
         return []
 
@@ -119,13 +123,15 @@ def fetch_youtube_videos(
             "KI Tools deutsch",
         ]
 
-    try:
-        youtube = build("youtube", "v3", developerKey=settings.youtube_api_key)
-    except Exception as e:
-        logger.error(f"Failed to initialize YouTube client: {e}")
-        return []
+    youtube = None
+    if not replaying:  # Replayed responses need no client (or network)
+        try:
+            youtube = build("youtube", "v3", developerKey=settings.youtube_api_key)
+        except Exception as e:
+            logger.error(f"Failed to initialize YouTube client: {e}")
+            return []
 
-    published_after = (datetime.utcnow() - timedelta(days=days)).isoformat() + "Z"
+    published_after = (cassette.now(utc=True) - timedelta(days=days)).isoformat() + "Z"
     all_videos = []
     seen_ids = set()
 
@@ -133,7 +139,7 @@ def fetch_youtube_videos(
         logger.info(f"Searching YouTube for: {query}")
 
         try:
-            search_response = youtube.search().list(
+            search_params = dict(
                 q=query,
                 part="id,snippet",
                 type="video",
@@ -141,7 +147,13 @@ def fetch_youtube_videos(
                 publishedAfter=published_after,
                 maxResults=max_results,
                 relevanceLanguage="en",
-            ).execute()
+            )
+            # publishedAfter moves with the clock, so it is not part of the cassette key
+            search_response = cassette.call(
+                "youtube.search",
+                {"q": query, "maxResults": max_results},
+                lambda: youtube.search().list(**search_params).execute(),
+            )
 
             video_ids = [
                 item["id"]["videoId"]
@@ -153,10 +165,14 @@ def fetch_youtube_videos(
                 continue
 
             # Get video details (duration, view count, etc.)
-            videos_response = youtube.videos().list(
-                id=",".join(video_ids),
-                part="snippet,contentDetails,statistics",
-            ).execute()
+            videos_response = cassette.call(
+                "youtube.videos",
+                {"id": video_ids},
+                lambda: youtube.videos().list(
+                    id=",".join(video_ids),
+                    part="snippet,contentDetails,statistics",
+                ).execute(),
+            )
 
             for video in videos_response.get("items", []):
                 video_id = video["id"]
@@ -219,10 +235,30 @@ def fetch_video_transcript(video_id: str) -> Optional[str]:
         video_id: YouTube video ID
 
     Returns:
-        Transcript text or None
+        Transcript text, or None if the video has no transcript
+
+    Raises:
+        Exception: If the fetch fails for another reason (not cached by
+            transcript_cache)
+    """
+    return cassette.call("youtube.transcript", {"video_id": video_id}, lambda: _fetch_video_transcript(video_id))
+
+
+def _fetch_video_transcript(video_id: str) -> Optional[str]:
+    """
+    Transcript text, or None if the video has none.
+
+    Raises:
+        Exception: Any other failure (rate limiting, IP blocks, network
+            errors), so that it is not mistaken for a missing transcript
     """
     try:
-        from youtube_transcript_api import YouTubeTranscriptApi
+        from youtube_transcript_api import (
+            NoTranscriptFound,
+            TranscriptsDisabled,
+            VideoUnavailable,
+            YouTubeTranscriptApi,
+        )
     except ImportError:
         logger.warning("youtube-transcript-api not installed")
         return None
@@ -238,18 +274,21 @@ def fetch_video_transcript(video_id: str) -> Optional[str]:
         try:
             # Use the new API: get_transcript directly
             transcript_entries = YouTubeTranscriptApi.get_transcript(video_id, languages=languages)
-            text = " ".join(entry["text"] for entry in transcript_entries)
-            logger.debug(f"Got transcript for {video_id} ({len(text)} chars)")
-            return text[:10000]  # Limit length
-        except Exception:
+        except NoTranscriptFound:
             continue
+        except (TranscriptsDisabled, VideoUnavailable) as e:
+            logger.debug(f"No transcript available for {video_id}: {e}")
+            return None
+        text = " ".join(entry["text"] for entry in transcript_entries)
+        logger.debug(f"Got transcript for {video_id} ({len(text)} chars)")
+        return text[:10000]  # Limit length
 
     # Try to get any available transcript (auto-generated included)
     try:
         transcript_entries = YouTubeTranscriptApi.get_transcript(video_id)
-        text = " ".join(entry["text"] for entry in transcript_entries)
-        logger.debug(f"Got auto transcript for {video_id} ({len(text)} chars)")
-        return text[:10000]
-    except Exception as e:
+    except (NoTranscriptFound, TranscriptsDisabled, VideoUnavailable) as e:
         logger.debug(f"No transcript available for {video_id}: {e}")
         return None
+    text = " ".join(entry["text"] for entry in transcript_entries)
+    logger.debug(f"Got auto transcript for {video_id} ({len(text)} chars)")
+    return text[:10000]
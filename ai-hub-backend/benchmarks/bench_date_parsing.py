@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Article date parsing / period filter micro-benchmark.
+
+Builds N synthetic articles whose 'published' values mix what the pipeline
+actually sees: ISO-8601 strings written by our fetchers (most of them),
+RFC-822 feed dates, a few exotic formats and empty values, with the
+repetition real feeds have (many items share a timestamp). Then filters
+them to one week three ways and reports the wall time of each:
+
+    legacy  - dateutil per article, then a Python boundary check (previous path)
+    cold    - date_utils.filter_articles_in_period with an empty parse cache
+    warm    - the same with the parse cache already filled (later runs)
+
+No database needed; the legacy path is checked to select the same articles.
+
+Usage:
+    python -m benchmarks.bench_date_parsing
+    python -m benchmarks.bench_date_parsing --count 50000 --repeat 5
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+WEEK_START = datetime(2026, 10, 12)
+WEEK_END = WEEK_START + timedelta(days=7)
+
+
+def synthetic_articles(count: int, distinct: float, seed: int) -> list[dict]:
+    """Articles with mixed-format dates spread over three weeks around the target week."""
+    rng = random.Random(seed)
+    pool_size = max(1, int(count * distinct))
+    pool = []
+    for _ in range(pool_size):
+        dt = WEEK_START + timedelta(seconds=rng.uniform(-7 * 86400, 14 * 86400))
+        roll = rng.random()
+        if roll < 0.70:
+            pool.append(dt.isoformat())
+        elif roll < 0.90:
+            pool.append(format_datetime(dt.replace(tzinfo=timezone.utc)))
+        elif roll < 0.95:
+            pool.append(dt.strftime("%B %d, %Y %H:%M"))
+        elif roll < 0.98:
+            pool.append(dt.strftime("%Y-%m-%dT%H:%M:%S.%f") + "123Z")  # Nanoseconds
+        else:
+            pool.append("")
+    return [{"published": rng.choice(pool)} for _ in range(count)]
+
+
+def legacy_filter(articles: list[dict]) -> list[dict]:
+    from dateutil import parser as dateutil_parser
+
+    selected = []
+    for article in articles:
+        pub_date = None
+        date_str = article.get("published")
+        if date_str:
+            try:
+                pub_date = dateutil_parser.parse(date_str).replace(tzinfo=None)
+            except (ValueError, TypeError):
+                pass
+        if pub_date is None or WEEK_START <= pub_date < WEEK_END:
+            selected.append(article)
+    return selected
+
+
+def fast_filter(articles: list[dict]) -> list[dict]:
+    from app.services.date_utils import filter_articles_in_period
+
+    return filter_articles_in_period(articles, WEEK_START, WEEK_END)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark article date parsing and period filtering")
+    parser.add_argument("--count", type=int, default=50000, help="Synthetic articles")
+    parser.add_argument("--distinct", type=float, default=0.3, help="Share of distinct date strings")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per method")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    from app.services.date_utils import _parse
+
+    articles = synthetic_articles(args.count, args.distinct, args.seed)
+    expected = legacy_filter(articles)
+    if fast_filter(articles) != expected:
+        print("ERROR: fast filter selects different articles than the legacy path")
+        sys.exit(1)
+
+    def cold(items):
+        _parse.cache_clear()
+        return fast_filter(items)
+
+    methods = {"legacy": legacy_filter, "cold": cold, "warm": fast_filter}
+
+    print(f"Filtering {args.count} articles ({len(expected)} in week), {args.repeat} runs per method\n")
+    print(f"{'method':<8}{'median s':>10}{'best s':>10}{'dates/s':>12}")
+    for name, filter_fn in methods.items():
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            filter_fn(articles)
+            timings.append(time.perf_counter() - start)
+        median = statistics.median(timings)
+        print(f"{name:<8}{median:>10.3f}{min(timings):>10.3f}{args.count / median:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+End-to-end collector benchmark on synthetic load.
+
+Starts a local feed server (synthetic RSS feeds, HN/Algolia endpoints and
+article pages, see synthetic_feeds.py) and an OpenAI-compatible stub LLM
+(stub_llm.py), points the backend at both, then runs the full collection
+(stage 1 -> 4) into a scratch period of a local PostgreSQL database.
+
+Reports per run wall time and raw-article throughput, p50/p95 latency per
+pipeline stage (from the run's collection_run_metrics spans), LLM call
+latency and the process's peak RSS. With --output the summary is written as
+JSON; with --baseline a previous summary is compared and the exit code is 1
+when throughput, a stage's p95 or peak RSS regress by more than
+--max-regression, so the suite can gate releases.
+
+Requires a PostgreSQL DATABASE_URL with the schema migrated. YouTube is
+skipped (no API key); the scratch period is deleted after every run.
+
+Usage:
+    python -m benchmarks.bench_pipeline
+    python -m benchmarks.bench_pipeline --articles 20000 --duplicate-ratio 0.2 --runs 3
+    python -m benchmarks.bench_pipeline --llm-latency-ms 800 --rate-429 0.05 --malformed-rate 0.02
+    python -m benchmarks.bench_pipeline --output bench.json
+    python -m benchmarks.bench_pipeline --baseline bench.json --max-regression 0.15
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logging.basicConfig(level=logging.WARNING, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+SCRATCH_PERIOD = "2099-01-01"
+# Stage p95s below this are too noisy to gate on
+MIN_GATED_STAGE_MS = 50.0
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0-100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process (ru_maxrss is KiB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def stage_group(name: str) -> str:
+    """Collapse per-section nodes: 'process:tech' -> 'process', 'translate:tech:zh' -> 'translate'."""
+    return name.split(":", 1)[0]
+
+
+def configure_backend(feed_server, llm_base_url: str, sources_file: str) -> None:
+    """Point settings at the local servers (before the app modules read them)."""
+    import yaml
+
+    with open(sources_file, "w") as f:
+        yaml.safe_dump(feed_server.sources(), f)
+    os.environ.update({
+        "OPENROUTER_BASE_URL": llm_base_url,
+        "OPENROUTER_API_KEY": os.environ.get("OPENROUTER_API_KEY") or "benchmark",
+        "HN_API_BASE_URL": f"{feed_server.base_url}/hn",
+        "SOURCES_FILE": sources_file,
+        "YOUTUBE_API_KEY": "",
+        "SEEN_INDEX_ENABLED": "false",  # Keep runs independent of each other
+    })
+
+    from app.config import get_settings
+
+    get_settings.cache_clear()
+
+
+def run_once(db) -> dict:
+    """One full collection into the scratch period; returns its measurements."""
+    from sqlalchemy import func
+    from app.models import CollectionRunMetric, RawArticle
+    from app.services.collector import run_collection, delete_period
+    from app.services.metrics import STAGE, LLM_CALL
+
+    delete_period(db, SCRATCH_PERIOD)
+    start = time.perf_counter()
+    run_id = run_collection(db, SCRATCH_PERIOD)
+    wall = time.perf_counter() - start
+
+    raw_articles = db.query(func.count(RawArticle.id)).filter(RawArticle.week_id == SCRATCH_PERIOD).scalar()
+    spans = db.query(
+        CollectionRunMetric.kind, CollectionRunMetric.name, CollectionRunMetric.duration_ms,
+    ).filter(
+        CollectionRunMetric.run_id == run_id,
+        CollectionRunMetric.kind.in_([STAGE, LLM_CALL]),
+    ).all()
+
+    stages: dict[str, list[float]] = {}
+    llm_calls: list[float] = []
+    for kind, name, duration_ms in spans:
+        if kind == STAGE:
+            stages.setdefault(stage_group(name), []).append(duration_ms)
+        else:
+            llm_calls.append(duration_ms)
+    return {"wall": wall, "raw_articles": raw_articles, "stages": stages, "llm_calls": llm_calls}
+
+
+def summarize(runs: list[dict], config: dict, llm_stats: dict) -> dict:
+    walls = [r["wall"] for r in runs]
+    throughputs = [r["raw_articles"] / r["wall"] for r in runs if r["wall"] > 0]
+    stage_samples: dict[str, list[float]] = {}
+    for r in runs:
+        for name, values in r["stages"].items():
+            stage_samples.setdefault(name, []).extend(values)
+    llm_calls = [d for r in runs for d in r["llm_calls"]]
+
+    return {
+        "config": config,
+        "runs": len(runs),
+        "raw_articles": runs[-1]["raw_articles"] if runs else 0,
+        "wall_p50_s": round(percentile(walls, 50), 3),
+        "wall_p95_s": round(percentile(walls, 95), 3),
+        "throughput_articles_per_s": round(percentile(throughputs, 50), 1),
+        "stages": {
+            name: {
+                "count": len(values),
+                "p50_ms": round(percentile(values, 50), 1),
+                "p95_ms": round(percentile(values, 95), 1),
+            }
+            for name, values in sorted(stage_samples.items())
+        },
+        "llm_calls": {
+            "count": len(llm_calls),
+            "p50_ms": round(percentile(llm_calls, 50), 1),
+            "p95_ms": round(percentile(llm_calls, 95), 1),
+        },
+        "llm_stub": llm_stats,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def print_report(summary: dict) -> None:
+    print(f"\nRuns: {summary['runs']}  raw articles/run: {summary['raw_articles']}")
+    print(f"Wall p50/p95: {summary['wall_p50_s']:.2f}s / {summary['wall_p95_s']:.2f}s  "
+          f"throughput: {summary['throughput_articles_per_s']:.1f} articles/s  "
+          f"peak RSS: {summary['peak_rss_mb']:.0f} MiB\n")
+    print(f"{'stage':<12}{'n':>6}{'p50 ms':>12}{'p95 ms':>12}")
+    for name, stats in summary["stages"].items():
+        print(f"{name:<12}{stats['count']:>6}{stats['p50_ms']:>12.1f}{stats['p95_ms']:>12.1f}")
+    llm = summary["llm_calls"]
+    print(f"{'llm call':<12}{llm['count']:>6}{llm['p50_ms']:>12.1f}{llm['p95_ms']:>12.1f}")
+    print(f"\nStub LLM: {summary['llm_stub']}")
+
+
+def compare(summary: dict, baseline: dict, max_regression: float) -> list[str]:
+    """Regressions beyond the allowed fraction, as human-readable lines."""
+    failures = []
+    base_tp = baseline.get("throughput_articles_per_s") or 0
+    if base_tp and summary["throughput_articles_per_s"] < base_tp * (1 - max_regression):
+        failures.append(f"throughput {summary['throughput_articles_per_s']:.1f} < baseline {base_tp:.1f} articles/s")
+
+    for name, stats in summary["stages"].items():
+        base = baseline.get("stages", {}).get(name)
+        if not base or base["p95_ms"] < MIN_GATED_STAGE_MS:
+            continue
+        if stats["p95_ms"] > base["p95_ms"] * (1 + max_regression):
+            failures.append(f"stage '{name}' p95 {stats['p95_ms']:.0f}ms > baseline {base['p95_ms']:.0f}ms")
+
+    base_rss = baseline.get("peak_rss_mb") or 0
+    if base_rss and summary["peak_rss_mb"] > base_rss * (1 + max_regression):
+        failures.append(f"peak RSS {summary['peak_rss_mb']:.0f} MiB > baseline {base_rss:.0f} MiB")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the collector on synthetic load")
+    parser.add_argument("--articles", type=int, default=1000, help="Synthetic feed entries (1k-50k)")
+    parser.add_argument("--feeds", type=int, default=40, help="Number of synthetic RSS feeds")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.1, help="Share of cross-feed duplicate entries")
+    parser.add_argument("--days-spread", type=float, default=10.0, help="Spread of publication dates (days back)")
+    parser.add_argument("--hn-stories", type=int, default=60, help="Stories served by the HN endpoint")
+    parser.add_argument("--feed-latency-ms", type=float, default=20.0, help="Latency per feed server request")
+    parser.add_argument("--llm-latency-ms", type=float, default=300.0, help="Mean stub LLM latency")
+    parser.add_argument("--llm-jitter-ms", type=float, default=100.0, help="Stub LLM latency jitter (+/-)")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Share of LLM requests answered with 429")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="Share of truncated LLM JSON bodies")
+    parser.add_argument("--runs", type=int, default=3, help="Full pipeline runs")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=str, default=None, help="Write the summary JSON here")
+    parser.add_argument("--baseline", type=str, default=None, help="Compare against a previous summary JSON")
+    parser.add_argument("--max-regression", type=float, default=0.15, help="Allowed regression vs. baseline")
+    args = parser.parse_args()
+
+    from benchmarks.stub_llm import StubLLMServer
+    from benchmarks.synthetic_feeds import SyntheticFeedServer, generate_corpus
+
+    feed_server = SyntheticFeedServer(latency_ms=args.feed_latency_ms)
+    feed_server.load(generate_corpus(
+        feed_server.base_url,
+        articles=args.articles,
+        feeds=args.feeds,
+        duplicate_ratio=args.duplicate_ratio,
+        days_spread=args.days_spread,
+        hn_stories=args.hn_stories,
+        seed=args.seed,
+    ))
+    llm_server = StubLLMServer(
+        latency_ms=args.llm_latency_ms,
+        jitter_ms=args.llm_jitter_ms,
+        rate_429=args.rate_429,
+        malformed_rate=args.malformed_rate,
+        seed=args.seed,
+    )
+    feed_server.start()
+    llm_server.start()
+
+    corpus = feed_server.corpus
+    print(f"Synthetic corpus: {corpus.unique_articles} unique articles, {corpus.duplicate_entries} duplicate "
+          f"entries in {len(corpus.feeds)} feeds, {len(corpus.hn_stories)} HN stories")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        configure_backend(feed_server, llm_server.base_url, os.path.join(tmp, "sources.yaml"))
+
+        from app.database import get_session_local
+        from app.services.collector import delete_period
+
+        db = get_session_local()()
+        if db.get_bind().dialect.name != "postgresql":
+            logger.error("This benchmark needs a PostgreSQL DATABASE_URL")
+            sys.exit(1)
+
+        runs = []
+        try:
+            for i in range(args.runs):
+                result = run_once(db)
+                runs.append(result)
+                print(f"run {i + 1}/{args.runs}: {result['wall']:.2f}s, {result['raw_articles']} raw articles")
+        finally:
+            delete_period(db, SCRATCH_PERIOD)
+            db.close()
+            feed_server.stop()
+            llm_server.stop()
+
+    config = {k: v for k, v in vars(args).items() if k not in ("output", "baseline", "max_regression")}
+    summary = summarize(runs, config, dict(llm_server.stats))
+    print_report(summary)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(summary, indent=2))
+        print(f"\nSummary written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        failures = compare(summary, baseline, args.max_regression)
+        if failures:
+            print(f"\nREGRESSION (> {args.max_regression:.0%} vs. {args.baseline}):")
+            for line in failures:
+                print(f"  - {line}")
+            sys.exit(1)
+        print(f"\nNo regression beyond {args.max_regression:.0%} vs. {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
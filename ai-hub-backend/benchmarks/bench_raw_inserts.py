@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Raw article insert benchmark.
+
+Inserts N synthetic articles into a scratch period three ways and reports
+the wall time of each:
+
+    orm   - one RawArticle object per item (the previous stage 1 path)
+    bulk  - one executemany INSERT via raw_store.bulk_insert_raw_articles
+    copy  - PostgreSQL COPY (the path used for batches >= RAW_COPY_THRESHOLD)
+
+Requires a PostgreSQL DATABASE_URL with the schema migrated. The scratch
+period is deleted after every run.
+
+Usage:
+    python -m benchmarks.bench_raw_inserts
+    python -m benchmarks.bench_raw_inserts --count 5000 --repeat 3
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logging.basicConfig(level=logging.WARNING, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+SCRATCH_PERIOD = "2099-01-01"
+
+
+def synthetic_articles(count: int) -> list[dict]:
+    """Articles shaped like fetcher output."""
+    from app.services.article_utils import content_hash
+
+    articles = []
+    for i in range(count):
+        link = f"https://example.com/news/{i}"
+        title = f"Synthetic AI article number {i} about model releases"
+        articles.append({
+            "source": "Benchmark",
+            "title": title,
+            "link": link,
+            "summary": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 5,
+            "published": "2099-01-01T12:00:00",
+            "original_section": "tech",
+            "points": i % 500,
+            "comments": i % 80,
+            "hn_url": f"https://news.ycombinator.com/item?id={i}",
+            "content_hash": content_hash(link, title),
+        })
+    return articles
+
+
+def insert_orm(db, articles: list[dict]) -> None:
+    from app.models import RawArticle
+    from app.services.raw_store import raw_article_values
+
+    for article in articles:
+        db.add(RawArticle(**raw_article_values(SCRATCH_PERIOD, article)))
+    db.commit()
+
+
+def insert_bulk(db, articles: list[dict]) -> None:
+    from sqlalchemy import insert
+    from app.models import RawArticle
+    from app.services.raw_store import raw_article_values
+
+    db.execute(insert(RawArticle), [raw_article_values(SCRATCH_PERIOD, a) for a in articles])
+    db.commit()
+
+
+def insert_copy(db, articles: list[dict]) -> None:
+    from app.services.raw_store import raw_article_values, _copy_raw_articles
+
+    _copy_raw_articles(db, [raw_article_values(SCRATCH_PERIOD, a) for a in articles])
+    db.commit()
+
+
+METHODS = {"orm": insert_orm, "bulk": insert_bulk, "copy": insert_copy}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark raw article inserts")
+    parser.add_argument("--count", type=int, default=5000, help="Synthetic articles per run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per method")
+    parser.add_argument(
+        "--methods",
+        default="orm,bulk,copy",
+        help="Comma-separated subset of: orm, bulk, copy",
+    )
+    args = parser.parse_args()
+
+    from app.database import get_session_local
+    from app.services.collector import ensure_week, clear_raw_data, delete_period
+
+    db = get_session_local()()
+    if db.get_bind().dialect.name != "postgresql":
+        logger.error("This benchmark needs a PostgreSQL DATABASE_URL")
+        sys.exit(1)
+
+    articles = synthetic_articles(args.count)
+    ensure_week(db, SCRATCH_PERIOD)
+
+    print(f"Inserting {args.count} synthetic articles, {args.repeat} runs per method\n")
+    print(f"{'method':<8}{'median s':>10}{'best s':>10}{'rows/s':>12}")
+    try:
+        for name in args.methods.split(","):
+            insert_fn = METHODS[name.strip()]
+            timings = []
+            for _ in range(args.repeat):
+                clear_raw_data(db, SCRATCH_PERIOD)
+                start = time.perf_counter()
+                insert_fn(db, articles)
+                timings.append(time.perf_counter() - start)
+            median = statistics.median(timings)
+            print(f"{name:<8}{median:>10.3f}{min(timings):>10.3f}{args.count / median:>12.0f}")
+    finally:
+        delete_period(db, SCRATCH_PERIOD)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Raw text storage benchmark.
+
+Codec mode (default, no database): compresses N synthetic feed summaries
+(HTML with the boilerplate real feeds repeat) and reports total size and
+encode/decode time for
+
+    raw       - UTF-8 text as stored before (TOAST may still pglz it)
+    zstd      - one zstd frame per value
+    zstd+dict - one frame per value with a dictionary trained on the rest
+
+Database mode (--period): reports pg_total_relation_size of the raw tables
+and the wall time of the stage 3 input load (_load_section_inputs) for a
+period. Run it once before and once after migrating to 0017 to compare.
+
+Usage:
+    python -m benchmarks.bench_raw_storage
+    python -m benchmarks.bench_raw_storage --count 20000
+    python -m benchmarks.bench_raw_storage --period 2026-10-12 --repeat 5
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+WORDS = (
+    "model agents inference open source release benchmark training GPU startup funding "
+    "regulation reasoning multimodal developers API pricing latency context window"
+).split()
+
+
+def synthetic_summaries(count: int, seed: int) -> list[str]:
+    """Feed summaries: a few site templates wrapped around varying prose."""
+    rng = random.Random(seed)
+    templates = [
+        '<div class="entry-content"><p>{body}</p><p>The post <a href="https://example{n}.com/{slug}" '
+        'rel="nofollow">{title}</a> appeared first on <a href="https://example{n}.com">Example {n}</a>.</p></div>',
+        '<p><img src="https://cdn.example{n}.com/uploads/{slug}.jpg" alt="" /></p><p>{body}</p>'
+        '<p><a href="https://news.example{n}.com/{slug}">Continue reading</a></p>',
+        "{body}\n\nComments: https://news.ycombinator.com/item?id={n}{slug}",
+    ]
+    summaries = []
+    for i in range(count):
+        title = " ".join(rng.choices(WORDS, k=6))
+        body = " ".join(rng.choices(WORDS, k=rng.randint(40, 400)))
+        summaries.append(rng.choice(templates).format(body=body, title=title, n=i % 7, slug=f"post-{i}"))
+    return summaries
+
+
+def bench_codecs(count: int, repeat: int, seed: int, level: int) -> None:
+    import zstandard as zstd
+
+    summaries = [s.encode("utf-8") for s in synthetic_summaries(count, seed)]
+    train, test = summaries[: count // 5], summaries[count // 5:]
+    dictionary = zstd.train_dictionary(65536, train)
+
+    codecs = {
+        "raw": (lambda b: b, lambda b: b),
+        "zstd": (zstd.ZstdCompressor(level=level).compress, zstd.ZstdDecompressor().decompress),
+        "zstd+dict": (
+            zstd.ZstdCompressor(level=level, dict_data=dictionary).compress,
+            zstd.ZstdDecompressor(dict_data=dictionary).decompress,
+        ),
+    }
+
+    raw_size = sum(len(b) for b in test)
+    print(f"{len(test)} summaries, {raw_size / 1024 / 1024:.1f} MiB raw, {repeat} runs per codec\n")
+    print(f"{'codec':<11}{'MiB':>8}{'ratio':>8}{'encode s':>10}{'decode s':>10}")
+    for name, (encode, decode) in codecs.items():
+        encode_times, decode_times = [], []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            frames = [encode(b) for b in test]
+            encode_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            decoded = [decode(f) for f in frames]
+            decode_times.append(time.perf_counter() - start)
+        if decoded != test:
+            print(f"ERROR: {name} does not round-trip")
+            sys.exit(1)
+        size = sum(len(f) for f in frames)
+        print(
+            f"{name:<11}{size / 1024 / 1024:>8.2f}{raw_size / size:>8.2f}"
+            f"{statistics.median(encode_times):>10.3f}{statistics.median(decode_times):>10.3f}"
+        )
+
+
+def bench_database(period_id: str, repeat: int) -> None:
+    from app.database import get_session_local
+    from app.services.collector import _load_section_inputs
+    from app.services.compression import table_sizes
+
+    db = get_session_local()()
+    try:
+        for table, size in table_sizes(db, ["raw_articles", "raw_videos"]).items():
+            print(f"{table:<14}{size / 1024 / 1024:>10.2f} MiB")
+
+        timings = []
+        for _ in range(repeat):
+            db.expunge_all()  # Measure loading, not the identity map
+            start = time.perf_counter()
+            inputs = _load_section_inputs(db, period_id)
+            timings.append(time.perf_counter() - start)
+        counts = ", ".join(f"{k}={len(v)}" for k, v in inputs.items())
+        print(f"\nstage 3 load ({counts}): median {statistics.median(timings):.3f}s, best {min(timings):.3f}s")
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark raw text compression")
+    parser.add_argument("--count", type=int, default=10000, help="Synthetic summaries (codec mode)")
+    parser.add_argument("--level", type=int, default=9, help="zstd level (codec mode)")
+    parser.add_argument("--period", type=str, default=None, help="Measure table sizes and stage 3 load for a period")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.period:
+        bench_database(args.period, args.repeat)
+    else:
+        bench_codecs(args.count, args.repeat, args.seed, args.level)
+
+
+if __name__ == "__main__":
+    main()
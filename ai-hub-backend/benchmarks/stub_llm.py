@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+OpenAI-compatible stub server for benchmarks.
+
+Answers POST .../chat/completions with deterministic, well-formed output for
+every prompt the pipeline sends (classification, section processing,
+trends, translations), so stages 2-4 do realistic work without a real
+model. Latency, the share of 429 responses and the share of malformed
+(truncated) JSON bodies are configurable to exercise the retry and
+fallback paths.
+
+Point the backend at it with OPENROUTER_BASE_URL=http://127.0.0.1:<port>/v1.
+
+Usage:
+    python -m benchmarks.stub_llm --port 8089 --latency-ms 300 --rate-429 0.05
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def _score(text: str) -> float:
+    """Stable pseudo-random value in [0, 1) derived from text."""
+    return int(hashlib.md5(text.encode("utf-8")).hexdigest()[:8], 16) / 0xFFFFFFFF
+
+
+def _count(prompt: str, pattern: str, default: int) -> int:
+    match = re.search(pattern, prompt)
+    return int(match.group(1)) if match else default
+
+
+def _parse_articles(prompt: str) -> list[dict]:
+    """Articles from the 'Source/Title/Link' blocks used by section prompts."""
+    return [
+        {"source": m.group(1), "title": m.group(2), "link": m.group(3)}
+        for m in re.finditer(r"Source: (.*)\nTitle: (.*)\nLink: (.*)\n", prompt)
+    ]
+
+
+def _author(source: str) -> dict:
+    handle = re.sub(r"[^a-z0-9]", "", source.lower())[:15] or "source"
+    return {"name": source, "handle": f"@{handle}", "avatar": source[:2].upper(), "verified": True}
+
+
+def _post(i: int, article: dict, lang: str, **fields) -> dict:
+    post = {
+        "id": i + 1,
+        "author": _author(article["source"]),
+        "content": f"[{lang}] Summary of {article['title']}. It matters for teams adopting AI.",
+        "timestamp": time.strftime("%Y-%m-%d"),
+        "sourceUrl": article["link"],
+        "metrics": {"comments": 0, "retweets": 0, "likes": 0, "views": "0"},
+    }
+    post.update(fields)
+    return post
+
+
+def _bilingual(articles: list[dict], count: int, make) -> dict:
+    chosen = articles[:count]
+    return {lang: [make(i, a, lang) for i, a in enumerate(chosen)] for lang in ("de", "en")}
+
+
+def respond_classify(prompt: str):
+    entries = re.finditer(r"\[(\d+)\] Source: .*? \(hint: (\w+)\)\n\s+Title: (.*)", prompt)
+    result = []
+    for m in entries:
+        index, hint, title = int(m.group(1)), m.group(2), m.group(3)
+        section = hint if hint in ("tech", "investment", "tips") else "tech"
+        result.append({
+            "index": index,
+            "section": section,
+            "relevance": round(0.3 + 0.7 * _score(title), 2),
+            "duplicate_of": None,
+        })
+    return result
+
+
+def respond_translate(prompt: str):
+    lang = re.search(r"from English to (.+?)\.", prompt)
+    lang = lang.group(1) if lang else "?"
+    match = re.search(r"Input:\n(.*)\n\nOutput the translated", prompt, re.S)
+    items = json.loads(match.group(1)) if match else []
+
+    def translate(value):
+        if isinstance(value, str) and not value.startswith("http"):
+            return f"({lang}) {value}"
+        if isinstance(value, list):
+            return [translate(v) for v in value]
+        return value
+
+    return [{k: (v if k == "_idx" else translate(v)) for k, v in item.items()} for item in items]
+
+
+def respond_tech(prompt: str):
+    count = _count(prompt, r"select EXACTLY (\d+)", 10)
+    return _bilingual(_parse_articles(prompt), count, lambda i, a, lang: _post(
+        i, a, lang,
+        tags=["AI", "Models", "Research"],
+        category="KI-Modelle" if lang == "de" else "AI Models",
+        iconType=["Brain", "Server", "Zap", "Cpu"][i % 4],
+        impact=["critical", "high", "medium", "low"][i % 4],
+        source=a["source"],
+    ))
+
+
+def respond_videos(prompt: str):
+    count = _count(prompt, r"select the (\d+) most", 2)
+    ids = re.findall(r"VideoID: (\S+)\nTitle: (.*)", prompt)[:count]
+    return {
+        lang: [
+            {"video_id": vid, "title": title, "summary": f"[{lang}] Why this video is worth watching.",
+             "category": "Tutorial"}
+            for vid, title in ids
+        ]
+        for lang in ("de", "en")
+    }
+
+
+def _deal(i: int, a: dict, lang: str) -> dict:
+    return _post(
+        i, a, lang,
+        acquirer=f"Acquirer {i + 1}", target=a["title"][:40],
+        dealValue="$1.2B", dealType="Akquisition" if lang == "de" else "Acquisition",
+        industry="AI Enterprise",
+    )
+
+
+def respond_investment(prompt: str):
+    count = _count(prompt, r"Include EXACTLY (\d+) items", 5)
+    articles = _parse_articles(prompt)
+    return {
+        "primaryMarket": _bilingual(articles, count, lambda i, a, lang: _post(
+            i, a, lang, company=a["title"][:40], amount="$50M", round="Series B",
+            roundCategory="Series B", investors=["Fund A", "Fund B"], valuation="$500M",
+        )),
+        "secondaryMarket": _bilingual(articles[count:], count, lambda i, a, lang: _post(
+            i, a, lang, ticker=["NVDA", "MSFT", "GOOGL", "META", "AMD"][i % 5],
+        )),
+        "ma": _bilingual(articles[2 * count:], count, _deal),
+    }
+
+
+def respond_ma(prompt: str):
+    count = _count(prompt, r"extract up to (\d+) notable", 5)
+    return {"ma": _bilingual(_parse_articles(prompt), count, _deal)}
+
+
+def respond_tips(prompt: str):
+    count = _count(prompt, r"Extract (\d+) AI tips", 5)
+    lines = re.findall(r"^\d+\. \[(.*?)\] (.*?) - ", prompt, re.M)
+    articles = [{"source": s, "title": t, "link": f"https://tips.example/{i}"} for i, (s, t) in enumerate(lines)]
+    return _bilingual(articles, count, lambda i, a, lang: {
+        "id": i + 1,
+        "content": f"[{lang}] {a['title']}",
+        "tip": f"[{lang}] Try this: {a['title'][:60]}",
+        "category": "Produktivität" if lang == "de" else "Productivity",
+        "platform": "Reddit",
+        "sourceUrl": a["link"],
+    })
+
+
+def respond_trends(prompt: str):
+    return {
+        "trends": {
+            "de": [{"category": "KI · Trend", "title": f"Trend {i + 1}"} for i in range(10)],
+            "en": [{"category": "AI · Trending", "title": f"Trend {i + 1}"} for i in range(10)],
+        }
+    }
+
+
+# First matching marker decides the response shape
+RESPONDERS = [
+    ("You are an AI news classifier", respond_classify),
+    ("Translate the following JSON items", respond_translate),
+    ("You are a tech news editor", respond_tech),
+    ("You are a video content curator", respond_videos),
+    ("AI investment newsletter", respond_investment),
+    ("ONLY include AI-related M&A deals", respond_ma),
+    ("AI tips from these articles", respond_tips),
+    ("trending topics", respond_trends),
+]
+
+
+def completion_content(prompt: str) -> str:
+    for marker, responder in RESPONDERS:
+        if marker in prompt:
+            return json.dumps(responder(prompt), ensure_ascii=False)
+    return json.dumps({"de": [], "en": []})
+
+
+class StubLLMServer:
+    """
+    Threaded stub server; start() returns the base URL (ending in /v1).
+
+    Args:
+        latency_ms: Mean response latency
+        jitter_ms: Uniform +/- jitter around the mean
+        rate_429: Share of requests answered with 429 Too Many Requests
+        malformed_rate: Share of completions whose JSON is truncated
+        seed: RNG seed (fault injection is reproducible for a fixed request order)
+    """
+
+    def __init__(
+        self,
+        port: int = 0,
+        latency_ms: float = 200.0,
+        jitter_ms: float = 50.0,
+        rate_429: float = 0.0,
+        malformed_rate: float = 0.0,
+        seed: int = 1,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_429 = rate_429
+        self.malformed_rate = malformed_rate
+        self.stats = {"requests": 0, "rate_limited": 0, "malformed": 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}/v1"
+
+    def _draw(self) -> tuple[float, bool, bool]:
+        with self._lock:
+            self.stats["requests"] += 1
+            delay = max(0.0, self.latency_ms + self._rng.uniform(-self.jitter_ms, self.jitter_ms))
+            limited = self._rng.random() < self.rate_429
+            malformed = not limited and self._rng.random() < self.malformed_rate
+            if limited:
+                self.stats["rate_limited"] += 1
+            if malformed:
+                self.stats["malformed"] += 1
+        return delay, limited, malformed
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _send(self, status: int, payload: dict) -> None:
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                if status == 429:
+                    self.send_header("retry-after-ms", "50")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                if not self.path.endswith("/chat/completions"):
+                    self._send(404, {"error": {"message": "not found"}})
+                    return
+
+                delay, limited, malformed = stub._draw()
+                time.sleep(delay / 1000)
+                if limited:
+                    self._send(429, {"error": {"message": "Rate limit exceeded (stub)", "code": 429}})
+                    return
+
+                prompt = "\n".join(m.get("content", "") for m in request.get("messages", []))
+                content = completion_content(prompt)
+                if malformed:
+                    content = content[: max(1, len(content) // 2)]
+                self._send(200, {
+                    "id": f"stub-{stub.stats['requests']}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": request.get("model", "stub"),
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }],
+                    "usage": {
+                        "prompt_tokens": len(prompt) // 4,
+                        "completion_tokens": len(content) // 4,
+                        "total_tokens": (len(prompt) + len(content)) // 4,
+                    },
+                })
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> str:
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI-compatible stub LLM server")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--jitter-ms", type=float, default=50.0)
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="Share of truncated JSON completions")
+    args = parser.parse_args()
+
+    server = StubLLMServer(args.port, args.latency_ms, args.jitter_ms, args.rate_429, args.malformed_rate)
+    print(f"Stub LLM listening on {server.start()}  (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+        print(f"Stats: {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
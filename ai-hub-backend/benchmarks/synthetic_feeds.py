@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Synthetic news sources served from a local HTTP server.
+
+Generates N articles spread over RSS feeds in the tech/investment/tips
+sections, with a configurable share of cross-feed duplicates (same link in
+several feeds) and a configurable publication date spread (articles older
+than the fetch window exercise the cutoff filter). The same server answers
+the Hacker News Algolia endpoints and article pages, so the whole of stage 1
+runs against localhost.
+
+Routes:
+    /feeds/<n>.xml                  RSS 2.0 feed
+    /hn/search_by_date?query=...    Algolia search (point HN_API_BASE_URL at /hn)
+    /hn/items/<id>                  Algolia item with comments
+    /articles/<id>                  HTML article page (HN link enhancement)
+"""
+
+import json
+import random
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+SECTIONS = ["tech", "investment", "tips"]
+SECTION_WEIGHTS = [0.6, 0.25, 0.15]
+TOPICS = {
+    "tech": ["model release", "GPU cluster", "open-weights LLM", "agent framework", "benchmark result"],
+    "investment": ["Series B round", "seed funding", "IPO filing", "acquisition talks", "AI chip stock"],
+    "tips": ["prompt pattern", "spreadsheet workflow", "meeting notes trick", "image prompt", "coding assistant"],
+}
+
+
+@dataclass
+class SyntheticCorpus:
+    feeds: list[dict]  # {"section", "name", "items": [article, ...]}
+    hn_stories: list[dict]
+    unique_articles: int
+    duplicate_entries: int
+
+
+def generate_corpus(
+    base_url: str,
+    articles: int = 1000,
+    feeds: int = 40,
+    duplicate_ratio: float = 0.1,
+    days_spread: float = 10.0,
+    hn_stories: int = 60,
+    seed: int = 42,
+) -> SyntheticCorpus:
+    """
+    Build a deterministic corpus.
+
+    Args:
+        base_url: Server URL the article links point to
+        articles: Total feed entries (including duplicates)
+        feeds: Number of RSS feeds
+        duplicate_ratio: Share of entries that repeat an earlier article's link in another feed
+        days_spread: Publication dates are spread uniformly over this many days back
+        hn_stories: Stories returned by the HN search endpoint
+        seed: RNG seed
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    feed_list = [
+        {"section": section, "name": f"Synthetic {section.title()} {i + 1}", "items": []}
+        for i, section in enumerate(rng.choices(SECTIONS, SECTION_WEIGHTS, k=feeds))
+    ]
+    by_section = {s: [f for f in feed_list if f["section"] == s] or feed_list for s in SECTIONS}
+
+    originals: list[dict] = []
+    duplicates = 0
+    for i in range(articles):
+        if originals and rng.random() < duplicate_ratio:
+            article = rng.choice(originals)
+            duplicates += 1
+        else:
+            section = rng.choices(SECTIONS, SECTION_WEIGHTS)[0]
+            topic = rng.choice(TOPICS[section])
+            article = {
+                "id": len(originals),
+                "section": section,
+                "title": f"{topic.capitalize()} #{len(originals)}: what it means for AI teams",
+                "link": f"{base_url}/articles/{len(originals)}",
+                "summary": f"Synthetic coverage of a {topic}. " * rng.randint(3, 12),
+                "published": now - timedelta(seconds=rng.uniform(0, days_spread * 86400)),
+            }
+            originals.append(article)
+        rng.choice(by_section[article["section"]])["items"].append(article)
+
+    stories = [
+        {
+            "objectID": str(100000 + i),
+            "title": f"Show HN: synthetic AI project {i}",
+            "url": f"{base_url}/articles/hn-{i}",
+            "points": rng.randint(50, 900),
+            "num_comments": rng.randint(0, 300),
+            "created_at_i": int((now - timedelta(seconds=rng.uniform(0, 20 * 3600))).timestamp()),
+        }
+        for i in range(hn_stories)
+    ]
+    return SyntheticCorpus(feed_list, stories, len(originals), duplicates)
+
+
+def render_rss(feed: dict) -> bytes:
+    items = "".join(
+        "<item>"
+        f"<title>{escape(a['title'])}</title>"
+        f"<link>{escape(a['link'])}</link>"
+        f"<description>{escape(a['summary'])}</description>"
+        f"<pubDate>{format_datetime(a['published'])}</pubDate>"
+        "</item>"
+        for a in feed["items"]
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>{escape(feed['name'])}</title><link>http://localhost/</link>"
+        f"<description>Synthetic feed</description>{items}</channel></rss>"
+    ).encode("utf-8")
+
+
+class SyntheticFeedServer:
+    """Serve a SyntheticCorpus over HTTP on 127.0.0.1 (latency_ms is added per request)."""
+
+    def __init__(self, port: int = 0, latency_ms: float = 0.0):
+        self.latency_ms = latency_ms
+        self.corpus: SyntheticCorpus | None = None
+        self.requests = 0
+        self._rendered: dict[int, bytes] = {}
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._server.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def load(self, corpus: SyntheticCorpus) -> None:
+        self.corpus = corpus
+        self._rendered = {i: render_rss(feed) for i, feed in enumerate(corpus.feeds)}
+
+    def sources(self) -> dict[str, list[dict]]:
+        """Sources config (as in sources.yaml) pointing at this server."""
+        sources: dict[str, list[dict]] = {s: [] for s in SECTIONS}
+        for i, feed in enumerate(self.corpus.feeds):
+            sources[feed["section"]].append({"url": f"{self.base_url}/feeds/{i}.xml", "name": feed["name"]})
+        return sources
+
+    def _route(self, path: str, query: dict) -> tuple[int, str, bytes]:
+        if path.startswith("/feeds/"):
+            index = int(path.rsplit("/", 1)[-1].split(".")[0])
+            if index in self._rendered:
+                return 200, "application/rss+xml", self._rendered[index]
+        elif path == "/hn/search_by_date":
+            # Each query sees a stable subset of the stories
+            term = query.get("query", [""])[0]
+            limit = int(query.get("hitsPerPage", ["20"])[0])
+            hits = [
+                s for s in self.corpus.hn_stories
+                if zlib.crc32(f"{term}:{s['objectID']}".encode("utf-8")) % 3 == 0
+            ][:limit]
+            return 200, "application/json", json.dumps({"hits": hits}).encode("utf-8")
+        elif path.startswith("/hn/items/"):
+            children = [{"text": f"Synthetic comment {i} with enough text to pass the length filter."}
+                        for i in range(5)]
+            return 200, "application/json", json.dumps({"children": children}).encode("utf-8")
+        elif path.startswith("/articles/"):
+            body = "".join(f"<p>Paragraph {i} of the synthetic article body.</p>" for i in range(20))
+            return 200, "text/html", f"<html><body><article>{body}</article></body></html>".encode("utf-8")
+        return 404, "text/plain", b"not found"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server.requests += 1
+                if server.latency_ms:
+                    time.sleep(server.latency_ms / 1000)
+                url = urlparse(self.path)
+                status, content_type, body = server._route(url.path, parse_qs(url.query))
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> str:
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.base_url
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Backfill a range of daily periods.
+
+Runs the full collection for every day in the range, several days at a
+time. All LLM calls of all days share one concurrency/rate budget, and
+progress with an ETA is logged while the backfill runs.
+
+Usage:
+    python -m scripts.backfill_periods --start 2026-09-01 --end 2026-09-30
+    python -m scripts.backfill_periods --start 2026-09-01 --end 2026-09-30 --parallel 4 --llm-concurrency 10
+    python -m scripts.backfill_periods --start 2026-09-01 --end 2026-09-30 --llm-rpm 120 --skip-completed
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s %(levelname)s: %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S',
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent multi-period backfill")
+    parser.add_argument("--start", type=str, required=True, help="First date (YYYY-MM-DD)")
+    parser.add_argument("--end", type=str, required=True, help="Last date, inclusive (YYYY-MM-DD)")
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=None,
+        help="Periods collected at the same time (default: BACKFILL_PARALLEL_PERIODS)",
+    )
+    parser.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=None,
+        help="Max concurrent LLM requests across all periods (default: BACKFILL_LLM_MAX_CONCURRENT, 0 = unlimited)",
+    )
+    parser.add_argument(
+        "--llm-rpm",
+        type=float,
+        default=None,
+        help="Max LLM requests per minute across all periods (default: BACKFILL_LLM_REQUESTS_PER_MINUTE, 0 = unlimited)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Keep existing raw data and only fetch/classify/process new items",
+    )
+    parser.add_argument(
+        "--skip-completed",
+        action="store_true",
+        help="Skip days that already have a completed collection run",
+    )
+    parser.add_argument(
+        "--no-rollup",
+        action="store_true",
+        help="Skip rebuilding the touched weeks from their days afterwards",
+    )
+    args = parser.parse_args()
+
+    from app.services.backfill import day_ids_between, run_backfill
+
+    try:
+        period_ids = day_ids_between(args.start, args.end)
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(2)
+
+    summary = run_backfill(
+        period_ids,
+        parallel=args.parallel,
+        incremental=args.incremental,
+        skip_completed=args.skip_completed,
+        rollup=False if args.no_rollup else None,
+        llm_max_concurrent=args.llm_concurrency,
+        llm_requests_per_minute=args.llm_rpm,
+    )
+    for period_id, error in sorted(summary["failed"].items()):
+        logger.error(f"  {period_id}: {error}")
+    if summary["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Manage zstd compression of raw text fields.
+
+Trains a new shared dictionary from the stored raw summaries and video
+descriptions (new rows use it right away, old rows keep decoding with the
+dictionary they were written with), optionally re-encodes all rows with it,
+and reports the raw table sizes.
+
+Usage:
+    python -m scripts.compress_raw --stats
+    python -m scripts.compress_raw --train
+    python -m scripts.compress_raw --train --rewrite
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s %(levelname)s: %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S',
+)
+logger = logging.getLogger(__name__)
+
+RAW_TABLES = ["raw_articles", "raw_videos"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Raw text compression maintenance")
+    parser.add_argument("--train", action="store_true", help="Train and store a new dictionary")
+    parser.add_argument("--samples", type=int, default=5000, help="Summaries sampled for training")
+    parser.add_argument("--rewrite", action="store_true", help="Re-encode all rows with the newest dictionary")
+    parser.add_argument("--stats", action="store_true", help="Print raw table sizes")
+    args = parser.parse_args()
+
+    from app.database import get_session_local
+    from app.services import compression
+
+    db = get_session_local()()
+    try:
+        if args.stats:
+            for table, size in compression.table_sizes(db, RAW_TABLES).items():
+                logger.info(f"{table}: {size / 1024 / 1024:.1f} MiB")
+        if args.train:
+            samples = compression.sample_texts(db, args.samples)
+            try:
+                dictionary = compression.train_dictionary(samples)
+            except ValueError as e:
+                logger.warning(f"{e}; keeping the current dictionary (or none)")
+            else:
+                compression.save_dictionary(db, dictionary, len(samples))
+        if args.rewrite:
+            logger.info(f"Re-encoded {compression.recompress(db)} rows")
+            if args.stats:
+                for table, size in compression.table_sizes(db, RAW_TABLES).items():
+                    logger.info(f"{table} after rewrite: {size / 1024 / 1024:.1f} MiB (before VACUUM)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,11 +8,17 @@ Usage:
     python -m scripts.daily_collect
     python -m scripts.daily_collect --date 2026-02-07
     python -m scripts.daily_collect --week 2026-kw06  # backward compat
+    python -m scripts.daily_collect --incremental     # re-collect, only new items
+    python -m scripts.daily_collect --resume          # continue the last failed run
+    python -m scripts.daily_collect --no-llm-cache    # re-run every section prompt
+    python -m scripts.daily_collect --record-cassette cassettes/day.json.gz
+    python -m scripts.daily_collect --replay-cassette cassettes/day.json.gz --replay-latency-scale 1
 """
 
 import argparse
 import logging
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -39,6 +45,64 @@ def main():
         default=None,
         help="Week ID (YYYY-kwWW) for backward compatibility",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Keep existing raw data and only fetch/classify/process new items",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume the latest unfinished run for the period from its last checkpoint",
+    )
+    parser.add_argument(
+        "--run-id",
+        type=int,
+        default=None,
+        help="Resume a specific collection run (implies --resume)",
+    )
+    cassette_group = parser.add_mutually_exclusive_group()
+    cassette_group.add_argument(
+        "--record-cassette",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Record all outbound HTTP/LLM calls into a compressed cassette file",
+    )
+    cassette_group.add_argument(
+        "--replay-cassette",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Serve outbound HTTP/LLM calls from a cassette (no network; implies --no-newsletter)",
+    )
+    parser.add_argument(
+        "--replay-latency-ms",
+        type=float,
+        default=0.0,
+        help="Fixed latency injected into every replayed call",
+    )
+    parser.add_argument(
+        "--replay-latency-scale",
+        type=float,
+        default=0.0,
+        help="Inject this fraction of each call's recorded latency on replay (1 = as recorded)",
+    )
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Ignore cached section results and call the LLM for every section",
+    )
+    parser.add_argument(
+        "--rollup",
+        action="store_true",
+        help="Rebuild the parent week from its days after collection (default: WEEKLY_ROLLUP_AFTER_DAILY)",
+    )
+    parser.add_argument(
+        "--no-rollup",
+        action="store_true",
+        help="Skip rebuilding the parent week's rollup after collection",
+    )
     parser.add_argument(
         "--no-newsletter",
         action="store_true",
@@ -56,15 +120,51 @@ def main():
         from app.database import get_session_local
 
         SessionLocal = get_session_local()
+    from app.config import get_settings
     from app.services.collector import run_collection
+    from app.services.cassette import use_cassette, RECORD, REPLAY
+    from app.services.llm_cache import bypass
+
+    if args.record_cassette:
+        cassette_ctx = use_cassette(args.record_cassette, RECORD)
+    elif args.replay_cassette:
+        cassette_ctx = use_cassette(
+            args.replay_cassette,
+            REPLAY,
+            latency_ms=args.replay_latency_ms,
+            latency_scale=args.replay_latency_scale,
+        )
+    else:
+        cassette_ctx = nullcontext()
 
     db = SessionLocal()
     try:
-        run_collection(db, period_id)  # defaults to current_day_id() if None
+        with cassette_ctx, bypass(args.no_llm_cache):
+            run_id = run_collection(  # defaults to current_day_id() if None
+                db,
+                period_id,
+                incremental=args.incremental,
+                resume=args.resume,
+                run_id=args.run_id,
+            )
         logger.info("Collection completed successfully!")
 
+        # Refresh the parent week from its days (no fetches or LLM calls)
+        if not args.no_rollup and (args.rollup or get_settings().weekly_rollup_after_daily):
+            from app.models import CollectionRun
+            from app.services.period_utils import day_to_week_id, is_daily_id
+            from app.services.rollup import build_week_rollup
+
+            # The period actually collected (a resumed run keeps its own period)
+            day_id = db.get(CollectionRun, run_id).period_id
+            if is_daily_id(day_id):
+                try:
+                    build_week_rollup(db, day_to_week_id(day_id))
+                except Exception as e:
+                    logger.warning(f"Weekly rollup failed (non-fatal): {e}")
+
         # Send newsletter after successful collection
-        if not args.no_newsletter:
+        if not args.no_newsletter and not args.replay_cassette:
             try:
                 from app.services.newsletter_sender import send_newsletter
 
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Retrain the local article classifier.
+
+Trains on the LLM labels stored in raw_articles and writes the artifact to
+LOCAL_CLASSIFIER_PATH (default models/article_classifier.npz). Holdout
+accuracy and the share/accuracy of predictions above the confidence
+threshold are printed and stored with the model. Commit the artifact to
+ship it; running workers pick it up on restart.
+
+Usage:
+    python -m scripts.train_classifier
+    python -m scripts.train_classifier --max-samples 20000 --threshold 0.9
+    python -m scripts.train_classifier --output /tmp/candidate.npz --dry-run
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s %(levelname)s: %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S',
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the local article classifier")
+    parser.add_argument("--max-samples", type=int, default=50000, help="Newest labelled articles to use")
+    parser.add_argument("--epochs", type=int, default=6)
+    parser.add_argument("--threshold", type=float, default=None, help="Confidence threshold to evaluate")
+    parser.add_argument("--output", type=str, default=None, help="Artifact path (default: LOCAL_CLASSIFIER_PATH)")
+    parser.add_argument("--dry-run", action="store_true", help="Only print the holdout metrics")
+    args = parser.parse_args()
+
+    from app.database import get_session_local
+    from app.services.local_classifier import default_path, load_training_data, train
+
+    db = get_session_local()()
+    try:
+        samples = load_training_data(db, args.max_samples)
+    finally:
+        db.close()
+    logger.info(f"Loaded {len(samples)} labelled articles")
+
+    try:
+        model = train(samples, epochs=args.epochs, threshold=args.threshold)
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(2)
+    print(json.dumps(model.metadata, indent=2))
+
+    if not args.dry_run:
+        path = args.output or default_path()
+        model.save(path)
+        logger.info(f"Saved classifier to {path}")
+
+
+if __name__ == "__main__":
+    main()
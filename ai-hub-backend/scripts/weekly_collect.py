@@ -8,6 +8,7 @@ For daily collection (used by Railway cron), see daily_collect.py.
 Usage:
     python -m scripts.weekly_collect
     python -m scripts.weekly_collect --week 2025-kw05
+    python -m scripts.weekly_collect --week 2026-kw42 --rollup   # build from daily periods
 """
 
 import argparse
@@ -20,6 +21,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.database import SessionLocal
 from app.services.collector import run_collection
+from app.services.period_utils import current_week_id
+from app.services.rollup import build_week_rollup
 
 logging.basicConfig(
     level=logging.INFO,
@@ -37,12 +40,28 @@ def main():
         default=None,
         help="Week ID (e.g., 2025-kw05). Default: current week",
     )
+    parser.add_argument(
+        "--rollup",
+        action="store_true",
+        help="Build the week from its daily periods instead of collecting (no fetches)",
+    )
+    parser.add_argument(
+        "--llm-trends",
+        action="store_true",
+        help="With --rollup: generate trends with one LLM call instead of merging daily trends",
+    )
     args = parser.parse_args()
 
-    logger.info("Starting collection (weekly mode)...")
-
     db = SessionLocal()
     try:
+        if args.rollup:
+            week_id = args.week or current_week_id()
+            logger.info(f"Building weekly rollup for {week_id}...")
+            counts = build_week_rollup(db, week_id, llm_trends=args.llm_trends or None)
+            logger.info(f"Rollup completed: {counts}")
+            return
+
+        logger.info("Starting collection (weekly mode)...")
         run_collection(db, args.week)
         logger.info("Collection completed successfully!")
     except Exception as e:
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Pipeline job worker.
+
+Claims jobs from the pipeline_jobs queue (see app/services/job_queue.py)
+and runs them. Start as many workers as needed, in separate containers or
+processes; they coordinate through the database only.
+
+Usage:
+    python -m scripts.worker
+    python -m scripts.worker --types fetch,newsletter   # dedicated light worker
+    python -m scripts.worker --types process,translate,backfill
+    python -m scripts.worker --burst                    # drain the queue, then exit
+    python -m scripts.worker --enqueue fetch --date 2026-10-19 --then-process
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s %(levelname)s [%(threadName)s]: %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S',
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pipeline job worker")
+    parser.add_argument(
+        "--types",
+        type=str,
+        default=None,
+        help="Comma-separated job types to claim (default: all)",
+    )
+    parser.add_argument("--worker-id", type=str, default=None, help="Worker identifier (default: host:pid)")
+    parser.add_argument("--burst", action="store_true", help="Exit when no job is due instead of polling")
+    parser.add_argument("--max-jobs", type=int, default=None, help="Exit after this many jobs")
+    parser.add_argument(
+        "--enqueue",
+        type=str,
+        default=None,
+        metavar="JOB_TYPE",
+        help="Queue one job and exit instead of running the worker",
+    )
+    parser.add_argument("--date", type=str, default=None, help="Period ID for --enqueue (default: today)")
+    parser.add_argument("--then-process", action="store_true", help="With --enqueue fetch: queue processing afterwards")
+    parser.add_argument("--priority", type=int, default=0, help="Priority for --enqueue (higher runs first)")
+    args = parser.parse_args()
+
+    from app.services.job_queue import HANDLERS, enqueue, run_worker
+
+    if args.enqueue:
+        from app.database import get_session_local
+
+        if args.enqueue == "backfill":
+            logger.error("Queue backfills via POST /api/admin/queue?job_type=backfill&start=...&end=...")
+            sys.exit(2)
+        payload = {"period_id": args.date}
+        if args.enqueue == "fetch":
+            payload["then_process"] = args.then_process
+        db = get_session_local()()
+        try:
+            job = enqueue(db, args.enqueue, payload, priority=args.priority)
+        except ValueError as e:
+            logger.error(str(e))
+            sys.exit(2)
+        finally:
+            db.close()
+        logger.info(f"Queued job {job.id}")
+        return
+
+    job_types = [t.strip() for t in args.types.split(",")] if args.types else None
+    unknown = [t for t in job_types or [] if t not in HANDLERS]
+    if unknown:
+        logger.error(f"Unknown job types: {', '.join(unknown)} (expected {', '.join(HANDLERS)})")
+        sys.exit(2)
+
+    try:
+        run_worker(args.worker_id, job_types, burst=args.burst, max_jobs=args.max_jobs)
+    except KeyboardInterrupt:
+        logger.info("Worker interrupted")
+
+
+if __name__ == "__main__":
+    main()